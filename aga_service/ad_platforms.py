@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Ad Platform Adapters for the Autonomous Growth Agent
+Wraps per-platform campaign execution so it can run sequentially or concurrently
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+
+def mock_platform_results(budget: float) -> Dict:
+    """Mock campaign metrics for a platform given its budget allocation"""
+    return {
+        "budget_spent": budget * 0.85,  # 85% utilization
+        "impressions": int(budget * 100),
+        "clicks": int(budget * 5),
+        "signups": int(budget * 0.3),
+        "revenue": budget * 0.2,
+        "ctr": 5.0,
+        "conversion_rate": 6.0
+    }
+
+
+class PlatformError(Exception):
+    """Raised when an ad platform fails to run a campaign"""
+
+
+class PlatformAdapter:
+    """Base adapter - subclasses call a real (or simulated) ad platform API"""
+
+    def run_ad(self, ad: Dict) -> Dict:
+        """
+        Run a single ad copy on its platform and return its metrics.
+        An ad may carry an idempotency_key; adapters for real platforms pass it
+        as the request token so a retried job doesn't buy the same ads twice.
+        """
+        raise NotImplementedError
+
+
+class MockPlatformAdapter(PlatformAdapter):
+    """Instant in-process adapter returning the mock campaign metrics"""
+
+    def run_ad(self, ad: Dict) -> Dict:
+        return mock_platform_results(ad["budget_allocation"])
+
+
+class LocalPlatformAdapter(PlatformAdapter):
+    """
+    Local stand-in for a remote ad API with configurable latency.
+    Used to benchmark sequential vs concurrent execution offline. Each platform
+    draws from its own seeded RNG, so results do not depend on thread scheduling.
+    """
+
+    def __init__(self, latency: float = 0.2, jitter: float = 0.0,
+                 failure_rate: float = 0.0, latencies: Optional[Dict[str, float]] = None,
+                 seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.latencies = latencies or {}
+        self.seed = seed
+        self._rngs = {}  # platform -> random.Random
+        self._lock = threading.Lock()
+
+    def _rng(self, platform: str) -> random.Random:
+        with self._lock:
+            rng = self._rngs.get(platform)
+            if rng is None:
+                rng = self._rngs[platform] = random.Random(None if self.seed is None else f"{self.seed}:{platform}")
+            return rng
+
+    def run_ad(self, ad: Dict) -> Dict:
+        platform = ad["platform"]
+        rng = self._rng(platform)
+        delay = self.latencies.get(platform, self.latency)
+        if self.jitter:
+            delay += rng.uniform(0, self.jitter)
+        time.sleep(delay)
+
+        if self.failure_rate and rng.random() < self.failure_rate:
+            raise PlatformError(f"{platform} API returned an error")
+
+        return mock_platform_results(ad["budget_allocation"])
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Ad Copy Variant Engine for the Autonomous Growth Agent
+Expands every customer segment x pain point x benefit x template combination per
+platform, lazily and in priority order, rendering through a shared interned cache
+so copies repeated across a portfolio are built once and their text stored once.
+"""
+
+import heapq
+import itertools
+import string
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Template placeholder -> target_data list it is drawn from
+LIST_FIELDS = {
+    "segment": "customer_segments",
+    "pain_point": "pain_points",
+    "benefit": "key_benefits"
+}
+
+# Per platform, templates in priority order; the first reproduces the original single copy
+PLATFORM_TEMPLATES = {
+    "Google Search": [
+        ("Transform Your {target_market} with AI", "{value_proposition}. Save 40+ hours of work.", "Start Free Trial"),
+        ("{benefit} with AI", "{value_proposition} for {segment}.", "Start Free Trial"),
+        ("Tired of {pain_point}?", "{value_proposition}. {benefit}.", "Try It Free")
+    ],
+    "Facebook": [
+        ("Stop Struggling with {pain_point}", "Join 1000+ {segment} who found success.", "Learn More"),
+        ("{segment}: {benefit}", "Say goodbye to {pain_point}. {value_proposition}.", "Learn More"),
+        ("Built for {segment}", "{benefit}. Join 1000+ {segment} who found success.", "Sign Up")
+    ],
+    "LinkedIn": [
+        ("Professional {value_proposition} for {target_market}",
+         "Get investor-ready documents in 24 hours. Trusted by 500+ businesses.", "Get Started"),
+        ("{benefit} for {segment}", "{value_proposition}. Trusted by 500+ businesses.", "Get Started"),
+        ("Solve {pain_point}", "{value_proposition} for {target_market}.", "Book a Demo")
+    ]
+}
+
+# Share of the campaign budget each platform's copy receives
+PLATFORM_BUDGET_SHARES = {"Google Search": 0.40, "Facebook": 0.35, "LinkedIn": 0.25}
+
+Copy = Tuple[str, str, str, str]  # (platform, headline, description, cta)
+
+# Recently yielded copies remembered to drop repeats; bounds a stream's memory however long it runs
+DEDUPE_WINDOW = 4096
+
+
+def template_fields(template: Tuple[str, str, str]) -> Tuple[str, ...]:
+    """List placeholders a template uses, in LIST_FIELDS order"""
+    used = {name for part in template for _, name, _, _ in string.Formatter().parse(part) if name}
+    return tuple(name for name in LIST_FIELDS if name in used)
+
+
+# Only the list fields a template uses are varied, so no combination renders the same copy twice
+TEMPLATE_FIELDS = {platform: [template_fields(t) for t in templates]
+                   for platform, templates in PLATFORM_TEMPLATES.items()}
+
+
+def index_tuples(limits: List[int], total: int) -> Iterator[Tuple[int, ...]]:
+    """Every index tuple with i < limit per position and indices summing to total, in lexicographic order"""
+    if not limits:
+        if total == 0:
+            yield ()
+        return
+    *head, last = limits
+    for prefix in itertools.product(*(range(min(limit, total + 1)) for limit in head)):
+        rest = total - sum(prefix)
+        if 0 <= rest < last:
+            yield (*prefix, rest)
+
+
+class VariantCache:
+    """
+    Bounded LRU of rendered copies keyed by platform, template and field values.
+    Rendered strings are interned, so text repeated across a portfolio's copies
+    is stored once.
+    """
+
+    def __init__(self, max_entries: int = 65536):
+        self.max_entries = max_entries
+        self._rendered = OrderedDict()  # (platform, template index, values) -> Copy
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, platform: str, template_index: int, values: Tuple[Tuple[str, str], ...]) -> Copy:
+        key = (platform, template_index, values)
+        with self._lock:
+            copy = self._rendered.get(key)
+            if copy is not None:
+                self._rendered.move_to_end(key)
+                self.hits += 1
+                return copy
+
+        fields = dict(values)
+        copy = (platform, *(sys.intern(part.format_map(fields))
+                            for part in PLATFORM_TEMPLATES[platform][template_index]))
+
+        with self._lock:
+            self.misses += 1
+            self._rendered[key] = copy
+            while len(self._rendered) > self.max_entries:
+                self._rendered.popitem(last=False)
+        return copy
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rendered.clear()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._rendered),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+_shared_cache = VariantCache()
+
+
+def get_variant_cache() -> VariantCache:
+    """Process-wide cache shared by every GrowthAgent"""
+    return _shared_cache
+
+
+def _platform_variants(platform: str, rank: int, target_data: Dict,
+                       cache: VariantCache) -> Iterator[Tuple[int, int, Copy]]:
+    """(priority, platform rank, copy) in ascending priority: template index plus field indices"""
+    scalars = (("target_market", target_data.get("target_market", "")),
+               ("value_proposition", target_data.get("value_proposition", "")))
+    # Repeated list values would render the same copy twice, so each value is used once
+    lists = {name: list(dict.fromkeys(target_data.get(source) or [])) for name, source in LIST_FIELDS.items()}
+    templates = [(t, fields, [len(lists[name]) for name in fields])
+                 for t, fields in enumerate(TEMPLATE_FIELDS[platform])]
+    templates = [entry for entry in templates if all(entry[2])]
+    if not templates:
+        return
+
+    max_priority = max(t + sum(limit - 1 for limit in limits) for t, _, limits in templates)
+    for priority in range(max_priority + 1):
+        for t, fields, limits in templates:
+            for indices in index_tuples(limits, priority - t) if priority >= t else ():
+                values = scalars + tuple((name, lists[name][i]) for name, i in zip(fields, indices))
+                yield priority, rank, cache.render(platform, t, values)
+
+
+def iter_ad_variants(target_data: Dict, platforms: Optional[Iterable[str]] = None,
+                     cache: Optional[VariantCache] = None) -> Iterator[Dict]:
+    """
+    Lazily yield distinct ad copies for every platform, highest priority first.
+    Earlier segments, pain points, benefits and templates rank higher; ties go to
+    platforms in PLATFORM_TEMPLATES order. Repeated list values are used once; two
+    different templates rendering the same text is only caught within the last
+    DEDUPE_WINDOW copies, so memory stays flat for streams of any length.
+    """
+    cache = cache or get_variant_cache()
+    streams = [_platform_variants(platform, rank, target_data, cache)
+               for rank, platform in enumerate(platforms or PLATFORM_TEMPLATES)]
+    recent = OrderedDict()
+    # Streams never share a rank, so merge orders by (priority, rank) without comparing copies
+    for priority, _, copy in heapq.merge(*streams):
+        if copy in recent:
+            recent.move_to_end(copy)
+            continue
+        recent[copy] = None
+        if len(recent) > DEDUPE_WINDOW:
+            recent.popitem(last=False)
+        platform, headline, description, cta = copy
+        yield {
+            "platform": platform,
+            "headline": headline,
+            "description": description,
+            "cta": cta,
+            "priority": priority
+        }
+
+
+def iter_portfolio_variants(targets: Iterable[Tuple[str, Dict]], per_project: Optional[int] = None,
+                            cache: Optional[VariantCache] = None) -> Iterator[Dict]:
+    """Variants for many (project_id, target_data) pairs, at most per_project each"""
+    cache = cache or get_variant_cache()
+    for project_id, target_data in targets:
+        for count, variant in enumerate(iter_ad_variants(target_data, cache=cache)):
+            if per_project is not None and count >= per_project:
+                break
+            yield {"project_id": project_id, **variant}
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Adaptive Budget Allocation for the Autonomous Growth Agent
+Thompson sampling over per-platform signup rates, with a hard budget limit
+"""
+
+import math
+import random
+from typing import Dict, List, Optional, Sequence
+
+
+class BudgetExceededError(ValueError):
+    """Raised when recorded spend would exceed the campaign budget limit"""
+
+
+class ThompsonBudgetAllocator:
+    """
+    Reallocates the remaining budget between platforms as signups come in.
+
+    Each platform's signups-per-dollar rate has a Gamma posterior
+    (prior_signups / prior_spend plus observed signups / spend). Remaining
+    budget is split by how often each platform wins a posterior draw, with a
+    min_share floor so no platform stops being explored entirely.
+    """
+
+    def __init__(self, platforms: Sequence[str], budget_limit: float,
+                 prior_signups: float = 1.0, prior_spend: float = 10.0,
+                 min_share: float = 0.05, samples: int = 200, seed: Optional[int] = None):
+        self.platforms = list(platforms)
+        self.budget_limit = budget_limit
+        self.min_share = min_share
+        self.samples = samples
+        self.signups = {platform: prior_signups for platform in self.platforms}
+        self.spend = {platform: prior_spend for platform in self.platforms}
+        self.spent = 0.0
+        self._rng = random.Random(seed)
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.budget_limit - self.spent)
+
+    def record(self, platform: str, spend: float, signups: int) -> None:
+        """Record observed spend and signups for a platform"""
+        if self.spent + spend > self.budget_limit + 1e-9:
+            raise BudgetExceededError(
+                f"Spending ${spend:.2f} on {platform} would exceed the ${self.budget_limit:.2f} budget limit"
+            )
+        self.spent += spend
+        self.spend[platform] += spend
+        self.signups[platform] += signups
+
+    def win_rates(self) -> Dict[str, float]:
+        """Share of posterior draws in which each platform has the best signup rate"""
+        gammavariate = self._rng.gammavariate
+        shapes = [self.signups[platform] for platform in self.platforms]
+        scales = [1.0 / self.spend[platform] for platform in self.platforms]
+        wins = [0] * len(self.platforms)
+
+        for _ in range(self.samples):
+            draws = [gammavariate(shape, scale) for shape, scale in zip(shapes, scales)]
+            wins[draws.index(max(draws))] += 1
+
+        return {platform: wins[i] / self.samples for i, platform in enumerate(self.platforms)}
+
+    def allocate(self, amount: Optional[float] = None) -> Dict[str, float]:
+        """Split amount (default: all remaining budget) between platforms, never exceeding the limit"""
+        amount = self.remaining if amount is None else min(amount, self.remaining)
+        if amount <= 0:
+            return {platform: 0.0 for platform in self.platforms}
+
+        floor = min(self.min_share, 1.0 / len(self.platforms))
+        free = 1.0 - floor * len(self.platforms)
+        rates = self.win_rates()
+
+        # Round down to cents so the allocation can never exceed the budget
+        return {
+            platform: math.floor(amount * (floor + free * rates[platform]) * 100) / 100
+            for platform in self.platforms
+        }
+
+
+def _poisson(rng: random.Random, lam: float) -> int:
+    """Poisson draw (Knuth for small means, normal approximation for large ones)"""
+    if lam <= 0:
+        return 0
+    if lam > 30:
+        return max(0, int(round(rng.gauss(lam, math.sqrt(lam)))))
+    threshold = math.exp(-lam)
+    k, p = 0, rng.random()
+    while p > threshold:
+        k += 1
+        p *= rng.random()
+    return k
+
+
+def simulate_allocation(true_rates: Dict[str, float], budget_limit: float = 100.0, days: int = 7,
+                        fixed_split: Optional[Dict[str, float]] = None, adaptive: bool = True,
+                        seed: Optional[int] = None) -> Dict:
+    """
+    Offline simulation of one campaign: the budget is spent evenly over the days,
+    split either by fixed_split or by the Thompson allocator. Signups are Poisson
+    draws from each platform's hidden signups-per-dollar rate.
+    """
+    rng = random.Random(seed)
+    platforms = list(true_rates)
+    fixed_split = fixed_split or {platform: 1.0 / len(platforms) for platform in platforms}
+    total_split = sum(fixed_split.values())
+
+    allocator = ThompsonBudgetAllocator(platforms, budget_limit, seed=rng.randrange(2 ** 32))
+    signups = 0
+
+    for day in range(days):
+        daily_budget = allocator.remaining / (days - day)
+        if adaptive:
+            allocation = allocator.allocate(daily_budget)
+        else:
+            allocation = {
+                platform: math.floor(daily_budget * fixed_split[platform] / total_split * 100) / 100
+                for platform in platforms
+            }
+
+        for platform, spend in allocation.items():
+            day_signups = _poisson(rng, spend * true_rates[platform])
+            allocator.record(platform, spend, day_signups)
+            signups += day_signups
+
+    return {
+        "spent": allocator.spent,
+        "signups": signups,
+        "cost_per_signup": allocator.spent / signups if signups else float("inf")
+    }
+
+
+def compare_strategies(true_rates: Dict[str, float], fixed_split: Dict[str, float],
+                       runs: int = 200, budget_limit: float = 100.0, days: int = 7,
+                       seed: int = 0) -> Dict[str, Dict]:
+    """Reproducible fixed-split vs adaptive comparison over many simulated campaigns"""
+    summary = {}
+    for name, adaptive in (("fixed", False), ("adaptive", True)):
+        results: List[Dict] = [
+            simulate_allocation(true_rates, budget_limit, days, fixed_split, adaptive, seed=seed + run)
+            for run in range(runs)
+        ]
+        spent = sum(result["spent"] for result in results)
+        signups = sum(result["signups"] for result in results)
+        summary[name] = {
+            "spent": spent,
+            "signups": signups,
+            "cost_per_signup": spent / signups if signups else float("inf")
+        }
+    return summary
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Columnar Campaign Archive for the Autonomous Growth Agent
+Flattens launch_campaign results into two memory-mapped column tables, one row per
+campaign platform and one row per monitoring day, so portfolio analytics (CTR by
+platform, cost per signup, signup curves) run as vectorized scans over millions of rows.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+from typing import Dict, Iterable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from column_store import ColumnTable, group_sum, np
+
+# Column name -> array typecode; project, campaign_id and platform are dictionary-encoded
+PLATFORM_COLUMNS = {
+    'project_id': 'I',
+    'campaign_id': 'I',
+    'platform': 'I',
+    'spend': 'd',
+    'impressions': 'q',
+    'clicks': 'q',
+    'signups': 'q',
+    'revenue': 'd'
+}
+DAILY_COLUMNS = {
+    'project_id': 'I',
+    'campaign_id': 'I',
+    'day': 'i',
+    'signups': 'q',
+    'revenue': 'd',
+    'traffic': 'q'
+}
+
+
+def platform_rows(results: Dict) -> Iterable[Dict]:
+    """One row per platform that ran in a launch_campaign result"""
+    campaign = results.get('campaign_results') or {}
+    for platform, platform_results in (campaign.get('platforms') or {}).items():
+        yield {
+            'project_id': results.get('project_id', ''),
+            'campaign_id': results.get('campaign_id', ''),
+            'platform': platform,
+            'spend': platform_results.get('budget_spent', 0.0),
+            'impressions': platform_results.get('impressions', 0),
+            'clicks': platform_results.get('clicks', 0),
+            'signups': platform_results.get('signups', 0),
+            'revenue': platform_results.get('revenue', 0.0)
+        }
+
+
+def daily_rows(results: Dict) -> Iterable[Dict]:
+    """One row per monitored day in a launch_campaign result"""
+    monitoring = results.get('monitoring_results') or {}
+    for metrics in monitoring.get('daily_metrics') or []:
+        yield {
+            'project_id': results.get('project_id', ''),
+            'campaign_id': results.get('campaign_id', ''),
+            **metrics
+        }
+
+
+class CampaignArchive:
+    """<directory>/platforms and <directory>/daily column tables"""
+
+    def __init__(self, directory: str = "campaign_archive"):
+        self.directory = directory
+        self.platforms = ColumnTable(os.path.join(directory, 'platforms'), PLATFORM_COLUMNS,
+                                     dictionaries=('project_id', 'campaign_id', 'platform'))
+        self.daily = ColumnTable(os.path.join(directory, 'daily'), DAILY_COLUMNS,
+                                 dictionaries=('project_id', 'campaign_id'))
+
+    def add_many(self, results_list: Iterable[Dict]) -> Dict[str, int]:
+        """
+        Archive launch_campaign results; returns rows written per table and campaigns skipped.
+        Archiving is idempotent: a table skips campaigns already in its campaign_id
+        dictionary, so re-adding a results file (or finishing an interrupted add) never
+        double counts.
+        """
+        platforms, daily = [], []
+        seen_platforms = set(self.platforms.codes['campaign_id'])
+        seen_daily = set(self.daily.codes['campaign_id'])
+        skipped = 0
+        for results in results_list:
+            campaign_id = results.get('campaign_id', '')
+            if campaign_id in seen_platforms and campaign_id in seen_daily:
+                skipped += 1
+                continue
+            if campaign_id not in seen_platforms:
+                seen_platforms.add(campaign_id)
+                platforms.extend(platform_rows(results))
+            if campaign_id not in seen_daily:
+                seen_daily.add(campaign_id)
+                daily.extend(daily_rows(results))
+        return {'platforms': self.platforms.append_rows(platforms), 'daily': self.daily.append_rows(daily),
+                'skipped': skipped}
+
+    def add(self, results: Dict) -> Dict[str, int]:
+        return self.add_many([results])
+
+    # Aggregates --------------------------------------------------------------
+
+    def platform_totals(self) -> Dict[str, Dict]:
+        """Spend, impressions, clicks, signups and revenue summed per platform"""
+        table = self.platforms
+        names = table.dictionaries['platform']
+        codes = table.column('platform')
+        sums = {column: group_sum(codes, table.column(column), len(names))
+                for column in ('spend', 'impressions', 'clicks', 'signups', 'revenue')}
+        return {name: {column: totals[i] for column, totals in sums.items()} for i, name in enumerate(names)}
+
+    def ctr_by_platform(self) -> Dict[str, float]:
+        """Click-through rate in percent per platform"""
+        return {platform: round(t['clicks'] / t['impressions'] * 100, 2) if t['impressions'] else 0.0
+                for platform, t in self.platform_totals().items()}
+
+    def cost_per_signup(self) -> Dict[str, float]:
+        """Spend per signup per platform"""
+        return {platform: round(t['spend'] / t['signups'], 2) if t['signups'] else 0.0
+                for platform, t in self.platform_totals().items()}
+
+    def signup_curve(self) -> List[Dict]:
+        """Total and mean signups per monitoring day across every archived campaign"""
+        days = self.daily.column('day')
+        if not len(days):
+            return []
+        horizon = int(days.max() if np is not None else max(days)) + 1
+        signups = group_sum(days, self.daily.column('signups'), horizon)
+        campaigns = group_sum(days, [1] * len(days) if np is None else np.ones(len(days)), horizon)
+        return [{'day': day, 'campaigns': int(campaigns[day]), 'signups': int(signups[day]),
+                 'mean_signups': round(signups[day] / campaigns[day], 2)}
+                for day in range(horizon) if campaigns[day]]
+
+    def summary(self) -> Dict:
+        totals = self.platform_totals()
+        spend = sum(t['spend'] for t in totals.values())
+        signups = sum(t['signups'] for t in totals.values())
+        return {
+            'campaigns': len(self.platforms.dictionaries['campaign_id']),
+            'platform_rows': len(self.platforms),
+            'daily_rows': len(self.daily),
+            'total_spend': round(spend, 2),
+            'total_signups': int(signups),
+            'cost_per_signup': round(spend / signups, 2) if signups else 0.0
+        }
+
+
+def iter_result_files(inputs: List[str]) -> Iterable[Dict]:
+    """launch_campaign results from AGAResults JSON files, directories or globs"""
+    for item in inputs:
+        paths = glob.glob(os.path.join(item, '*.json')) if os.path.isdir(item) else glob.glob(item)
+        for path in sorted(paths):
+            with open(path, 'r') as f:
+                results = json.load(f)
+            if 'campaign_results' in results:
+                yield results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive campaign results as columns and report on them")
+    parser.add_argument('archive', help="Archive directory")
+    parser.add_argument('--add', nargs='+', default=None, help="AGAResults JSON files, directories or globs to archive")
+    args = parser.parse_args()
+
+    archive = CampaignArchive(args.archive)
+    if args.add:
+        written = archive.add_many(iter_result_files(args.add))
+        print(f"📦 Archived {written['platforms']} platform rows and {written['daily']} daily rows "
+              f"({written['skipped']} campaigns already archived)")
+
+    summary = archive.summary()
+    print(f"📊 {summary['campaigns']:,} campaigns: ${summary['total_spend']:,.2f} spent, "
+          f"{summary['total_signups']:,} signups, ${summary['cost_per_signup']} per signup")
+    cost = archive.cost_per_signup()
+    for platform, ctr in archive.ctr_by_platform().items():
+        print(f"   📱 {platform}: {ctr}% CTR, ${cost[platform]} per signup")
+    for point in archive.signup_curve():
+        print(f"   Day {point['day']}: {point['mean_signups']} mean signups over {point['campaigns']} campaigns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Campaign Lifecycle Scheduler
+Runs each campaign phase as a resumable job on the durable job queue:
+target extraction -> ad generation -> execution -> one job per monitoring day -> persistence
+"""
+
+import argparse
+import threading
+import time
+from typing import Dict, Optional
+
+from growth_agent import GrowthAgent, new_campaign_id
+from job_queue import JobQueue
+
+PHASES = ("extract_targets", "generate_ads", "execute", "monitor_day", "persist")
+
+
+class CampaignScheduler:
+    """
+    Worker pool that drives campaigns through their phases.
+
+    Each job's payload carries the campaign context built up so far, and a
+    phase's result is committed together with the next phase's job, so after
+    a crash workers resume from the last completed phase. Workers renew the
+    leases of the jobs they hold, so another scheduler on the same queue only
+    requeues jobs whose worker died. Ad spend is checkpointed, and every ad
+    carries an idempotency_key, so a retried phase never buys the same ads twice.
+    """
+
+    def __init__(self, agent: Optional[GrowthAgent] = None, queue: Optional[JobQueue] = None,
+                 workers: int = 4, duration_days: int = 7, day_interval: float = 0.0,
+                 poll_interval: float = 0.05, max_attempts: int = 3):
+        self.agent = agent or GrowthAgent()
+        self.queue = queue or JobQueue()
+        self.workers = workers
+        self.duration_days = duration_days
+        self.day_interval = day_interval  # seconds between monitoring days (86400 in production)
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self._stop = threading.Event()
+        self._threads = []
+        self._active = set()  # ids of jobs this scheduler's workers are running
+        self._active_lock = threading.Lock()
+        self.handlers = {
+            "extract_targets": self._extract_targets,
+            "generate_ads": self._generate_ads,
+            "execute": self._execute,
+            "monitor_day": self._monitor_day,
+            "persist": self._persist
+        }
+
+    def submit(self, project_id: str, options: Optional[Dict] = None,
+               idempotency_key: Optional[str] = None) -> str:
+        """
+        Queue a campaign launch and return its campaign_id.
+        Submitting the same idempotency_key twice (e.g. a redelivered webhook)
+        returns the original campaign instead of starting a new one.
+        """
+        key = f"launch:{idempotency_key}" if idempotency_key else None
+        if key:
+            existing = self.queue.get_campaign_for_key(key)
+            if existing:
+                return existing
+
+        campaign_id = new_campaign_id()
+        context = {"project_id": project_id, "campaign_id": campaign_id, "options": options or {}}
+        self.queue.enqueue("extract_targets", campaign_id, context,
+                           key or f"{campaign_id}:extract_targets", self.max_attempts)
+        if key:
+            # A concurrent submit with the same key may have won; its campaign is the one queued
+            return self.queue.get_campaign_for_key(key)
+        return campaign_id
+
+    # Phase handlers return (result, follow-up jobs) -------------------------
+
+    def _next(self, phase: str, context: Dict, key_suffix: str = "", run_after: float = 0.0) -> Dict:
+        return {
+            "phase": phase,
+            "campaign_id": context["campaign_id"],
+            "payload": context,
+            "idempotency_key": f"{context['campaign_id']}:{phase}{key_suffix}",
+            "max_attempts": self.max_attempts,
+            "run_after": run_after
+        }
+
+    def _extract_targets(self, context: Dict):
+        business_plan_path = context["options"].get("business_plan_path", "Business_Plan.md")
+        target_data = self.agent.get_target_data(business_plan_path)
+        if self.agent.metrics_source is not None:
+            self.agent.metrics_source.register_campaign(context["campaign_id"])
+        self.agent.track_campaign(context["campaign_id"], {"project_id": context["project_id"],
+                                                           "campaign_id": context["campaign_id"], "status": "running"})
+        context = {**context, "target_data": target_data}
+        return target_data, [self._next("generate_ads", context)]
+
+    def _generate_ads(self, context: Dict):
+        ad_copies = self.agent.generate_ad_copies(context["target_data"])
+        context = {**context, "ad_copies": ad_copies}
+        return {"ad_copies": ad_copies}, [self._next("execute", context)]
+
+    @staticmethod
+    def _keyed(ad_copies, key: str):
+        """Ad copies tagged with per-platform idempotency keys for the adapters"""
+        return [{**ad, "idempotency_key": f"{key}:{ad['platform']}"} for ad in ad_copies]
+
+    def _execute(self, context: Dict):
+        key = f"{context['campaign_id']}:execute"
+        campaign_results = self.queue.get_checkpoint(key)
+        if campaign_results is None:
+            campaign_results = self.agent.execute_campaign(context["campaign_id"],
+                                                           self._keyed(context["ad_copies"], key))
+            self.queue.checkpoint(key, campaign_results)
+        budget_reallocation = self.agent.plan_reallocation(campaign_results)
+        context = {
+            **context,
+            "campaign_results": campaign_results,
+            "budget_reallocation": budget_reallocation,
+            "monitoring_results": self.agent.new_monitoring_results(context["campaign_id"], self.duration_days),
+            "total_traffic": 0
+        }
+        return campaign_results, [self._next("monitor_day", context, ":1", time.time() + self.day_interval)]
+
+    def _monitor_day(self, context: Dict):
+        monitoring_results = context["monitoring_results"]
+        day = monitoring_results["days_monitored"] + 1
+
+        # Spend today's share of the budget on the split the latest signups favour, once
+        key = f"{context['campaign_id']}:monitor_day:{day}"
+        budget_reallocation = self.queue.get_checkpoint(key)
+        if budget_reallocation is None:
+            budget_reallocation = context["budget_reallocation"]
+            self.agent.reallocate_day(context["campaign_id"], self._keyed(context["ad_copies"], key),
+                                      budget_reallocation, day, self.duration_days - day + 1)
+            self.queue.checkpoint(key, budget_reallocation)
+        metrics = self.agent.fetch_daily_metrics(context["campaign_id"], day)
+        total_signups = monitoring_results["total_signups"] + metrics["signups"]
+        total_revenue = monitoring_results["total_revenue"] + metrics["revenue"]
+        total_traffic = context["total_traffic"] + metrics["traffic"]
+        validated = self.agent.traction_met(total_signups, total_revenue)
+
+        self.agent.record_traction_day(monitoring_results, {
+            **metrics,
+            "total_signups": total_signups,
+            "total_revenue": total_revenue,
+            "total_traffic": total_traffic,
+            "traction_validated": validated
+        })
+        context = {**context, "monitoring_results": monitoring_results, "budget_reallocation": budget_reallocation,
+                   "total_traffic": total_traffic}
+
+        if validated or day >= self.duration_days:
+            follow_up = self._next("persist", context)
+        else:
+            follow_up = self._next("monitor_day", context, f":{day + 1}", time.time() + self.day_interval)
+        return metrics, [follow_up]
+
+    def _persist(self, context: Dict):
+        monitoring_results = self.agent.finalize_monitoring(context["monitoring_results"])
+        result = self.agent.assemble_results(
+            context["project_id"], context["campaign_id"], context["target_data"], context["ad_copies"],
+            context["campaign_results"], context["budget_reallocation"], monitoring_results
+        )
+        self.agent.save_results(result)
+        self.agent.store.flush()
+        self.queue.clear_checkpoints(context["campaign_id"])
+        return {"traction_validated": result.traction_validated}, []
+
+    # Workers ----------------------------------------------------------------
+
+    def run_once(self) -> bool:
+        """Claim and run a single job; returns False if nothing was ready"""
+        job = self.queue.claim()
+        if job is None:
+            return False
+
+        with self._active_lock:
+            self._active.add(job["id"])
+        try:
+            result, follow_ups = self.handlers[job["phase"]](job["payload"])
+        except Exception as e:
+            status = self.queue.fail(job["id"], str(e) or type(e).__name__)
+            print(f"❌ {job['phase']} failed for campaign {job['campaign_id']} "
+                  f"(attempt {job['attempt']}, now {status}): {e}")
+            if status == "failed":
+                self.agent.track_campaign(job["campaign_id"], {"project_id": job["payload"]["project_id"],
+                                                               "campaign_id": job["campaign_id"],
+                                                               "status": "failed", "error": str(e)})
+            return True
+        finally:
+            with self._active_lock:
+                self._active.discard(job["id"])
+
+        self.queue.complete(job["id"], result, follow_ups)
+        return True
+
+    def _worker_loop(self) -> None:
+        while not self._stop.is_set():
+            if not self.run_once():
+                self._stop.wait(self.poll_interval)
+
+    def _recover(self) -> None:
+        recovered = self.queue.recover()
+        if recovered["requeued"]:
+            print(f"♻️  Resuming {recovered['requeued']} interrupted jobs")
+        if recovered["failed"]:
+            print(f"❌ {recovered['failed']} jobs lost their worker on every attempt and were marked failed")
+
+    def _heartbeat_loop(self) -> None:
+        """Renew leases on running jobs and requeue jobs whose worker died"""
+        interval = self.queue.lease_seconds / 3
+        while not self._stop.wait(interval):
+            with self._active_lock:
+                active = list(self._active)
+            self.queue.heartbeat(active)
+            self._recover()
+
+    def start(self) -> None:
+        """Requeue jobs interrupted by a crash and start the worker and heartbeat threads"""
+        self._recover()
+        self._stop.clear()
+        self._threads = [threading.Thread(target=self._worker_loop, daemon=True) for _ in range(self.workers)]
+        self._threads.append(threading.Thread(target=self._heartbeat_loop, daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def run_until_idle(self, timeout: Optional[float] = None) -> None:
+        """Run workers until no jobs are queued or running, or until timeout seconds pass"""
+        self.start()
+        deadline = time.monotonic() + timeout if timeout else None
+        try:
+            while True:
+                backlog = self.queue.backlog()
+                if backlog["queued"] == 0 and backlog["running"] == 0:
+                    break
+                if deadline and time.monotonic() > deadline:
+                    break
+                time.sleep(self.poll_interval)
+        finally:
+            self.stop()
+
+    def report(self) -> Dict:
+        """Backlog depth and per-phase latency"""
+        return {"backlog": self.queue.backlog(), "phase_latency": self.queue.phase_latency()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run campaigns through the durable job queue")
+    parser.add_argument("project_ids", nargs="*", help="Projects to launch before running workers")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue", default="aga_jobs.db", help="Job queue database path")
+    parser.add_argument("--days", type=int, default=7, help="Monitoring days per campaign")
+    args = parser.parse_args()
+
+    scheduler = CampaignScheduler(queue=JobQueue(args.queue), workers=args.workers, duration_days=args.days)
+    for project_id in args.project_ids:
+        campaign_id = scheduler.submit(project_id)
+        print(f"📥 Queued campaign {campaign_id} for project {project_id}")
+
+    scheduler.run_until_idle()
+    scheduler.agent.close()
+
+    report = scheduler.report()
+    print("📊 Job queue backlog:", ", ".join(f"{k}={v}" for k, v in report["backlog"].items()))
+    for phase in PHASES:
+        stats = report["phase_latency"].get(phase)
+        if stats:
+            print(f"   {phase}: {stats['count']} jobs, p50 {stats['p50'] * 1000:.1f} ms, p99 {stats['p99'] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
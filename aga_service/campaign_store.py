@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Campaign Result Storage for the Autonomous Growth Agent
+SQLite is the default backend; per-project JSON files are kept for compatibility
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from result_models import dumps, loads
+
+# Default SQLite database; set FOUNDERX_CAMPAIGN_DB to keep it out of the working directory
+DEFAULT_DB_PATH = os.environ.get("FOUNDERX_CAMPAIGN_DB", "aga_campaigns.db")
+
+
+def campaign_status(results: Optional[Dict]) -> Optional[Dict]:
+    """Summarize stored campaign results for the status endpoint"""
+    if results is None:
+        return None
+
+    campaign_results = results.get("campaign_results", {})
+    monitoring_results = results.get("monitoring_results", {})
+    return {
+        "project_id": results["project_id"],
+        "campaign_id": results["campaign_id"],
+        "status": "completed" if results.get("completion_time") else "active",
+        "signups": campaign_results.get("total_signups", 0),
+        "budget_spent": campaign_results.get("total_spent", 0.0),
+        "revenue": campaign_results.get("total_revenue", 0.0),
+        "final_status": monitoring_results.get("final_status", "pending"),
+        "traction_validated": results.get("traction_validated", False),
+        "completion_time": results.get("completion_time")
+    }
+
+
+class CampaignStore(ABC):
+    """Base storage backend for campaign results"""
+
+    def save(self, results: Dict) -> None:
+        self.save_many([results])
+
+    @abstractmethod
+    def save_many(self, results_list: Iterable[Dict]) -> None:
+        ...
+
+    @abstractmethod
+    def get_campaign(self, campaign_id: str) -> Optional[Dict]:
+        ...
+
+    @abstractmethod
+    def get_project_campaigns(self, project_id: str, limit: Optional[int] = None) -> List[Dict]:
+        """Campaigns for a project, newest first"""
+
+    def get_latest(self, project_id: str) -> Optional[Dict]:
+        campaigns = self.get_project_campaigns(project_id, limit=1)
+        return campaigns[0] if campaigns else None
+
+    def get_status(self, project_id: str) -> Optional[Dict]:
+        return campaign_status(self.get_latest(project_id))
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+    def describe(self) -> str:
+        return type(self).__name__
+
+
+class SQLiteCampaignStore(CampaignStore):
+    """
+    SQLite-backed store with indexes on project_id, campaign_id and completion_time.
+    Writes are buffered and committed in one transaction every batch_size results.
+    It is the only store that keeps traction aggregates.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS campaigns (
+            campaign_id TEXT PRIMARY KEY,
+            project_id TEXT NOT NULL,
+            completion_time TEXT,
+            traction_validated INTEGER NOT NULL DEFAULT 0,
+            total_signups INTEGER NOT NULL DEFAULT 0,
+            total_spent REAL NOT NULL DEFAULT 0,
+            total_revenue REAL NOT NULL DEFAULT 0,
+            results TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_campaigns_project
+            ON campaigns (project_id, completion_time);
+        CREATE INDEX IF NOT EXISTS idx_campaigns_completion
+            ON campaigns (completion_time);
+        CREATE TABLE IF NOT EXISTS traction_daily (
+            campaign_id TEXT NOT NULL,
+            day_window INTEGER NOT NULL,
+            signups INTEGER NOT NULL DEFAULT 0,
+            revenue REAL NOT NULL DEFAULT 0,
+            traffic INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (campaign_id, day_window)
+        );
+        CREATE TABLE IF NOT EXISTS traction_campaigns (
+            campaign_id TEXT PRIMARY KEY,
+            start_window INTEGER NOT NULL,
+            finished INTEGER NOT NULL DEFAULT 0
+        );
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, batch_size: int = 1):
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self._pending = []
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Opened lazily so agents that never save don't create a database file
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self.SCHEMA)
+        return self._conn
+
+    @staticmethod
+    def _row(results: Dict):
+        campaign_results = results.get("campaign_results", {})
+        return (
+            results["campaign_id"],
+            results["project_id"],
+            results.get("completion_time"),
+            int(bool(results.get("traction_validated", False))),
+            campaign_results.get("total_signups", 0),
+            campaign_results.get("total_spent", 0.0),
+            campaign_results.get("total_revenue", 0.0),
+            dumps(results).decode()
+        )
+
+    def save(self, results: Dict) -> None:
+        with self._lock:
+            self._pending.append(self._row(results))
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def save_many(self, results_list: Iterable[Dict]) -> None:
+        with self._lock:
+            self._pending.extend(self._row(results) for results in results_list)
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        conn = self._connection()
+        with conn:  # single transaction, rolled back on error
+            conn.executemany(
+                "INSERT OR REPLACE INTO campaigns VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                self._pending
+            )
+        self._pending = []
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _query(self, sql: str, params) -> List[Dict]:
+        with self._lock:
+            self._flush_locked()
+            rows = self._connection().execute(sql, params).fetchall()
+        return [loads(row[0]) for row in rows]
+
+    def get_campaign(self, campaign_id: str) -> Optional[Dict]:
+        rows = self._query("SELECT results FROM campaigns WHERE campaign_id = ?", (campaign_id,))
+        return rows[0] if rows else None
+
+    def get_project_campaigns(self, project_id: str, limit: Optional[int] = None) -> List[Dict]:
+        return self._query(
+            "SELECT results FROM campaigns WHERE project_id = ? "
+            "ORDER BY completion_time DESC LIMIT ?",
+            (project_id, -1 if limit is None else limit)
+        )
+
+    def add_traction_windows(self, rows: Iterable[tuple]) -> None:
+        """Add (campaign_id, window, signups, revenue, traffic) aggregates onto stored totals"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO traction_daily VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (campaign_id, day_window) DO UPDATE SET "
+                    "signups = signups + excluded.signups, "
+                    "revenue = revenue + excluded.revenue, "
+                    "traffic = traffic + excluded.traffic",
+                    rows
+                )
+
+    def get_traction_windows(self, campaign_id: str) -> Dict[int, tuple]:
+        """Stored daily aggregates for a campaign as {window: (signups, revenue, traffic)}"""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT day_window, signups, revenue, traffic FROM traction_daily WHERE campaign_id = ?",
+                (campaign_id,)
+            ).fetchall()
+        return {row[0]: row[1:] for row in rows}
+
+    def set_traction_start(self, campaign_id: str, start_window: int) -> None:
+        """Record the UTC day number of a campaign's day 1 for traction ingestion"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO traction_campaigns (campaign_id, start_window) VALUES (?, ?)",
+                    (campaign_id, start_window)
+                )
+
+    def finish_traction(self, campaign_id: str) -> None:
+        """Mark a campaign's monitoring finished so later events for it are rejected"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("UPDATE traction_campaigns SET finished = 1 WHERE campaign_id = ?", (campaign_id,))
+
+    def get_traction_start(self, campaign_id: str) -> Optional[Tuple[int, bool]]:
+        """(start_window, finished) for a registered campaign, or None"""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT start_window, finished FROM traction_campaigns WHERE campaign_id = ?", (campaign_id,)
+            ).fetchone()
+        return (row[0], bool(row[1])) if row else None
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def describe(self) -> str:
+        return self.path
+
+
+class JSONFileCampaignStore(CampaignStore):
+    """Compatibility mode: one AGAResults_<project_id>.json file per project"""
+
+    def __init__(self, directory: str = "."):
+        self.directory = directory
+
+    def _path(self, project_id: str) -> str:
+        return os.path.join(self.directory, f"AGAResults_{project_id}.json")
+
+    def save_many(self, results_list: Iterable[Dict]) -> None:
+        for results in results_list:
+            path = self._path(results["project_id"])
+            # Unique temp name so concurrent saves of one project never share it; readers see whole files
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(dumps(results, indent=True))
+            os.replace(tmp_path, path)
+
+    def get_campaign(self, campaign_id: str) -> Optional[Dict]:
+        # No index in this mode - scan every results file
+        for filename in os.listdir(self.directory):
+            if filename.startswith("AGAResults_") and filename.endswith(".json"):
+                with open(os.path.join(self.directory, filename), 'rb') as f:
+                    results = loads(f.read())
+                if results.get("campaign_id") == campaign_id:
+                    return results
+        return None
+
+    def get_project_campaigns(self, project_id: str, limit: Optional[int] = None) -> List[Dict]:
+        try:
+            with open(self._path(project_id), 'rb') as f:
+                return [loads(f.read())]
+        except FileNotFoundError:
+            return []
+
+    def describe(self) -> str:
+        return os.path.join(self.directory, "AGAResults_<project_id>.json")
+
+
+def create_campaign_store(backend: str = "sqlite", path: Optional[str] = None, **kwargs) -> CampaignStore:
+    """Build a campaign store by backend name ("sqlite" or "json")"""
+    if backend == "sqlite":
+        return SQLiteCampaignStore(path or DEFAULT_DB_PATH, **kwargs)
+    if backend == "json":
+        return JSONFileCampaignStore(path or ".")
+    raise ValueError(f"Unknown campaign store backend: {backend}")
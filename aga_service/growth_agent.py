@@ -4,51 +4,74 @@ Autonomous Growth Agent (AGA) Core Logic
 Handles micro-campaign execution and traction validation
 """
 
-import json
 import os
+import sys
+import threading
 import time
 import uuid
+import zlib
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from ad_platforms import MockPlatformAdapter, PlatformAdapter
+from ad_variants import PLATFORM_BUDGET_SHARES, VariantCache, get_variant_cache, iter_ad_variants
+from budget_allocator import ThompsonBudgetAllocator
+from campaign_store import CampaignStore, JSONFileCampaignStore, campaign_status, create_campaign_store
+from extraction_client import ExtractionClient, get_extraction_client
+from instrumentation import log, metrics, percentile, span, timed
+from plan_cache import PlanCache, get_plan_cache
+from result_models import AGAResult, CampaignResult, MonitoringResult
+
+def new_campaign_id() -> str:
+    """Short random campaign identifier"""
+    return str(uuid.uuid4())[:8]
 
 class GrowthAgent:
-    def __init__(self):
-        self.campaigns = {}
+    # Bump when extract_target_data's output changes so cached extractions are not reused
+    TARGET_DATA_VERSION = "1"
+    
+    def __init__(self, platform_adapter: Optional[PlatformAdapter] = None,
+                 execution_mode: str = "sequential", platform_timeout: float = 30.0,
+                 store: Optional[CampaignStore] = None, plan_cache: Optional[PlanCache] = None,
+                 metrics_source=None, variant_cache: Optional[VariantCache] = None,
+                 extraction_client: Optional[ExtractionClient] = None, max_campaigns: int = 10000,
+                 platform_workers: int = 32, results_dir: Optional[str] = None):
+        self.campaigns = OrderedDict()  # campaign_id -> status summary, most recent last
+        self.max_campaigns = max_campaigns
+        self._campaigns_lock = threading.Lock()
         self.budget_limit = 100.0
         self.signup_threshold = 50
         self.revenue_threshold = 500.0
+        self.platform_adapter = platform_adapter or MockPlatformAdapter()
+        self.execution_mode = execution_mode  # "sequential" or "concurrent"
+        self.platform_timeout = platform_timeout
+        self.platform_workers = platform_workers
+        self._platform_executor = None  # Created on the first concurrent campaign, shared by every later one
+        self._executor_lock = threading.Lock()
+        self.store = store or create_campaign_store("sqlite")
+        # AGAResults_<project_id>.json handoff for standalone runs, alongside the store
+        self.results_files = (JSONFileCampaignStore(results_dir)
+                              if results_dir is not None and not isinstance(self.store, JSONFileCampaignStore) else None)
+        self.plan_cache = plan_cache or get_plan_cache()
+        self.metrics_source = metrics_source  # register_campaign/daily_metrics/finish_campaign, e.g. a TractionAggregator
+        self.variant_cache = variant_cache or get_variant_cache()
+        self.extraction_client = extraction_client or get_extraction_client()
         
+    @timed("growth.get_target_data")
     def get_target_data(self, business_plan_path: str = "Business_Plan.md") -> Dict:
         """Extract target market and value proposition from business plan"""
         try:
-            with open(business_plan_path, 'r') as f:
-                content = f.read()
-            
-            # Mock extraction - in real implementation, this would use NLP/LLM
-            target_data = {
-                "target_market": "Small business owners and entrepreneurs",
-                "value_proposition": "AI-powered business plan generation and validation",
-                "key_benefits": [
-                    "Save 40+ hours of research and planning",
-                    "Professional investor-ready documents",
-                    "Market validation and competitive analysis"
-                ],
-                "customer_segments": [
-                    "Solo entrepreneurs",
-                    "Small business owners",
-                    "Startup founders"
-                ],
-                "pain_points": [
-                    "Time-consuming business planning",
-                    "Lack of market research expertise",
-                    "Difficulty attracting investors"
-                ]
-            }
-            
-            return target_data
+            extractor = (self.extraction_client.extractor("growth_target", fallback=self.extract_target_data)
+                         if self.extraction_client else self.extract_target_data)
+            return self.plan_cache.get(business_plan_path, "growth_target", extractor, self.TARGET_DATA_VERSION)
             
         except FileNotFoundError:
-            print(f"⚠️  Business plan not found at {business_plan_path}, using default data")
+            log(f"⚠️  Business plan not found at {business_plan_path}, using default data",
+                "business_plan_missing", path=business_plan_path)
             return {
                 "target_market": "General business audience",
                 "value_proposition": "Innovative business solution",
@@ -57,124 +80,393 @@ class GrowthAgent:
                 "pain_points": ["Time", "Cost", "Complexity"]
             }
     
+    def extract_target_data(self, content: str) -> Dict:
+        """Extract target data from business plan content (cached by get_target_data)"""
+        
+        # Mock extraction - in real implementation, this would use NLP/LLM
+        return {
+            "target_market": "Small business owners and entrepreneurs",
+            "value_proposition": "AI-powered business plan generation and validation",
+            "key_benefits": [
+                "Save 40+ hours of research and planning",
+                "Professional investor-ready documents",
+                "Market validation and competitive analysis"
+            ],
+            "customer_segments": [
+                "Solo entrepreneurs",
+                "Small business owners",
+                "Startup founders"
+            ],
+            "pain_points": [
+                "Time-consuming business planning",
+                "Lack of market research expertise",
+                "Difficulty attracting investors"
+            ]
+        }
+    
+    @timed("growth.generate_ad_copies")
     def generate_ad_copies(self, target_data: Dict) -> List[Dict]:
-        """Generate 3 high-conversion ad copies based on target data"""
+        """Generate the highest-priority ad copy for each platform"""
         
-        ad_copies = [
-            {
-                "platform": "Google Search",
-                "headline": f"Transform Your {target_data['target_market']} with AI",
-                "description": f"{target_data['value_proposition']}. Save 40+ hours of work.",
-                "cta": "Start Free Trial",
-                "budget_allocation": 40.0
-            },
-            {
-                "platform": "Facebook",
-                "headline": f"Stop Struggling with {target_data['pain_points'][0]}",
-                "description": f"Join 1000+ {target_data['customer_segments'][0]} who found success.",
-                "cta": "Learn More",
-                "budget_allocation": 35.0
-            },
+        best = {}
+        for variant in self.iter_ad_variants(target_data):
+            best.setdefault(variant["platform"], variant)
+            if len(best) == len(PLATFORM_BUDGET_SHARES):
+                break
+        
+        return [
             {
-                "platform": "LinkedIn",
-                "headline": f"Professional {target_data['value_proposition']} for {target_data['target_market']}",
-                "description": f"Get investor-ready documents in 24 hours. Trusted by 500+ businesses.",
-                "cta": "Get Started",
-                "budget_allocation": 25.0
+                "platform": platform,
+                "headline": best[platform]["headline"],
+                "description": best[platform]["description"],
+                "cta": best[platform]["cta"],
+                "budget_allocation": self.budget_limit * share
             }
+            for platform, share in PLATFORM_BUDGET_SHARES.items() if platform in best
         ]
-        
-        return ad_copies
     
-    def execute_campaign(self, campaign_id: str, ad_copies: List[Dict]) -> Dict:
+    def iter_ad_variants(self, target_data: Dict) -> Iterator[Dict]:
+        """Every distinct ad copy candidate for the target data, highest priority first"""
+        return iter_ad_variants(target_data, PLATFORM_BUDGET_SHARES, self.variant_cache)
+    
+    @timed("growth.execute_campaign")
+    def execute_campaign(self, campaign_id: str, ad_copies: List[Dict], mode: Optional[str] = None) -> Dict:
         """Execute the micro-campaign across platforms"""
         
-        print(f"🚀 Executing campaign {campaign_id}...")
+        mode = mode or self.execution_mode
+        log(f"🚀 Executing campaign {campaign_id} ({mode})...", "campaign_executing", campaign_id=campaign_id, mode=mode)
+        
+        ad_copies = self.enforce_budget_limit(ad_copies)
         
         campaign_results = {
             "campaign_id": campaign_id,
             "start_time": datetime.now().isoformat(),
             "platforms": {},
+            "failed_platforms": {},
             "total_spent": 0.0,
             "total_signups": 0,
             "total_revenue": 0.0
         }
         
-        for ad in ad_copies:
+        outcomes = self._run_platforms(ad_copies, mode)
+        
+        # Merge in ad copy order so totals don't depend on completion order
+        for ad, (platform_results, error) in zip(ad_copies, outcomes):
             platform = ad["platform"]
-            budget = ad["budget_allocation"]
             
-            print(f"   📱 {platform}: ${budget} budget allocated")
-            
-            # Mock campaign execution - in real implementation, this would call actual APIs
-            platform_results = {
-                "budget_spent": budget * 0.85,  # 85% utilization
-                "impressions": int(budget * 100),
-                "clicks": int(budget * 5),
-                "signups": int(budget * 0.3),
-                "revenue": budget * 0.2,
-                "ctr": 5.0,
-                "conversion_rate": 6.0
-            }
+            if error is not None:
+                campaign_results["failed_platforms"][platform] = error
+                metrics.inc("founderx_platform_runs_total", labels={"platform": platform, "status": "failed"})
+                log(f"   ❌ {platform}: {error}", "platform_failed", campaign_id=campaign_id, platform=platform, error=error)
+                continue
             
             campaign_results["platforms"][platform] = platform_results
             campaign_results["total_spent"] += platform_results["budget_spent"]
             campaign_results["total_signups"] += platform_results["signups"]
             campaign_results["total_revenue"] += platform_results["revenue"]
             
-            print(f"      ✅ ${platform_results['budget_spent']:.2f} spent, {platform_results['signups']} signups")
+            metrics.inc("founderx_platform_runs_total", labels={"platform": platform, "status": "ok"})
+            metrics.inc("founderx_platform_signups_total", platform_results["signups"], {"platform": platform})
+            log(f"   📱 {platform}: ${ad['budget_allocation']} budget allocated\n"
+                f"      ✅ ${platform_results['budget_spent']:.2f} spent, {platform_results['signups']} signups",
+                "platform_completed", campaign_id=campaign_id, platform=platform,
+                budget_allocated=ad["budget_allocation"], budget_spent=platform_results["budget_spent"],
+                signups=platform_results["signups"])
         
         return campaign_results
     
-    def monitor_traction(self, campaign_id: str, duration_days: int = 7) -> Dict:
-        """Monitor campaign performance and validate traction"""
+    def enforce_budget_limit(self, ad_copies: List[Dict]) -> List[Dict]:
+        """Scale ad budgets down proportionally if together they exceed budget_limit"""
+        
+        total = sum(ad["budget_allocation"] for ad in ad_copies)
+        if total <= self.budget_limit:
+            return ad_copies
+        
+        log(f"⚠️  Ad budgets total ${total:.2f}, scaling down to the ${self.budget_limit:.2f} limit",
+            "budget_scaled", total=total, budget_limit=self.budget_limit)
+        scale = self.budget_limit / total
+        return [{**ad, "budget_allocation": int(ad["budget_allocation"] * scale * 100) / 100} for ad in ad_copies]
+    
+    @timed("growth.plan_reallocation")
+    def plan_reallocation(self, campaign_results: Dict) -> Dict:
+        """
+        Seed budget reallocation from execution results: observed spend and signups
+        per platform and a first plan for the budget left. monitor_traction then
+        spends that budget day by day through reallocate_day.
+        """
         
-        print(f"📊 Monitoring traction for campaign {campaign_id}...")
+        campaign_id = campaign_results["campaign_id"]
+        budget_reallocation = {
+            "observed": {platform: {"spent": 0.0, "signups": 0} for platform in campaign_results["platforms"]},
+            "days": []
+        }
+        allocator = self._allocator(campaign_id, 0, budget_reallocation["observed"])
+        for platform, results in campaign_results["platforms"].items():
+            self._record_spend(allocator, budget_reallocation["observed"], campaign_id, platform,
+                               results["budget_spent"], results["signups"])
+        self._plan_remaining(allocator, budget_reallocation)
+        return budget_reallocation
+    
+    @timed("growth.reallocate_day")
+    def reallocate_day(self, campaign_id: str, ad_copies: List[Dict], budget_reallocation: Dict,
+                       day: int, days_left: int) -> Dict:
+        """
+        Spend one day's share of the remaining budget, split by the Thompson
+        posterior over every signup observed so far, through the live platform
+        adapters, then fold the day's results back into the posterior and
+        re-plan. Updates budget_reallocation in place; returns the day's entry.
+        """
+        
+        observed = budget_reallocation["observed"]
+        allocator = self._allocator(campaign_id, day, observed)
+        split = allocator.allocate(allocator.remaining / max(1, days_left)) if observed else {}
+        ads = [{**ad, "budget_allocation": split[ad["platform"]]}
+               for ad in ad_copies if split.get(ad["platform"], 0.0) > 0]
+        
+        entry = {"day": day, "allocation": split, "spent": 0.0, "signups": 0, "failed_platforms": {}}
+        for ad, (platform_results, error) in zip(ads, self._run_platforms(ads)):
+            platform = ad["platform"]
+            if error is not None:
+                entry["failed_platforms"][platform] = error
+                metrics.inc("founderx_platform_runs_total", labels={"platform": platform, "status": "failed"})
+                continue
+            spent = self._record_spend(allocator, observed, campaign_id, platform,
+                                       platform_results["budget_spent"], platform_results["signups"])
+            entry["spent"] += spent
+            entry["signups"] += platform_results["signups"]
+        
+        budget_reallocation["days"].append(entry)
+        self._plan_remaining(allocator, budget_reallocation)
+        metrics.inc("founderx_budget_replans_total")
+        log(f"   💸 Day {day}: ${entry['spent']:.2f} reallocated spend, {entry['signups']} ad signups, "
+            f"${allocator.remaining:.2f} left", "budget_reallocated", campaign_id=campaign_id, day=day,
+            allocation=split, spent=entry["spent"], signups=entry["signups"], remaining=allocator.remaining)
+        return entry
+    
+    def _allocator(self, campaign_id: str, day: int, observed: Dict[str, Dict]) -> ThompsonBudgetAllocator:
+        """Allocator replayed from observed spend; seeded per campaign and day so plans are reproducible"""
+        allocator = ThompsonBudgetAllocator(list(observed), self.budget_limit,
+                                            seed=zlib.crc32(f"{campaign_id}:{day}".encode()))
+        for platform, totals in observed.items():
+            allocator.record(platform, totals["spent"], totals["signups"])
+        return allocator
+    
+    def _record_spend(self, allocator: ThompsonBudgetAllocator, observed: Dict[str, Dict], campaign_id: str,
+                      platform: str, spend: float, signups: int) -> float:
+        """Record a platform's spend, counting no more than the budget limit allows"""
+        if spend > allocator.remaining + 1e-9:
+            # A real adapter can overshoot its allocation; count no more than the limit allows
+            log(f"⚠️  {platform} reported ${spend:.2f} spent with ${allocator.remaining:.2f} of the budget left",
+                "budget_overspent", campaign_id=campaign_id, platform=platform, spent=spend,
+                remaining=allocator.remaining)
+            spend = allocator.remaining
+        allocator.record(platform, spend, signups)
+        observed[platform]["spent"] += spend
+        observed[platform]["signups"] += signups
+        return spend
+    
+    @staticmethod
+    def _plan_remaining(allocator: ThompsonBudgetAllocator, budget_reallocation: Dict) -> None:
+        budget_reallocation["remaining_budget"] = allocator.remaining
+        budget_reallocation["allocation"] = allocator.allocate() if allocator.platforms else {}
+    
+    def _run_platforms(self, ad_copies: List[Dict], mode: Optional[str] = None) -> List:
+        """(results, error message) per ad copy, in ad copy order"""
+        mode = mode or self.execution_mode
+        if mode == "concurrent":
+            return self._run_platforms_concurrently(ad_copies)
+        if mode == "sequential":
+            return [self._run_platform(ad) for ad in ad_copies]
+        raise ValueError(f"Unknown execution mode: {mode}")
+    
+    def _run_platform(self, ad: Dict):
+        """Run one ad copy, returning (results, error message)"""
+        try:
+            with span("growth.platform", platform=ad["platform"]):
+                return self.platform_adapter.run_ad(ad), None
+        except Exception as e:
+            return None, str(e) or type(e).__name__
+    
+    def _run_platforms_concurrently(self, ad_copies: List[Dict]) -> List:
+        """Dispatch every platform at once, each bounded by platform_timeout"""
+        
+        if not ad_copies:
+            return []
+        
+        executor = self.platform_executor()
+        futures = [executor.submit(self._run_platform, ad) for ad in ad_copies]
+        deadline = time.monotonic() + self.platform_timeout
+        
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except FutureTimeoutError:
+                # Not started yet: drop it; already running: its result is ignored
+                future.cancel()
+                outcomes.append((None, f"timed out after {self.platform_timeout}s"))
+        return outcomes
+    
+    def platform_executor(self) -> ThreadPoolExecutor:
+        """The agent's long-lived pool for concurrent platform calls"""
+        with self._executor_lock:
+            if self._platform_executor is None:
+                self._platform_executor = ThreadPoolExecutor(max_workers=self.platform_workers,
+                                                             thread_name_prefix="platform")
+            return self._platform_executor
+    
+    def close(self) -> None:
+        """Stop the platform pool and close the campaign store"""
+        with self._executor_lock:
+            executor, self._platform_executor = self._platform_executor, None
+        if executor is not None:
+            # Don't block on platforms that already timed out
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.store.close()
+    
+    def fetch_daily_metrics(self, campaign_id: str, day: int) -> Dict:
+        """Metrics for one monitoring day of a campaign"""
+        
+        if self.metrics_source is not None:
+            return self.metrics_source.daily_metrics(campaign_id, day)
         
         # Mock monitoring - in real implementation, this would track actual metrics
-        monitoring_results = {
+        return {
+            "day": day,
+            "signups": 8 + (day * 2),  # Mock growth
+            "revenue": 25 + (day * 5),
+            "traffic": 150 + (day * 20)
+        }
+    
+    def iter_traction(self, campaign_id: str, duration_days: int = 7, stop_early: bool = True,
+                      ad_copies: Optional[List[Dict]] = None,
+                      budget_reallocation: Optional[Dict] = None) -> Iterator[Dict]:
+        """
+        Stream daily metrics with running totals as each day arrives.
+        Totals update in O(1) per day and nothing is retained between days,
+        so memory stays flat however long the window. With stop_early the
+        stream ends on the day either traction threshold is crossed. Given a
+        budget_reallocation from plan_reallocation, each day first spends its
+        share of the remaining budget through reallocate_day.
+        """
+        
+        total_signups = 0
+        total_revenue = 0.0
+        total_traffic = 0
+        
+        for day in range(1, duration_days + 1):
+            if budget_reallocation is not None:
+                self.reallocate_day(campaign_id, ad_copies or [], budget_reallocation, day, duration_days - day + 1)
+            day_metrics = self.fetch_daily_metrics(campaign_id, day)
+            total_signups += day_metrics["signups"]
+            total_revenue += day_metrics["revenue"]
+            total_traffic += day_metrics["traffic"]
+            
+            validated = self.traction_met(total_signups, total_revenue)
+            
+            yield {
+                **day_metrics,
+                "total_signups": total_signups,
+                "total_revenue": total_revenue,
+                "total_traffic": total_traffic,
+                "traction_validated": validated
+            }
+            
+            if validated and stop_early:
+                return
+    
+    def traction_met(self, total_signups: int, total_revenue: float) -> bool:
+        """Whether running totals cross the signup or revenue threshold"""
+        return total_signups >= self.signup_threshold or total_revenue >= self.revenue_threshold
+    
+    @timed("growth.monitor_traction")
+    def monitor_traction(self, campaign_id: str, duration_days: int = 7, stop_early: bool = True,
+                         ad_copies: Optional[List[Dict]] = None, budget_reallocation: Optional[Dict] = None) -> Dict:
+        """Monitor campaign performance and validate traction, reallocating budget daily when given a plan"""
+        
+        log(f"📊 Monitoring traction for campaign {campaign_id}...", "monitoring_started", campaign_id=campaign_id)
+        
+        monitoring_results = self.new_monitoring_results(campaign_id, duration_days)
+        for update in self.iter_traction(campaign_id, duration_days, stop_early, ad_copies, budget_reallocation):
+            self.record_traction_day(monitoring_results, update)
+        
+        return self.finalize_monitoring(monitoring_results)
+    
+    def new_monitoring_results(self, campaign_id: str, duration_days: int) -> Dict:
+        return {
             "campaign_id": campaign_id,
             "monitoring_period": f"{duration_days} days",
             "daily_metrics": [],
+            "days_monitored": 0,
+            "total_signups": 0,
+            "total_revenue": 0.0,
+            "validated_on_day": None,
             "final_status": "pending"
         }
+    
+    def record_traction_day(self, monitoring_results: Dict, update: Dict) -> None:
+        """Fold one iter_traction update into monitoring results"""
         
-        # Simulate daily monitoring
-        for day in range(1, duration_days + 1):
-            daily_metrics = {
-                "day": day,
-                "signups": 8 + (day * 2),  # Mock growth
-                "revenue": 25 + (day * 5),
-                "traffic": 150 + (day * 20)
-            }
-            monitoring_results["daily_metrics"].append(daily_metrics)
-            
-            print(f"   Day {day}: {daily_metrics['signups']} signups, ${daily_metrics['revenue']:.2f} revenue")
+        day = update["day"]
+        monitoring_results["daily_metrics"].append({
+            "day": day,
+            "signups": update["signups"],
+            "revenue": update["revenue"],
+            "traffic": update["traffic"]
+        })
+        monitoring_results["days_monitored"] = day
+        monitoring_results["total_signups"] = update["total_signups"]
+        monitoring_results["total_revenue"] = update["total_revenue"]
+        if update["traction_validated"] and monitoring_results["validated_on_day"] is None:
+            monitoring_results["validated_on_day"] = day
         
-        # Check if thresholds are met
-        final_signups = monitoring_results["daily_metrics"][-1]["signups"]
-        final_revenue = monitoring_results["daily_metrics"][-1]["revenue"]
+        log(f"   Day {day}: {update['signups']} signups, ${update['revenue']:.2f} revenue", "traction_day",
+            campaign_id=monitoring_results["campaign_id"], day=day, signups=update["signups"],
+            revenue=update["revenue"], traffic=update["traffic"])
+    
+    def finalize_monitoring(self, monitoring_results: Dict) -> Dict:
+        """Decide final_status once monitoring has finished"""
         
-        if final_signups >= self.signup_threshold or final_revenue >= self.revenue_threshold:
+        # Thresholds are checked against running totals for the window
+        final_signups = monitoring_results["total_signups"]
+        final_revenue = monitoring_results["total_revenue"]
+        # Early stop ends the window on the day traction is validated
+        monitoring_results["monitoring_period"] = f"{monitoring_results['days_monitored']} days"
+        
+        if monitoring_results["validated_on_day"] is not None:
             monitoring_results["final_status"] = "traction_validated"
-            print(f"🎉 Traction validated! {final_signups} signups, ${final_revenue:.2f} revenue")
+            log(f"🎉 Traction validated on day {monitoring_results['validated_on_day']}! {final_signups} signups, ${final_revenue:.2f} revenue",
+                "traction_validated", campaign_id=monitoring_results["campaign_id"],
+                day=monitoring_results["validated_on_day"], signups=final_signups, revenue=final_revenue)
         else:
             monitoring_results["final_status"] = "traction_failed"
-            print(f"❌ Traction not validated. {final_signups} signups, ${final_revenue:.2f} revenue")
+            log(f"❌ Traction not validated. {final_signups} signups, ${final_revenue:.2f} revenue",
+                "traction_failed", campaign_id=monitoring_results["campaign_id"],
+                signups=final_signups, revenue=final_revenue)
+        
+        metrics.inc("founderx_campaigns_total", labels={"status": monitoring_results["final_status"]})
+        if self.metrics_source is not None:
+            self.metrics_source.finish_campaign(monitoring_results["campaign_id"])
         
         return monitoring_results
     
-    def launch_campaign(self, project_id: str, options: Dict = None) -> Dict:
+    @timed("growth.launch_campaign")
+    def launch_campaign(self, project_id: str, options: Dict = None, target_data: Optional[Dict] = None,
+                        campaign_id: Optional[str] = None) -> Dict:
         """Main function to launch a growth campaign"""
         
-        campaign_id = str(uuid.uuid4())[:8]
+        campaign_id = campaign_id or new_campaign_id()
         
-        print(f"🚀 Launching growth campaign for project {project_id}")
-        print(f"   Campaign ID: {campaign_id}")
+        log(f"🚀 Launching growth campaign for project {project_id}\n   Campaign ID: {campaign_id}",
+            "campaign_launched", project_id=project_id, campaign_id=campaign_id)
+        
+        if self.metrics_source is not None:
+            self.metrics_source.register_campaign(campaign_id)
         
         # Get target data from business plan
-        business_plan_path = options.get('business_plan_path', 'Business_Plan.md') if options else 'Business_Plan.md'
-        target_data = self.get_target_data(business_plan_path)
+        if target_data is None:
+            business_plan_path = options.get('business_plan_path', 'Business_Plan.md') if options else 'Business_Plan.md'
+            target_data = self.get_target_data(business_plan_path)
         
         # Generate ad copies
         ad_copies = self.generate_ad_copies(target_data)
@@ -182,43 +474,180 @@ class GrowthAgent:
         # Execute campaign
         campaign_results = self.execute_campaign(campaign_id, ad_copies)
         
-        # Monitor traction
-        monitoring_results = self.monitor_traction(campaign_id)
+        # Plan how the rest of the budget should be spent
+        budget_reallocation = self.plan_reallocation(campaign_results)
+        
+        # Monitor traction, re-planning and spending the rest of the budget day by day
+        monitoring_results = self.monitor_traction(campaign_id, ad_copies=ad_copies,
+                                                   budget_reallocation=budget_reallocation)
         
         # Combine results
-        final_results = {
-            "project_id": project_id,
-            "campaign_id": campaign_id,
-            "target_data": target_data,
-            "ad_copies": ad_copies,
-            "campaign_results": campaign_results,
-            "monitoring_results": monitoring_results,
-            "traction_validated": monitoring_results["final_status"] == "traction_validated",
-            "completion_time": datetime.now().isoformat()
-        }
+        final_results = self.assemble_results(project_id, campaign_id, target_data, ad_copies,
+                                              campaign_results, budget_reallocation, monitoring_results)
         
-        # Save results to file
-        self.save_results(final_results)
+        # Save results to the store (and results file)
+        return self.save_results(final_results)
+    
+    def assemble_results(self, project_id: str, campaign_id: str, target_data: Dict, ad_copies: List[Dict],
+                         campaign_results: Dict, budget_reallocation: Dict, monitoring_results: Dict) -> AGAResult:
+        """Combine every phase's output into the typed campaign result shared with FIR"""
+        monitoring = MonitoringResult.from_dict(monitoring_results)
+        return AGAResult(
+            project_id=project_id,
+            campaign_id=campaign_id,
+            campaign=CampaignResult.from_dict(campaign_results),
+            monitoring=monitoring,
+            target_data=target_data,
+            ad_copies=ad_copies,
+            budget_reallocation=budget_reallocation,
+            traction_validated=monitoring.final_status == "traction_validated",
+            completion_time=datetime.now().isoformat()
+        )
+    
+    def iter_campaigns_batch(self, projects: Iterable[Union[str, Dict]], max_workers: int = 8) -> Iterator[Dict]:
+        """
+        Launch many projects on a bounded thread pool, yielding each result as it finishes.
+        Each project is a project_id or a dict of launch options containing 'project_id'.
+        Business plans are parsed once through the agent's bounded, thread-safe plan cache.
+        """
+        
+        def run(project):
+            options = {'project_id': project} if isinstance(project, str) else project
+            project_id = options.get('project_id')
+            
+            start = time.perf_counter()
+            try:
+                if not project_id:
+                    raise ValueError("project_id is required")
+                results = self.launch_campaign(project_id, options)
+                error = None
+            except Exception as e:
+                results, error = None, str(e) or type(e).__name__
+            
+            return {
+                "project_id": project_id,
+                "results": results,
+                "error": error,
+                "latency_seconds": time.perf_counter() - start
+            }
         
-        return final_results
+        # Keep at most 2x max_workers projects in flight so huge batches stay bounded
+        max_in_flight = max_workers * 2
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = set()
+            for project in projects:
+                pending.add(executor.submit(run, project))
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
     
-    def save_results(self, results: Dict):
-        """Save campaign results to JSON file"""
+    @timed("growth.save_results")
+    def save_results(self, result: AGAResult) -> Dict:
+        """
+        Persist campaign results to the configured campaign store (and results file, if any).
+        Returns the results dict that was stored.
+        """
         
-        filename = f"AGAResults_{results['project_id']}.json"
+        results = result.to_dict()
+        self.track_campaign(results['campaign_id'], campaign_status(results))
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(results, f, indent=2)
-            print(f"💾 Results saved to {filename}")
+            self.store.save(results)
+            log(f"💾 Results saved to {self.store.describe()}", "results_saved", campaign_id=results["campaign_id"])
+            if self.results_files is not None:
+                self.results_files.save(results)
+                log(f"💾 Results saved to {self.results_files.describe()}", "results_saved",
+                    campaign_id=results["campaign_id"])
         except Exception as e:
-            print(f"❌ Error saving results: {e}")
+            metrics.inc("founderx_save_errors_total")
+            log(f"❌ Error saving results: {e}", "results_save_failed", campaign_id=results["campaign_id"], error=str(e))
+        return results
+    
+    def track_campaign(self, campaign_id: str, status: Dict) -> None:
+        """Keep a campaign's status in memory; beyond max_campaigns the oldest is dropped (the store keeps it)"""
+        with self._campaigns_lock:
+            self.campaigns[campaign_id] = status
+            self.campaigns.move_to_end(campaign_id)
+            while len(self.campaigns) > self.max_campaigns:
+                self.campaigns.popitem(last=False)
+    
+    def get_campaign_status(self, project_id: str) -> Optional[Dict]:
+        """Latest campaign status for a project, via an indexed store lookup"""
+        return self.store.get_status(project_id)
 
 def launchCampaign(project_id: str, options: Dict = None) -> Dict:
     """Entry point function for the growth agent"""
     
-    agent = GrowthAgent()
-    return agent.launch_campaign(project_id, options)
+    options = options or {}
+    agent = GrowthAgent(
+        execution_mode=options.get('execution_mode', 'sequential'),
+        store=create_campaign_store(options.get('storage_backend', 'sqlite'), options.get('storage_path')),
+        # Standalone launches keep writing the JSON handoff other tools read
+        results_dir=options.get('results_dir', '.')
+    )
+    try:
+        return agent.launch_campaign(project_id, options)
+    finally:
+        agent.close()
+
+def launch_campaigns_batch(projects: Iterable[Union[str, Dict]], max_workers: int = 8,
+                           on_result=None, agent: Optional[GrowthAgent] = None) -> Dict:
+    """
+    Batch entry point: launch campaigns for many projects with one shared agent.
+    on_result is called with each project's result as soon as it finishes; results
+    are not kept, so memory stays flat however large the batch.
+    Returns throughput and per-project latency statistics.
+    """
+    
+    # Our own agent batches its store writes into larger transactions
+    owns_agent = agent is None
+    if owns_agent:
+        agent = GrowthAgent(store=create_campaign_store("sqlite", batch_size=100))
+    latencies = []
+    succeeded = 0
+    failures = {}
+    
+    start = time.perf_counter()
+    try:
+        for outcome in agent.iter_campaigns_batch(projects, max_workers=max_workers):
+            latencies.append(outcome["latency_seconds"])
+            if outcome["error"] is not None:
+                failures[outcome["project_id"]] = outcome["error"]
+            else:
+                succeeded += 1
+            if on_result:
+                on_result(outcome)
+    finally:
+        # Runs even when on_result raises, so buffered store writes are not lost
+        if owns_agent:
+            agent.close()
+        else:
+            agent.store.flush()
+    elapsed = time.perf_counter() - start
+    
+    latencies.sort()
+    summary = {
+        "projects": len(latencies),
+        "succeeded": succeeded,
+        "failed": len(failures),
+        "failures": failures,
+        "elapsed_seconds": elapsed,
+        "projects_per_second": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "latency_p50_seconds": percentile(latencies, 50),
+        "latency_p99_seconds": percentile(latencies, 99)
+    }
+    
+    print(f"📦 Batch complete: {summary['succeeded']}/{summary['projects']} projects in {elapsed:.2f}s")
+    print(f"   Throughput: {summary['projects_per_second']:.1f} projects/sec")
+    print(f"   Latency p50: {summary['latency_p50_seconds'] * 1000:.1f} ms, p99: {summary['latency_p99_seconds'] * 1000:.1f} ms")
+    
+    return summary
 
 if __name__ == "__main__":
     # Test the growth agent
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Durable SQLite Job Queue
+Jobs survive process crashes: claimed jobs whose worker stopped renewing their
+lease are requeued, failures are retried, idempotency keys make enqueueing the
+same job twice a no-op, and checkpoints let a retried job skip side effects
+that already happened
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from instrumentation import percentile
+
+
+class JobQueue:
+    """SQLite-backed job queue with retries, idempotency keys and per-phase latency stats"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            idempotency_key TEXT NOT NULL UNIQUE,
+            campaign_id TEXT NOT NULL,
+            phase TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'queued',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL DEFAULT 3,
+            run_after REAL NOT NULL DEFAULT 0,
+            result TEXT,
+            error TEXT,
+            created_at REAL NOT NULL,
+            started_at REAL,
+            finished_at REAL,
+            lease_until REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_jobs_ready ON jobs (status, run_after, id);
+        CREATE INDEX IF NOT EXISTS idx_jobs_campaign ON jobs (campaign_id);
+        CREATE TABLE IF NOT EXISTS checkpoints (
+            key TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            created_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path: str = "aga_jobs.db", retry_delay: float = 1.0, lease_seconds: float = 300.0):
+        self.path = path
+        self.retry_delay = retry_delay
+        self.lease_seconds = lease_seconds  # a running job whose lease lapses is presumed lost
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "lease_until" not in columns:
+            # Queues created before leases; their running rows have no lease and count as stale
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN lease_until REAL")
+
+    def _enqueue_locked(self, phase: str, campaign_id: str, payload: Dict, idempotency_key: str,
+                        max_attempts: int, run_after: float) -> int:
+        self._conn.execute(
+            "INSERT OR IGNORE INTO jobs (idempotency_key, campaign_id, phase, payload, max_attempts, run_after, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (idempotency_key, campaign_id, phase, json.dumps(payload), max_attempts, run_after, time.time())
+        )
+        return self._conn.execute("SELECT id FROM jobs WHERE idempotency_key = ?", (idempotency_key,)).fetchone()[0]
+
+    def enqueue(self, phase: str, campaign_id: str, payload: Dict, idempotency_key: str,
+                max_attempts: int = 3, run_after: float = 0.0) -> int:
+        """Add a job; enqueueing an existing idempotency key returns the existing job's id"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                job_id = self._enqueue_locked(phase, campaign_id, payload, idempotency_key, max_attempts, run_after)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            return job_id
+
+    def claim(self) -> Optional[Dict]:
+        """Take the oldest ready job and mark it running under a lease of lease_seconds"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT id, idempotency_key, campaign_id, phase, payload, attempts FROM jobs "
+                    "WHERE status = 'queued' AND run_after <= ? ORDER BY run_after, id LIMIT 1",
+                    (now,)
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'running', attempts = attempts + 1, started_at = ?, lease_until = ? "
+                    "WHERE id = ?",
+                    (now, now + self.lease_seconds, row[0])
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return {
+            "id": row[0],
+            "idempotency_key": row[1],
+            "campaign_id": row[2],
+            "phase": row[3],
+            "payload": json.loads(row[4]),
+            "attempt": row[5] + 1
+        }
+
+    def complete(self, job_id: int, result: Dict, follow_ups: Optional[List[Dict]] = None) -> None:
+        """
+        Mark a job done and enqueue its follow-up jobs in the same transaction,
+        so a crash can never record the result without scheduling the next phase.
+        Each follow-up is a dict of enqueue() keyword arguments.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'done', result = ?, error = NULL, finished_at = ? WHERE id = ?",
+                    (json.dumps(result), time.time(), job_id)
+                )
+                for job in follow_ups or []:
+                    self._enqueue_locked(
+                        job["phase"], job["campaign_id"], job["payload"], job["idempotency_key"],
+                        job.get("max_attempts", 3), job.get("run_after", 0.0)
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def fail(self, job_id: int, error: str) -> str:
+        """Record a failure; the job is retried with backoff until max_attempts. Returns the new status."""
+        with self._lock:
+            attempts, max_attempts = self._conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if attempts < max_attempts:
+                status, run_after = "queued", time.time() + self.retry_delay * (2 ** (attempts - 1))
+            else:
+                status, run_after = "failed", 0.0
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, run_after = ?, finished_at = ? WHERE id = ?",
+                (status, error, run_after, time.time() if status == "failed" else None, job_id)
+            )
+            return status
+
+    def heartbeat(self, job_ids: List[int]) -> None:
+        """Extend the leases of running jobs a live worker still holds"""
+        if not job_ids:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE jobs SET lease_until = ? WHERE id = ? AND status = 'running'",
+                [(time.time() + self.lease_seconds, job_id) for job_id in job_ids]
+            )
+
+    def recover(self) -> Dict[str, int]:
+        """
+        Requeue running jobs whose lease has lapsed, leaving jobs live workers hold alone.
+        The lost run already counted as an attempt when it was claimed, so a job that
+        keeps crashing its worker is marked failed once it reaches max_attempts.
+        Returns how many jobs were requeued and failed.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                stale = "status = 'running' AND (lease_until IS NULL OR lease_until < ?)"
+                failed = self._conn.execute(
+                    f"UPDATE jobs SET status = 'failed', error = 'Worker lost: lease expired', finished_at = ?, "
+                    f"lease_until = NULL WHERE {stale} AND attempts >= max_attempts",
+                    (now, now)
+                ).rowcount
+                requeued = self._conn.execute(
+                    f"UPDATE jobs SET status = 'queued', started_at = NULL, lease_until = NULL, run_after = ? "
+                    f"WHERE {stale}",
+                    (now, now)
+                ).rowcount
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return {"requeued": requeued, "failed": failed}
+
+    def checkpoint(self, key: str, data) -> None:
+        """Record the outcome of a side effect (e.g. ad spend) so a retried job can reuse it"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)", (key, json.dumps(data), time.time())
+            )
+
+    def get_checkpoint(self, key: str):
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM checkpoints WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def clear_checkpoints(self, campaign_id: str) -> None:
+        """Drop a finished campaign's checkpoints (keys are prefixed with its campaign_id)"""
+        with self._lock:
+            # Every key starting "<campaign_id>:" sorts between it and "<campaign_id>;"
+            self._conn.execute("DELETE FROM checkpoints WHERE key >= ? AND key < ?",
+                               (f"{campaign_id}:", f"{campaign_id};"))
+
+    def get_result(self, idempotency_key: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM jobs WHERE idempotency_key = ? AND status = 'done'", (idempotency_key,)
+            ).fetchone()
+        return json.loads(row[0]) if row and row[0] is not None else None
+
+    def get_campaign_for_key(self, idempotency_key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT campaign_id FROM jobs WHERE idempotency_key = ?", (idempotency_key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def backlog(self) -> Dict[str, int]:
+        """Job counts by status"""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {"queued": 0, "running": 0, "done": 0, "failed": 0}
+        counts.update(dict(rows))
+        return counts
+
+    def count(self, status: str, phase: Optional[str] = None) -> int:
+        """Number of jobs in one status, optionally for one phase"""
+        sql, params = "SELECT COUNT(*) FROM jobs WHERE status = ?", [status]
+        if phase is not None:
+            sql, params = sql + " AND phase = ?", params + [phase]
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()[0]
+
+    def phase_latency(self) -> Dict[str, Dict]:
+        """Run time per phase for completed jobs: count, mean, p50 and p99 in seconds"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT phase, finished_at - started_at FROM jobs "
+                "WHERE status = 'done' AND started_at IS NOT NULL ORDER BY phase, 2"
+            ).fetchall()
+
+        durations = {}
+        for phase, seconds in rows:
+            durations.setdefault(phase, []).append(seconds)
+
+        return {
+            phase: {
+                "count": len(values),
+                "mean": sum(values) / len(values),
+                "p50": percentile(values, 50),
+                "p99": percentile(values, 99)
+            }
+            for phase, values in durations.items()
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
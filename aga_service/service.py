@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Autonomous Growth Agent (AGA) HTTP Service
+Long-running asyncio replacement for listener.js: webhooks queue campaign
+launches on a durable campaign scheduler and return immediately with the
+campaign_id; posted traction events feed each campaign's daily monitoring
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from campaign_scheduler import CampaignScheduler
+from campaign_store import DEFAULT_DB_PATH, SQLiteCampaignStore
+from growth_agent import GrowthAgent
+from job_queue import JobQueue
+from traction_ingest import SECONDS_PER_DAY, TractionAggregator
+
+STATUS_TEXT = {
+    200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 413: "Payload Too Large", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error", 503: "Service Unavailable"
+}
+
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str, unread_body: bool = False):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.unread_body = unread_body  # The request body is still on the connection
+
+
+class GrowthAgentService:
+    """
+    Routes HTTP requests to a CampaignScheduler and a TractionAggregator.
+
+    The aggregator is the agent's metrics source: each campaign's monitoring
+    days run as scheduled jobs day_interval seconds apart, and read the events
+    posted to /traction-webhook for that day.
+    """
+
+    def __init__(self, agent: Optional[GrowthAgent] = None, queue: Optional[JobQueue] = None,
+                 workers: int = 4, queue_size: int = 10000, max_projects: int = 10000,
+                 assets_root: Optional[str] = None, day_interval: float = SECONDS_PER_DAY):
+        self.agent = agent or GrowthAgent(store=SQLiteCampaignStore(DEFAULT_DB_PATH))
+        self.traction = TractionAggregator(self.agent.store)
+        self.agent.metrics_source = self.traction
+        self.scheduler = CampaignScheduler(agent=self.agent, queue=queue or JobQueue(), workers=workers,
+                                           day_interval=day_interval)
+        # Business plan paths from webhooks must resolve inside this directory
+        self.assets_root = os.path.realpath(assets_root or os.environ.get("FOUNDERX_ASSETS_ROOT", os.getcwd()))
+        self.project_campaigns = OrderedDict()  # project_id -> latest campaign_id, most recent last
+        self._projects_lock = threading.Lock()
+        self.max_projects = max_projects
+        self.queue_size = queue_size  # launches waiting for a worker before webhooks get a 503
+        self._tasks = []
+
+    async def start(self) -> None:
+        self.scheduler.start()
+        self._tasks = [asyncio.create_task(self._flush_traction())]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await asyncio.get_running_loop().run_in_executor(None, self.scheduler.stop)
+        self.traction.flush()
+        self.scheduler.queue.close()
+        self.agent.close()
+
+    async def _flush_traction(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.traction.flush_interval)
+            try:
+                await loop.run_in_executor(None, self.traction.flush)
+            except Exception as e:
+                # Unflushed windows stay in memory and go out with the next flush
+                print(f"❌ Traction flush failed: {e}")
+
+    # Handlers ---------------------------------------------------------------
+
+    def health(self) -> Tuple[int, Dict]:
+        return 200, {
+            "status": "healthy",
+            "service": "AGA Service",
+            "queued_campaigns": self.scheduler.queue.count("queued", "extract_targets"),
+            "timestamp": datetime.now().isoformat()
+        }
+
+    def webhook(self, body: Dict) -> Tuple[int, Dict]:
+        project_id = body.get("project_id")
+        if not project_id:
+            raise HTTPError(400, "project_id is required")
+
+        options = {
+            "deployment_url": body.get("deployment_url"),
+            "business_plan_path": self.resolve_plan_path(body.get("business_plan_path") or "Business_Plan.md")
+        }
+        if self.scheduler.queue.count("queued", "extract_targets") >= self.queue_size:
+            raise HTTPError(503, "Campaign queue is full, retry later")
+        # A redelivered webhook with the same idempotency_key gets the original campaign
+        campaign_id = self.scheduler.submit(project_id, options, body.get("idempotency_key"))
+
+        if campaign_id not in self.agent.campaigns:
+            self.agent.track_campaign(campaign_id, {"project_id": project_id, "campaign_id": campaign_id,
+                                                    "status": "queued"})
+        with self._projects_lock:
+            self.project_campaigns[project_id] = campaign_id
+            self.project_campaigns.move_to_end(project_id)
+            while len(self.project_campaigns) > self.max_projects:
+                self.project_campaigns.popitem(last=False)
+        return 202, {
+            "status": "success",
+            "message": "Growth campaign queued",
+            "project_id": project_id,
+            "campaign_id": campaign_id,
+            "estimated_completion": "7 days"
+        }
+
+    def resolve_plan_path(self, path) -> str:
+        """Absolute business plan path, refused unless it stays inside assets_root"""
+        if not isinstance(path, str) or "\0" in path:
+            raise HTTPError(400, "business_plan_path must be a string")
+        resolved = os.path.realpath(os.path.join(self.assets_root, path))
+        if os.path.commonpath([resolved, self.assets_root]) != self.assets_root:
+            raise HTTPError(400, "business_plan_path must be inside the assets directory")
+        return resolved
+
+    def traction_webhook(self, body: Dict) -> Tuple[int, Dict]:
+        events = body.get("events") if "events" in body else [body]
+        if not isinstance(events, list) or not events:
+            raise HTTPError(400, "events must be a non-empty list")
+
+        # Validate the whole batch first so a rejected request records nothing and can be retried
+        resolved = []
+        for event in events:
+            if not isinstance(event, dict):
+                raise HTTPError(400, "Each event must be an object")
+            if not event.get("event_type"):
+                raise HTTPError(400, "event_type is required")
+            if not event.get("campaign_id"):
+                campaign_id = self.latest_campaign_id(event.get("project_id"))
+                if campaign_id is None:
+                    raise HTTPError(404, f"No active campaign for project {event.get('project_id')}")
+                event = {**event, "campaign_id": campaign_id}
+            if not self.traction.is_registered(event["campaign_id"]):
+                raise HTTPError(404, f"Campaign {event['campaign_id']} is not being monitored")
+            resolved.append(event)
+
+        for event in resolved:
+            self.traction.submit(event)
+        return 200, {"status": "success", "message": "Traction event recorded", "events": len(resolved)}
+
+    def latest_campaign_id(self, project_id: Optional[str]) -> Optional[str]:
+        """Latest campaign for a project, falling back to the store once it has left project_campaigns"""
+        if not project_id:
+            return None
+        campaign_id = self.project_campaigns.get(project_id)
+        if campaign_id is None:
+            latest = self.agent.store.get_latest(project_id)
+            campaign_id = latest["campaign_id"] if latest else None
+        return campaign_id
+
+    def campaign_status(self, campaign_or_project_id: str) -> Tuple[int, Dict]:
+        status = self.agent.campaigns.get(campaign_or_project_id)
+        if status is None:
+            # Campaigns from earlier runs are looked up in the store, by campaign then project
+            stored = self.agent.store.get_campaign(campaign_or_project_id)
+            status = self.agent.store.get_status(stored["project_id"] if stored else campaign_or_project_id)
+        if status is None:
+            raise HTTPError(404, f"No campaign found for {campaign_or_project_id}")
+        return 200, status
+
+    async def route(self, method: str, path: str, body: Dict) -> Tuple[int, Dict]:
+        path = path.split("?", 1)[0].rstrip("/") or "/"
+        parts = path.strip("/").split("/")
+
+        # Handlers query SQLite, so they all run off the event loop
+        if path == "/health":
+            routed, handler = "GET", lambda: self.health()
+        elif path == "/webhook":
+            routed, handler = "POST", lambda: self.webhook(body)
+        elif path == "/traction-webhook":
+            routed, handler = "POST", lambda: self.traction_webhook(body)
+        elif len(parts) == 3 and parts[0] == "campaign" and parts[2] == "status":
+            routed, handler = "GET", lambda: self.campaign_status(parts[1])
+        else:
+            raise HTTPError(404, "Not found")
+
+        if method != routed:
+            raise HTTPError(405, f"{method} not allowed on {path}")
+        return await asyncio.get_running_loop().run_in_executor(None, handler)
+
+    # HTTP plumbing ----------------------------------------------------------
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request_line = await self._readline(reader)
+                    if not request_line:
+                        break
+                    try:
+                        method, path, version = request_line.decode("latin-1").split()
+                    except ValueError:
+                        raise HTTPError(400, "Malformed request line")
+
+                    headers = {}
+                    while True:
+                        line = await self._readline(reader)
+                        if line in (b"\r\n", b"\n", b""):
+                            break
+                        name, _, value = line.decode("latin-1").partition(":")
+                        headers[name.strip().lower()] = value.strip()
+                except HTTPError as e:
+                    await self._respond(writer, e.status, {"status": "error", "message": e.message}, False)
+                    break
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                status, payload, unread_body = await self._dispatch(reader, method, path, headers)
+                # A body that was never read leaves the connection unusable
+                keep_alive = keep_alive and not unread_body
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _readline(reader: asyncio.StreamReader) -> bytes:
+        """One request or header line; a line over the stream limit is a 431"""
+        try:
+            return await reader.readline()
+        except (ValueError, asyncio.LimitOverrunError):
+            # readline reports an overlong line as ValueError after discarding it
+            raise HTTPError(431, "Request line or header too large")
+
+    async def _dispatch(self, reader: asyncio.StreamReader, method: str, path: str,
+                        headers: Dict) -> Tuple[int, Dict, bool]:
+        try:
+            try:
+                length = int(headers.get("content-length", 0) or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                raise HTTPError(400, "Invalid Content-Length", unread_body=True)
+            if length > MAX_BODY_BYTES:
+                raise HTTPError(413, "Request body too large", unread_body=True)
+            body = {}
+            if length:
+                raw = await reader.readexactly(length)
+                try:
+                    body = json.loads(raw)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    raise HTTPError(400, "Invalid JSON body")
+                if not isinstance(body, dict):
+                    raise HTTPError(400, "JSON body must be an object")
+            return (*await self.route(method, path, body), False)
+        except HTTPError as e:
+            return e.status, {"status": "error", "message": e.message}, e.unread_body
+        except Exception as e:
+            print(f"❌ Error handling {method} {path}: {e}")
+            return 500, {"status": "error", "message": "Internal server error"}, False
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, payload: Dict, keep_alive: bool) -> None:
+        body = json.dumps(payload).encode()
+        head = (
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'Unknown')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        ).encode()
+        writer.write(head + body)
+        await writer.drain()
+
+
+async def serve(host: str = "0.0.0.0", port: int = 3001, workers: int = 4, queue_path: str = "aga_jobs.db",
+                day_interval: float = SECONDS_PER_DAY) -> None:
+    service = GrowthAgentService(queue=JobQueue(queue_path), workers=workers, day_interval=day_interval)
+    await service.start()
+    server = await asyncio.start_server(service.handle_connection, host, port)
+
+    print(f"🚀 AGA Service running on port {port}")
+    print(f"   Health check: http://localhost:{port}/health")
+    print(f"   Webhook endpoint: http://localhost:{port}/webhook")
+    print(f"   Traction webhook: http://localhost:{port}/traction-webhook")
+    print(f"   Campaign workers: {workers}")
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Autonomous Growth Agent HTTP service")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 3001)))
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent campaign jobs")
+    parser.add_argument("--queue", default="aga_jobs.db", help="Job queue database path")
+    parser.add_argument("--day-interval", type=float, default=SECONDS_PER_DAY,
+                        help="Seconds between monitoring days")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.queue, args.day_interval))
+    except KeyboardInterrupt:
+        print("\n👋 AGA Service stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Traction Event Ingestion for the Autonomous Growth Agent
+Batches signup/revenue/traffic events into per-campaign daily tumbling windows
+and periodically flushes them to the campaign store
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from campaign_store import CampaignStore, SQLiteCampaignStore
+
+SECONDS_PER_DAY = 86400
+
+# event_type -> index into a window's [signups, revenue, traffic] totals
+EVENT_FIELDS = {
+    "signup": 0,
+    "revenue": 1,
+    "purchase": 1,
+    "traffic": 2,
+    "visit": 2,
+    "pageview": 2
+}
+
+
+def _event_time(timestamp) -> float:
+    """Epoch seconds from a number, an ISO-8601 string or None (now)"""
+    if timestamp is None:
+        return time.time()
+    if isinstance(timestamp, str):
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    return float(timestamp)
+
+
+class TractionAggregator:
+    """
+    In-memory aggregation of traction events into (campaign_id, day) windows.
+
+    Events are buffered and folded into windows batch_size at a time; flush()
+    adds the window totals onto the store and clears them from memory. Days are
+    numbered from the campaign's registered start so they line up with
+    GrowthAgent.monitor_traction's day numbers. Starts are stored with the
+    campaign, so numbering survives restarts, and only the max_campaigns most
+    recent stay in memory. Events for unregistered or finished campaigns are
+    rejected. Only the SQLite store keeps traction aggregates, so other stores
+    are rejected up front.
+    """
+
+    def __init__(self, store: Optional[CampaignStore] = None, batch_size: int = 1000,
+                 flush_interval: float = 5.0, max_campaigns: int = 10000):
+        if store is not None and not isinstance(store, SQLiteCampaignStore):
+            raise ValueError(f"Traction aggregates need a SQLite campaign store, not {type(store).__name__}")
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_campaigns = max_campaigns
+        self._buffer = []
+        self._windows = {}  # (campaign_id, window) -> [signups, revenue, traffic]
+        self._start_windows = OrderedDict()  # campaign_id -> UTC day number of campaign day 1, most recent last
+        self._lock = threading.Lock()
+        self.events_ingested = 0
+        self.events_rejected = 0
+        self.windows_flushed = 0
+
+    def register_campaign(self, campaign_id: str, start_time: Optional[float] = None) -> None:
+        """Anchor day 1 of a campaign to its start time (default: now)"""
+        start_window = int(_event_time(start_time) // SECONDS_PER_DAY)
+        if self.store is not None:
+            self.store.set_traction_start(campaign_id, start_window)
+        with self._lock:
+            self._cache_start_locked(campaign_id, start_window)
+
+    def finish_campaign(self, campaign_id: str) -> None:
+        """Stop accepting events for a campaign whose monitoring has ended and drop its start from memory"""
+        if self.store is not None:
+            self.store.finish_traction(campaign_id)
+        with self._lock:
+            self._start_windows.pop(campaign_id, None)
+
+    def is_registered(self, campaign_id: str) -> bool:
+        """Whether events for campaign_id are currently accepted"""
+        with self._lock:
+            return self._start_window_locked(campaign_id) is not None
+
+    def _cache_start_locked(self, campaign_id: str, start_window: int) -> None:
+        self._start_windows[campaign_id] = start_window
+        self._start_windows.move_to_end(campaign_id)
+        while len(self._start_windows) > self.max_campaigns:
+            self._start_windows.popitem(last=False)
+
+    def _start_window_locked(self, campaign_id: str) -> Optional[int]:
+        """Start window from memory, falling back to the store for campaigns evicted or from an earlier run"""
+        start_window = self._start_windows.get(campaign_id)
+        if start_window is not None:
+            self._start_windows.move_to_end(campaign_id)
+            return start_window
+        stored = self.store.get_traction_start(campaign_id) if self.store is not None else None
+        if stored is None or stored[1]:
+            return None
+        self._cache_start_locked(campaign_id, stored[0])
+        return stored[0]
+
+    def submit(self, event: Dict) -> None:
+        """Queue one event; the buffer is aggregated once batch_size events are waiting"""
+        with self._lock:
+            self._buffer.append(event)
+            if len(self._buffer) >= self.batch_size:
+                self._aggregate_locked(self._buffer)
+                self._buffer = []
+
+    def ingest(self, events: Iterable[Dict]) -> None:
+        """Aggregate a batch of events immediately"""
+        with self._lock:
+            self._aggregate_locked(events)
+
+    def _aggregate_locked(self, events: Iterable[Dict]) -> None:
+        windows = self._windows
+        start_windows = self._start_windows
+        ingested = rejected = 0
+
+        for event in events:
+            field = EVENT_FIELDS.get(event.get("event_type"))
+            campaign_id = event.get("campaign_id")
+            if field is None or campaign_id is None:
+                rejected += 1
+                continue
+            if campaign_id not in start_windows and self._start_window_locked(campaign_id) is None:
+                rejected += 1
+                continue
+
+            try:
+                window = int(_event_time(event.get("timestamp")) // SECONDS_PER_DAY)
+                value = event.get("value", 1)
+                value = float(value) if field == 1 else int(value)
+            except (TypeError, ValueError):
+                rejected += 1
+                continue
+
+            totals = windows.get((campaign_id, window))
+            if totals is None:
+                totals = windows[(campaign_id, window)] = [0, 0.0, 0]
+            totals[field] += value
+            ingested += 1
+
+        self.events_ingested += ingested
+        self.events_rejected += rejected
+
+    def flush(self) -> int:
+        """Aggregate buffered events and write window totals to the store; returns windows written"""
+        with self._lock:
+            if self._buffer:
+                self._aggregate_locked(self._buffer)
+                self._buffer = []
+            if self.store is None or not self._windows:
+                return 0
+
+            rows = [
+                (campaign_id, window, totals[0], totals[1], totals[2])
+                for (campaign_id, window), totals in self._windows.items()
+            ]
+            self.store.add_traction_windows(rows)
+            self._windows = {}
+            self.windows_flushed += len(rows)
+            return len(rows)
+
+    def daily_metrics(self, campaign_id: str, day: int) -> Dict:
+        """
+        Aggregated metrics for day N (1-based) of a campaign, in monitor_traction's format.
+        Read-only: open windows are added to stored totals without flushing them.
+        """
+        with self._lock:
+            if self._buffer:
+                self._aggregate_locked(self._buffer)
+                self._buffer = []
+            start_window = self._start_windows.get(campaign_id)
+            if start_window is None and self.store is not None:
+                # Finished or evicted campaigns are still readable from the store
+                stored = self.store.get_traction_start(campaign_id)
+                start_window = stored[0] if stored else None
+            if start_window is None:
+                return {"day": day, "signups": 0, "revenue": 0.0, "traffic": 0}
+
+            window = start_window + day - 1
+            totals = list(self._windows.get((campaign_id, window), (0, 0.0, 0)))
+            # Read under the lock so a concurrent flush can't move a window between the two reads
+            if self.store is not None:
+                stored = self.store.get_traction_windows(campaign_id).get(window)
+                if stored:
+                    totals = [totals[i] + stored[i] for i in range(3)]
+
+        return {"day": day, "signups": totals[0], "revenue": totals[1], "traffic": totals[2]}
+
+    def stats(self) -> Dict:
+        return {
+            "events_ingested": self.events_ingested,
+            "events_rejected": self.events_rejected,
+            "buffered_events": len(self._buffer),
+            "open_windows": len(self._windows),
+            "active_campaigns": len(self._start_windows),
+            "windows_flushed": self.windows_flushed
+        }
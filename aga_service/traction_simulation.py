@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Vectorized Traction Simulation for capacity planning
+Runs the GrowthAgent mock campaign and monitoring model over whole arrays of
+campaigns at once, for what-if sweeps over budgets, thresholds and durations
+"""
+
+from typing import Dict, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for simulation sweeps
+    np = None
+
+DEFAULT_PLATFORMS = ("Google Search", "Facebook", "LinkedIn")
+DEFAULT_ALLOCATION = (40.0, 35.0, 25.0)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("traction_simulation requires NumPy (pip install numpy)")
+
+
+def simulate_campaigns(budgets, allocations=DEFAULT_ALLOCATION, durations=7,
+                       signup_threshold=50, revenue_threshold=500.0,
+                       platforms: Sequence[str] = DEFAULT_PLATFORMS, budget_limit=100.0) -> Dict:
+    """
+    Simulate N campaigns as array operations.
+
+    budgets: (N,) total budget per campaign
+    allocations: (P,) or (N, P) relative platform weights, normalized per campaign
+    durations: scalar or (N,) monitoring days per campaign
+    signup_threshold / revenue_threshold: scalar or (N,)
+    budget_limit: scalar or (N,) cap on each campaign's total budget, or None for no cap
+
+    Budgets over the limit are scaled down and truncated to cents as in
+    GrowthAgent.enforce_budget_limit. Platform metrics mirror
+    ad_platforms.mock_platform_results and daily metrics mirror
+    GrowthAgent.fetch_daily_metrics. Thresholds are checked against running
+    totals, as in GrowthAgent.iter_traction.
+    """
+    _require_numpy()
+
+    budgets = np.asarray(budgets, dtype=np.float64)
+    n = budgets.shape[0]
+
+    weights = np.broadcast_to(np.asarray(allocations, dtype=np.float64), (n, len(platforms)))
+    # Same operation order as GrowthAgent so float results (and their truncation) match
+    platform_budget = budgets[:, None] * weights / weights.sum(axis=1, keepdims=True)
+
+    if budget_limit is not None:
+        budget_limit = np.broadcast_to(np.asarray(budget_limit, dtype=np.float64), (n,))
+        total = platform_budget.sum(axis=1)
+        over = total > budget_limit
+        scale = np.where(over, budget_limit / np.where(over, total, 1.0), 1.0)
+        scaled = np.trunc(platform_budget * scale[:, None] * 100) / 100
+        platform_budget = np.where(over[:, None], scaled, platform_budget)
+
+    platform_spent = platform_budget * 0.85
+    platform_impressions = np.floor(platform_budget * 100).astype(np.int64)
+    platform_clicks = np.floor(platform_budget * 5).astype(np.int64)
+    platform_signups = np.floor(platform_budget * 0.3).astype(np.int64)
+    platform_revenue = platform_budget * 0.2
+
+    durations = np.broadcast_to(np.asarray(durations, dtype=np.int64), (n,))
+    max_days = int(durations.max()) if n else 0
+    days = np.arange(1, max_days + 1)
+    active = days[None, :] <= durations[:, None]  # (N, D) mask of monitored days
+
+    daily_signups = np.where(active, 8 + days * 2, 0)
+    daily_revenue = np.where(active, 25.0 + days * 5, 0.0)
+    daily_traffic = np.where(active, 150 + days * 20, 0)
+
+    cumulative_signups = np.cumsum(daily_signups, axis=1)
+    cumulative_revenue = np.cumsum(daily_revenue, axis=1)
+
+    signup_threshold = np.broadcast_to(np.asarray(signup_threshold), (n,))
+    revenue_threshold = np.broadcast_to(np.asarray(revenue_threshold, dtype=np.float64), (n,))
+    crossed = active & (
+        (cumulative_signups >= signup_threshold[:, None]) |
+        (cumulative_revenue >= revenue_threshold[:, None])
+    )
+    validated = crossed.any(axis=1)
+    validated_on_day = np.where(validated, crossed.argmax(axis=1) + 1, 0)
+
+    return {
+        "platforms": tuple(platforms),
+        "platform_spent": platform_spent,
+        "platform_impressions": platform_impressions,
+        "platform_clicks": platform_clicks,
+        "platform_signups": platform_signups,
+        "platform_revenue": platform_revenue,
+        "total_spent": platform_spent.sum(axis=1),
+        "total_signups": platform_signups.sum(axis=1),
+        "total_revenue": platform_revenue.sum(axis=1),
+        "daily_signups": daily_signups,
+        "daily_revenue": daily_revenue,
+        "daily_traffic": daily_traffic,
+        "monitoring_signups": cumulative_signups[:, -1] if max_days else np.zeros(n, dtype=np.int64),
+        "monitoring_revenue": cumulative_revenue[:, -1] if max_days else np.zeros(n),
+        "traction_validated": validated,
+        "validated_on_day": validated_on_day,
+        "final_status": np.where(validated, "traction_validated", "traction_failed")
+    }
+
+
+def summarize_sweep(simulation: Dict) -> Dict:
+    """Portfolio-level summary of a simulate_campaigns run"""
+    _require_numpy()
+
+    validated = simulation["traction_validated"]
+    total_signups = simulation["total_signups"]
+    total_spent = simulation["total_spent"]
+    days = simulation["validated_on_day"][validated]
+    return {
+        "campaigns": int(validated.shape[0]),
+        "validated": int(validated.sum()),
+        "validation_rate": float(validated.mean()) if validated.size else 0.0,
+        "mean_validation_day": float(days.mean()) if days.size else None,
+        "total_spent": float(total_spent.sum()),
+        "cost_per_signup": float(total_spent.sum() / max(1, int(total_signups.sum())))
+    }
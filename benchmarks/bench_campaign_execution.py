@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sequential vs concurrent platform execution in GrowthAgent
+Uses the local stand-in platform adapter so no real ad APIs are called
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'aga_service'))
+
+from ad_platforms import LocalPlatformAdapter
+from growth_agent import GrowthAgent
+
+
+def time_mode(agent: GrowthAgent, ad_copies, mode: str, runs: int) -> float:
+    """Average wall time of execute_campaign in the given mode"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(runs):
+            agent.execute_campaign(f"bench_{i}", ad_copies, mode=mode)
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark campaign execution modes")
+    parser.add_argument("--latency", type=float, default=0.2, help="Per-platform latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.05, help="Random extra latency in seconds")
+    parser.add_argument("--runs", type=int, default=5, help="Campaigns per mode")
+    args = parser.parse_args()
+
+    adapter = LocalPlatformAdapter(latency=args.latency, jitter=args.jitter, seed=42)
+    agent = GrowthAgent(platform_adapter=adapter)
+    ad_copies = agent.generate_ad_copies(agent.get_target_data())
+
+    sequential = time_mode(agent, ad_copies, "sequential", args.runs)
+    concurrent = time_mode(agent, ad_copies, "concurrent", args.runs)
+
+    print(f"📊 {len(ad_copies)} platforms, {args.latency}s latency, {args.runs} runs")
+    print(f"   Sequential: {sequential * 1000:.1f} ms/campaign")
+    print(f"   Concurrent: {concurrent * 1000:.1f} ms/campaign")
+    print(f"   Speedup: {sequential / concurrent:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
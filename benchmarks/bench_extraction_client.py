@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: one request per extraction vs the coalescing, micro-batching client
+Runs against the local fake extraction server, so no real NLP/LLM service is called
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from extraction_client import ExtractionClient, FakeExtractionServer, HTTPExtractionBackend, mock_backend
+
+
+def generate_requests(count: int, distinct: int, seed: int):
+    """(namespace, content) requests over `distinct` business plans, with repeats"""
+    rng = random.Random(seed)
+    plans = [f"# Business Plan {i}\n\n" + "Market analysis and go-to-market strategy.\n" * 50
+             for i in range(distinct)]
+    namespaces = ["growth_target", "fir_business"]
+    return [(rng.choice(namespaces), rng.choice(plans)) for _ in range(count)]
+
+
+def run(server: FakeExtractionServer, requests, callers: int, extract) -> float:
+    server.calls = server.documents = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        list(executor.map(lambda request: extract(*request), requests))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched extraction against the fake server")
+    parser.add_argument("--requests", type=int, default=2000, help="Extraction requests")
+    parser.add_argument("--distinct", type=int, default=500, help="Distinct business plans")
+    parser.add_argument("--callers", type=int, default=64, help="Concurrent calling threads")
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake server seconds per call")
+    parser.add_argument("--per-document", type=float, default=0.002, help="Fake server seconds per document")
+    parser.add_argument("--server-concurrency", type=int, default=4, help="Fake server calls served at once")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--concurrency", type=int, default=4, help="Client in-flight batches")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    requests = generate_requests(args.requests, args.distinct, args.seed)
+    server = FakeExtractionServer(mock_backend(), latency=args.latency, per_document=args.per_document,
+                                  max_concurrency=args.server_concurrency).start()
+    backend = HTTPExtractionBackend(server.url)
+
+    try:
+        direct = run(server, requests, args.callers, lambda ns, content: backend.extract_batch([(ns, content)])[0])
+        direct_calls = server.calls
+
+        with ExtractionClient(backend, max_batch_size=args.batch_size, max_concurrency=args.concurrency) as client:
+            batched = run(server, requests, args.callers, client.extract)
+            stats = client.stats()
+        batched_calls = server.calls
+    finally:
+        server.stop()
+
+    print(f"📊 {args.requests} requests over {args.distinct} plans from {args.callers} threads "
+          f"({args.latency * 1000:.0f} ms + {args.per_document * 1000:.0f} ms/doc per call, "
+          f"{args.server_concurrency} calls at once)")
+    print(f"   One call per request: {direct:.2f}s, {direct_calls} server calls "
+          f"({args.requests / direct:,.0f} requests/sec)")
+    print(f"   Batched client: {batched:.2f}s, {batched_calls} server calls "
+          f"({args.requests / batched:,.0f} requests/sec)")
+    print(f"   Coalesced: {stats['coalesced']}, mean batch size {stats['mean_batch_size']:.1f}")
+    print(f"   Speedup: {direct / batched:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: score, growth and FIR stages individually and end to end
+Runs every case at each asset count in a fresh process, records throughput,
+per-asset latency and peak RSS, and flags regressions against a stored baseline
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..', 'scripts'))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..', 'aga_service'))
+
+from fixtures import PROFILES, copy_projects, generate_projects
+from instrumentation import percentile
+
+CASES = ('score', 'growth', 'monitor', 'fir', 'pipeline')
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'bench_baseline.json')
+
+
+def time_each(items, func) -> List[float]:
+    """Per-item wall time of func(index, item)"""
+    latencies = []
+    for i, item in enumerate(items):
+        start = time.perf_counter()
+        func(i, item)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def run_case(case: str, fixture_dirs: List[str], workers: int, repeat: int = 3, min_time: float = 0.5) -> Dict:
+    """
+    Run one case (in a fresh process) at least repeat times and for at least
+    min_time seconds, and measure the fastest run, so warmup and scheduler noise
+    on tiny runs do not count. Every run works on its own untimed copy of the
+    fixtures, so reports and launch results written by one case or run never
+    feed another.
+    """
+    from campaign_store import create_campaign_store
+    from fir_generator import FIRGenerator
+    from growth_agent import GrowthAgent
+    from instrumentation import configure
+    from pipeline import Pipeline
+    from score_calculator import generate_quality_report, read_sast_report
+
+    configure(log_mode='silent')
+    baseline_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    def run_once(tmp: str, project_dirs: List[str]) -> List[float]:
+        """Per-asset latencies of one run"""
+        if case == 'score':
+            return time_each(project_dirs, lambda i, d: generate_quality_report(
+                read_sast_report(os.path.join(d, 'sast_report.json')),
+                os.path.join(d, 'Code_Quality_Report.md'), verbose=False))
+
+        if case in ('growth', 'monitor'):
+            agent = GrowthAgent(store=create_campaign_store("sqlite", os.path.join(tmp, "bench.db"), batch_size=100))
+            try:
+                if case == 'growth':
+                    return time_each(project_dirs, lambda i, d: agent.launch_campaign(
+                        f"bench_{i}", {'business_plan_path': os.path.join(d, 'Business_Plan.md')}))
+                return time_each(project_dirs, lambda i, d: agent.monitor_traction(f"bench_{i}"))
+            finally:
+                agent.close()
+
+        if case == 'fir':
+            return time_each(project_dirs, lambda i, d: FIRGenerator(asset_dir=d).generate_fir_mandate(
+                verbose=False))
+
+        if case == 'pipeline':
+            pipeline = Pipeline(workers, os.path.join(tmp, "pipeline.db"), force=True)
+            try:
+                outcomes = pipeline.run(project_dirs)
+            finally:
+                pipeline.close()
+            failed = sum(1 for stages in outcomes.values() for o in stages.values() if o['status'] != 'ran')
+            if failed:
+                raise RuntimeError(f"{failed} pipeline stages did not run")
+            # Per-project latency is the time its stages spent running
+            return [sum(o['seconds'] for o in stages.values()) for stages in outcomes.values()]
+
+        raise ValueError(f"Unknown case: {case}")
+
+    best = None
+    with tempfile.TemporaryDirectory(prefix="founderx_bench_") as tmp:
+        runs = 0
+        spent = 0.0  # Timed seconds only; copying fixtures does not count towards min_time
+        while runs < repeat or spent < min_time:
+            work = os.path.join(tmp, f"run_{runs}")
+            project_dirs = copy_projects(fixture_dirs, os.path.join(work, "projects"))
+            start = time.perf_counter()
+            latencies = run_once(work, project_dirs)
+            elapsed = time.perf_counter() - start
+            shutil.rmtree(work)
+            runs += 1
+            spent += elapsed
+            if best is None or elapsed < best[0]:
+                best = (elapsed, sorted(latencies))
+
+    elapsed, latencies = best
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # KB on Linux
+    return {
+        'assets': len(fixture_dirs),
+        'runs': runs,
+        'seconds': elapsed,
+        'throughput': len(fixture_dirs) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p95_ms': percentile(latencies, 95) * 1000,
+        'max_ms': latencies[-1] * 1000 if latencies else 0.0,
+        'peak_rss_mb': peak_rss_kb / 1024,
+        'rss_growth_mb': (peak_rss_kb - baseline_rss_kb) / 1024
+    }
+
+
+def run_isolated(case: str, fixture_dirs: List[str], workers: int, repeat: int, min_time: float) -> Dict:
+    """run_case in a spawned process so peak RSS belongs to this case alone"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(run_case, case, fixture_dirs, workers, repeat, min_time).result()
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    """Cases whose throughput fell or peak RSS grew by more than tolerance"""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if result['throughput'] < base['throughput'] * (1 - tolerance):
+            regressions.append(f"{key}: throughput {base['throughput']:,.1f} -> {result['throughput']:,.1f} assets/sec")
+        if result['peak_rss_mb'] > base['peak_rss_mb'] * (1 + tolerance):
+            regressions.append(f"{key}: peak RSS {base['peak_rss_mb']:.1f} -> {result['peak_rss_mb']:.1f} MB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the score, growth and FIR pipeline")
+    parser.add_argument("--cases", default=','.join(CASES), help=f"Comma-separated cases ({', '.join(CASES)})")
+    parser.add_argument("--sizes", default="1,1000", help="Comma-separated asset counts, e.g. 1,1000,100000")
+    parser.add_argument("--profiles", default="small", help=f"Comma-separated fixture sizes ({', '.join(PROFILES)})")
+    parser.add_argument("--fixtures-dir", default=os.path.join(tempfile.gettempdir(), "founderx_bench_fixtures"),
+                        help="Where fixtures are generated and reused between runs")
+    parser.add_argument("--workers", type=int, default=8, help="Pipeline worker threads")
+    parser.add_argument("--repeat", type=int, default=3, help="Minimum runs per case; the fastest is recorded")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Minimum seconds spent per case")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed throughput drop / RSS growth (0.2 = 20%%)")
+    parser.add_argument("--output", default=None, help="Also write this run's results to a JSON file")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    cases = [case.strip() for case in args.cases.split(',') if case.strip()]
+    profiles = [profile.strip() for profile in args.profiles.split(',') if profile.strip()]
+    if any(case not in CASES for case in cases) or any(profile not in PROFILES for profile in profiles):
+        parser.error(f"--cases must be a list of {', '.join(CASES)} and --profiles of {', '.join(PROFILES)}")
+    sizes = [int(size) for size in args.sizes.split(',')]
+
+    results = {}
+    for profile in profiles:
+        for size in sizes:
+            start = time.perf_counter()
+            project_dirs = generate_projects(args.fixtures_dir, size, profile, args.seed)
+            print(f"🧪 {size:,} {profile} assets ready in {time.perf_counter() - start:.1f}s")
+
+            for case in cases:
+                key = f"{case}/{profile}/{size}"
+                result = results[key] = run_isolated(case, project_dirs, args.workers, args.repeat, args.min_time)
+                print(f"   {key}: {result['throughput']:,.1f} assets/sec | p50 {result['p50_ms']:.2f} ms, "
+                      f"p95 {result['p95_ms']:.2f} ms, max {result['max_ms']:.2f} ms | "
+                      f"peak RSS {result['peak_rss_mb']:.1f} MB")
+
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Baseline saved to {args.baseline}")
+        return
+
+    try:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print(f"ℹ️  No baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+
+    host = {key: report[key] for key in ('python', 'machine', 'cpus')}
+    recorded_on = {key: baseline.get(key) for key in host}
+    if recorded_on != host:
+        print(f"⚠️  Baseline was recorded on {recorded_on}, this run is {host}; "
+              f"absolute numbers may not be comparable")
+    regressions = compare(results, baseline['results'], args.tolerance)
+    if regressions:
+        print(f"❌ {len(regressions)} regressions beyond {args.tolerance:.0%}:")
+        for regression in regressions:
+            print(f"   {regression}")
+        sys.exit(1)
+    print(f"✅ No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: replay synthetic traction events through the ingestion pipeline
+Reports events/sec for batching + window aggregation and for flushing to SQLite
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'aga_service'))
+
+from campaign_store import SQLiteCampaignStore
+from traction_ingest import SECONDS_PER_DAY, TractionAggregator
+
+
+def generate_events(count: int, campaigns: int, days: int, seed: int):
+    """Synthetic event log spread over campaigns and days, in arrival order"""
+    rng = random.Random(seed)
+    start = time.time() - days * SECONDS_PER_DAY
+    event_types = ["traffic"] * 8 + ["signup"] + ["revenue"]
+    events = []
+    for i in range(count):
+        event_type = rng.choice(event_types)
+        events.append({
+            "campaign_id": f"bench_{rng.randrange(campaigns)}",
+            "event_type": event_type,
+            "value": round(rng.uniform(5, 100), 2) if event_type == "revenue" else 1,
+            "timestamp": start + i * (days * SECONDS_PER_DAY / count)
+        })
+    return events
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark traction event ingestion")
+    parser.add_argument("--events", type=int, default=500000)
+    parser.add_argument("--campaigns", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    events = generate_events(args.events, args.campaigns, args.days, args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteCampaignStore(os.path.join(tmp, "bench.db"))
+        aggregator = TractionAggregator(store, batch_size=args.batch_size)
+        for i in range(args.campaigns):
+            aggregator.register_campaign(f"bench_{i}", events[0]["timestamp"])
+
+        start = time.perf_counter()
+        for event in events:
+            aggregator.submit(event)
+        ingest_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        windows = aggregator.flush()
+        flush_time = time.perf_counter() - start
+
+        stats = aggregator.stats()
+        store.close()
+
+    total = ingest_time + flush_time
+    print(f"📊 {args.events:,} events across {args.campaigns} campaigns x {args.days} days")
+    print(f"   Ingest + aggregate: {ingest_time:.3f}s ({args.events / ingest_time:,.0f} events/sec)")
+    print(f"   Flush {windows:,} windows: {flush_time:.3f}s")
+    print(f"   End to end: {args.events / total:,.0f} events/sec")
+    print(f"   Ingested: {stats['events_ingested']:,}, rejected: {stats['events_rejected']:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vectorized traction simulation vs the per-campaign GrowthAgent loop
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'aga_service'))
+
+from growth_agent import GrowthAgent
+from traction_simulation import DEFAULT_ALLOCATION, DEFAULT_PLATFORMS, simulate_campaigns, summarize_sweep
+
+
+def run_loop(budgets, durations):
+    """Current path: one execute_campaign + monitor_traction call per campaign"""
+    agent = GrowthAgent()
+    weight_total = sum(DEFAULT_ALLOCATION)
+    results = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i, (budget, duration) in enumerate(zip(budgets, durations)):
+            ad_copies = [
+                {"platform": platform, "budget_allocation": budget * weight / weight_total}
+                for platform, weight in zip(DEFAULT_PLATFORMS, DEFAULT_ALLOCATION)
+            ]
+            campaign = agent.execute_campaign(f"sim_{i}", ad_copies)
+            monitoring = agent.monitor_traction(f"sim_{i}", duration, stop_early=False)
+            results.append((campaign["total_signups"], monitoring["validated_on_day"] or 0))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vectorized traction simulation")
+    parser.add_argument("--campaigns", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    budgets = [rng.uniform(50, 500) for _ in range(args.campaigns)]
+    durations = [rng.randint(1, 14) for _ in range(args.campaigns)]
+
+    start = time.perf_counter()
+    loop_results = run_loop(budgets, durations)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    simulation = simulate_campaigns(budgets, durations=durations)
+    vector_time = time.perf_counter() - start
+
+    mismatches = sum(
+        1 for i, (signups, day) in enumerate(loop_results)
+        if signups != simulation["total_signups"][i] or day != simulation["validated_on_day"][i]
+    )
+
+    summary = summarize_sweep(simulation)
+    print(f"📊 {args.campaigns} campaigns")
+    print(f"   Loop:       {loop_time:.3f}s ({args.campaigns / loop_time:,.0f} campaigns/sec)")
+    print(f"   Vectorized: {vector_time:.3f}s ({args.campaigns / vector_time:,.0f} campaigns/sec)")
+    print(f"   Speedup: {loop_time / vector_time:.1f}x, mismatches: {mismatches}")
+    print(f"   Validation rate: {summary['validation_rate']:.1%}, cost per signup: ${summary['cost_per_signup']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Synthetic pipeline fixtures for benchmarks
+Writes project directories holding a SAST report, business plan, HCL report (with
+its sidecar) and AGA results, laid out the way the pipeline and FIR portfolio expect
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from result_models import AGAResult, CampaignResult, DailyMetrics, MonitoringResult
+
+# Bump when fixture content changes so cached fixture directories are rebuilt
+FIXTURE_VERSION = 1
+MARKER_NAME = '.fixtures.json'
+
+# Per-asset fixture sizes: SAST hotspots, business plan sections, HCL contributions, monitored days
+PROFILES = {
+    'small': {'hotspots': 10, 'plan_sections': 4, 'contributions': 5, 'days': 7},
+    'medium': {'hotspots': 200, 'plan_sections': 20, 'contributions': 10, 'days': 30},
+    'large': {'hotspots': 5000, 'plan_sections': 100, 'contributions': 25, 'days': 90}
+}
+
+PLATFORMS = ["Google Search", "Facebook", "LinkedIn"]
+
+
+def sast_report(i: int, rng: random.Random, hotspots: int) -> Dict:
+    """SonarQube-style report in the shape score_calculator reads"""
+    return {
+        'projectName': f"bench_project_{i}",
+        'analysisDate': "2026-01-15T10:30:00Z",
+        'technicalDebtHours': round(rng.uniform(0.5, 80), 1),
+        'vulnerabilities': rng.randrange(30),
+        'codeSmells': rng.randrange(200),
+        'coverage': round(rng.uniform(10, 95), 1),
+        'duplications': round(rng.uniform(0, 25), 1),
+        'linesOfCode': rng.randrange(1000, 50000),
+        'files': rng.randrange(10, 400),
+        'complexity': {'cyclomatic': round(rng.uniform(1, 30), 1), 'cognitive': round(rng.uniform(1, 30), 1)},
+        'security': {'critical': rng.randrange(3), 'major': rng.randrange(5),
+                     'minor': rng.randrange(10), 'info': rng.randrange(20)},
+        'reliability': {'bugs': rng.randrange(20), 'reliabilityRating': rng.choice("ABCDE")},
+        'hotspots': [{'file': f"src/module_{j}.py", 'debt': round(rng.uniform(0, 5), 1),
+                      'vulnerabilities': rng.randrange(4)} for j in range(hotspots)]
+    }
+
+
+def business_plan(i: int, rng: random.Random, sections: int) -> str:
+    lines = [f"# Business Plan - Bench Project {i}", "", f"**Company:** Bench {i}  ", ""]
+    for s in range(sections):
+        lines += [f"## Section {s}", "",
+                  f"Market segment {rng.randrange(1000)} grows {rng.randrange(5, 60)}% a year; "
+                  f"customers spend {rng.randrange(10, 90)}+ hours on planning.", ""]
+    return "\n".join(lines)
+
+
+def hcl_report(i: int, rng: random.Random, contributions: int):
+    """(Markdown report, hcl_checker sidecar)"""
+    hours = round(rng.uniform(1, 40), 1)
+    lines = [f"# Human Contribution Log (HCL) - MVP bench_{i}", "",
+             f"**Curator:** Curator {i}  ", f"Total Time Spent: {hours} hours  ", "",
+             f"## {contributions} Non-Trivial Contributions:", ""]
+    for c in range(contributions):
+        lines += [f"{c + 1}. **Refactored module_{rng.randrange(100)}**",
+                  "   - What was changed and why", ""]
+    sidecar = {'sidecar_version': 1, 'curator': f"Curator {i}", 'time_spent': hours,
+               'contributions': contributions, 'validated': True}
+    return "\n".join(lines), sidecar
+
+
+def aga_results(i: int, rng: random.Random, days: int) -> Dict:
+    """launch_campaign results for one project"""
+    campaign_id = f"bench{i:08d}"
+    platforms = {}
+    for platform in PLATFORMS:
+        impressions = rng.randrange(1000, 10000)
+        clicks = impressions * rng.randrange(1, 8) // 100
+        signups = clicks * rng.randrange(2, 10) // 100
+        platforms[platform] = {'budget_spent': round(rng.uniform(10, 40), 2), 'impressions': impressions,
+                               'clicks': clicks, 'signups': signups, 'revenue': round(signups * 0.7, 2),
+                               'ctr': round(clicks / impressions * 100, 2), 'conversion_rate': 6.0}
+    campaign = CampaignResult(campaign_id, "2026-01-15T10:30:00", platforms, {},
+                              round(sum(p['budget_spent'] for p in platforms.values()), 2),
+                              sum(p['signups'] for p in platforms.values()),
+                              round(sum(p['revenue'] for p in platforms.values()), 2))
+    daily = [DailyMetrics(day, rng.randrange(20), float(rng.randrange(100)), rng.randrange(500))
+             for day in range(1, days + 1)]
+    monitoring = MonitoringResult(campaign_id, f"{days} days", daily, days,
+                                  sum(d.signups for d in daily), sum(d.revenue for d in daily),
+                                  None, "traction_failed")
+    return AGAResult(f"bench_{i}", campaign_id, campaign, monitoring,
+                     target_data={}, ad_copies=[], budget_reallocation={},
+                     traction_validated=False, completion_time="2026-01-22T10:30:00").to_dict()
+
+
+def write_project(directory: str, i: int, profile: Dict, seed: int) -> None:
+    rng = random.Random(seed * 1000003 + i)
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, 'sast_report.json'), 'w') as f:
+        json.dump(sast_report(i, rng, profile['hotspots']), f)
+    with open(os.path.join(directory, 'Business_Plan.md'), 'w') as f:
+        f.write(business_plan(i, rng, profile['plan_sections']))
+    report, sidecar = hcl_report(i, rng, profile['contributions'])
+    with open(os.path.join(directory, 'HCL_Report.md'), 'w') as f:
+        f.write(report)
+    with open(os.path.join(directory, 'HCL_Report.json'), 'w') as f:
+        json.dump(sidecar, f)
+    with open(os.path.join(directory, 'AGAResults.json'), 'w') as f:
+        json.dump(aga_results(i, rng, profile['days']), f)
+
+
+def generate_projects(root: str, count: int, profile: str = 'small', seed: int = 42) -> List[str]:
+    """
+    Project directories <root>/<profile>_<count>/project_<i>, reused when a previous
+    run already generated the same fixtures
+    """
+    base = os.path.join(root, f"{profile}_{count}")
+    dirs = [os.path.join(base, f"project_{i:06d}") for i in range(count)]
+    spec = {'version': FIXTURE_VERSION, 'count': count, 'profile': PROFILES[profile], 'seed': seed}
+
+    marker = os.path.join(base, MARKER_NAME)
+    try:
+        with open(marker, 'r') as f:
+            if json.load(f) == spec:
+                return dirs
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    for i, directory in enumerate(dirs):
+        write_project(directory, i, PROFILES[profile], seed)
+    with open(marker, 'w') as f:
+        json.dump(spec, f)
+    return dirs
+
+
+def copy_projects(project_dirs: List[str], dest: str) -> List[str]:
+    """Fresh copies of project directories under dest, so runs never see each other's outputs"""
+    copies = []
+    for directory in project_dirs:
+        copy = os.path.join(dest, os.path.basename(directory))
+        shutil.copytree(directory, copy)
+        copies.append(copy)
+    return copies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic pipeline fixtures")
+    parser.add_argument('root', help="Fixture root directory")
+    parser.add_argument('--count', type=int, default=1000, help="Project directories to generate")
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='small', help="Per-asset fixture size")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    dirs = generate_projects(args.root, args.count, args.profile, args.seed)
+    print(f"🧪 {len(dirs)} {args.profile} projects in {os.path.dirname(dirs[0]) if dirs else args.root}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Load test for the AGA HTTP service (aga_service/service.py)
+Opens keep-alive connections and reports requests/sec and tail latency
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from instrumentation import percentile
+
+
+def post(host, path, payload):
+    body = json.dumps(payload).encode()
+    return (
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode() + body
+
+
+async def exchange(reader, writer, request):
+    """Send one request on a keep-alive connection; returns (status line, body)"""
+    writer.write(request)
+    await writer.drain()
+
+    status_line = await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+    return status_line, await reader.readexactly(length)
+
+
+async def launch_campaign(host, reader, writer, client_id):
+    """Queue a campaign and wait until the service accepts traction events for it"""
+    _, body = await exchange(reader, writer, post(host, "/webhook", {"project_id": f"LOAD_{client_id}"}))
+    campaign_id = json.loads(body)["campaign_id"]
+    while True:
+        _, body = await exchange(reader, writer,
+                                 f"GET /campaign/{campaign_id}/status HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+        if json.loads(body).get("status") != "queued":
+            return campaign_id
+        await asyncio.sleep(0.05)
+
+
+async def client(host, port, endpoint, requests, latencies, errors, client_id):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        if endpoint == "traction":
+            campaign_id = await launch_campaign(host, reader, writer, client_id)
+        for i in range(requests):
+            if endpoint == "webhook":
+                request = post(host, "/webhook", {"project_id": f"LOAD_{client_id}_{i}"})
+            elif endpoint == "traction":
+                request = post(host, "/traction-webhook", {"campaign_id": campaign_id, "event_type": "signup"})
+            else:
+                request = f"GET /health HTTP/1.1\r\nHost: {host}\r\n\r\n".encode()
+
+            start = time.perf_counter()
+            status_line, _ = await exchange(reader, writer, request)
+            latencies.append(time.perf_counter() - start)
+
+            if not status_line.split()[1].startswith(b"2"):
+                errors.append(status_line.decode().strip())
+    finally:
+        writer.close()
+
+
+async def run(args):
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        client(args.host, args.port, args.endpoint, args.requests // args.concurrency, latencies, errors, c)
+        for c in range(args.concurrency)
+    ])
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"📊 {len(latencies)} {args.endpoint} requests over {args.concurrency} connections in {elapsed:.2f}s")
+    print(f"   Throughput: {len(latencies) / elapsed:,.0f} requests/sec")
+    print(f"   Latency p50: {percentile(latencies, 50) * 1000:.2f} ms, "
+          f"p99: {percentile(latencies, 99) * 1000:.2f} ms, max: {latencies[-1] * 1000:.2f} ms")
+    print(f"   Errors: {len(errors)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the AGA HTTP service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument("--endpoint", choices=["health", "webhook", "traction"], default="webhook")
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Append-only Column Store
+A table kept as one flat binary file per column plus an append-only dictionary
+for each string column. Reads go through mmap, a zero-copy NumPy memmap when NumPy is
+installed and a typed memoryview otherwise, so scans touch only the columns they use.
+"""
+
+import json
+import mmap
+import os
+from array import array
+from typing import Dict, Iterable, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # Only needed for vectorized scans
+    np = None
+
+
+class ColumnTable:
+    """
+    Columns are named with array typecodes. Dictionary columns store strings as
+    'I' codes into <name>.dict, one JSON string per line, only ever appended to.
+    """
+
+    def __init__(self, directory: str, columns: Dict[str, str], dictionaries: Sequence[str] = ()):
+        self.directory = directory
+        self.columns = {name: ('I' if name in dictionaries else typecode) for name, typecode in columns.items()}
+        os.makedirs(directory, exist_ok=True)
+        self.dictionaries = {name: self._load_dictionary(name) for name in dictionaries}
+        self.codes = {name: {value: i for i, value in enumerate(values)}
+                      for name, values in self.dictionaries.items()}
+        self._saved = {name: len(values) for name, values in self.dictionaries.items()}
+        self._views = {}
+        self._repair()
+
+    def _path(self, column: str) -> str:
+        return os.path.join(self.directory, f"{column}.col")
+
+    def _dictionary_path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.dict")
+
+    def _load_dictionary(self, name: str) -> List[str]:
+        try:
+            with open(self._dictionary_path(name), 'r') as f:
+                return [json.loads(line) for line in f if line.endswith('\n')]
+        except FileNotFoundError:
+            return []
+
+    def _save_dictionary(self, name: str) -> None:
+        """Append entries added since the last save, one JSON string per line"""
+        values = self.dictionaries[name]
+        with open(self._dictionary_path(name), 'a') as f:
+            f.writelines(json.dumps(value) + '\n' for value in values[self._saved[name]:])
+        self._saved[name] = len(values)
+
+    def _column_rows(self, column: str) -> int:
+        try:
+            return os.path.getsize(self._path(column)) // array(self.columns[column]).itemsize
+        except FileNotFoundError:
+            return 0
+
+    def _repair(self) -> None:
+        """
+        Truncate every column to the shortest one and every dictionary to its last
+        complete line, dropping a row or entry half-written by a crash
+        """
+        for name in self.dictionaries:
+            self._truncate_partial_line(self._dictionary_path(name))
+        rows = min(self._column_rows(column) for column in self.columns)
+        for column, typecode in self.columns.items():
+            size = rows * array(typecode).itemsize
+            path = self._path(column)
+            if not os.path.exists(path):
+                open(path, 'wb').close()
+            elif os.path.getsize(path) != size:
+                os.truncate(path, size)
+
+    @staticmethod
+    def _truncate_partial_line(path: str, block: int = 4096) -> None:
+        """Cut a file back to just after its last newline so the next append starts a fresh line"""
+        try:
+            with open(path, 'rb+') as f:
+                size = end = f.seek(0, os.SEEK_END)
+                while end > 0:
+                    start = max(0, end - block)
+                    f.seek(start)
+                    newline = f.read(end - start).rfind(b'\n')
+                    if newline != -1:
+                        end = start + newline + 1
+                        break
+                    end = start
+                if end != size:
+                    f.truncate(end)
+        except FileNotFoundError:
+            pass
+
+    def __len__(self) -> int:
+        return self._column_rows(next(iter(self.columns)))
+
+    def encode(self, name: str, value: str) -> int:
+        """Code for a dictionary value, adding it if new (saved on the next append)"""
+        code = self.codes[name].get(value)
+        if code is None:
+            code = self.codes[name][value] = len(self.dictionaries[name])
+            self.dictionaries[name].append(value)
+        return code
+
+    def decode(self, name: str, code: int) -> str:
+        return self.dictionaries[name][int(code)]
+
+    def append_rows(self, rows: Iterable[Dict]) -> int:
+        """Append rows of column -> value; missing values are stored as 0. Returns rows written."""
+        buffers = {column: array(typecode) for column, typecode in self.columns.items()}
+        for row in rows:
+            for column, typecode in self.columns.items():
+                value = row.get(column)
+                if column in self.dictionaries:
+                    value = self.encode(column, value)
+                elif typecode in 'fd':
+                    value = float(value or 0)
+                else:
+                    value = int(value or 0)
+                buffers[column].append(value)
+
+        written = len(next(iter(buffers.values())))
+        if not written:
+            return 0
+        # Dictionaries are written first so every stored code always resolves
+        for name, values in self.dictionaries.items():
+            if len(values) != self._saved[name]:
+                self._save_dictionary(name)
+        for column, values in buffers.items():
+            with open(self._path(column), 'ab') as f:
+                values.tofile(f)
+        self._views.clear()
+        return written
+
+    def column(self, name: str):
+        """Read-only view of a column: a NumPy memmap when available, else a typed memoryview"""
+        view = self._views.get(name)
+        if view is None:
+            rows = len(self)
+            typecode = self.columns[name]
+            if rows == 0:
+                view = np.zeros(0, dtype=typecode) if np is not None else memoryview(array(typecode))
+            elif np is not None:
+                view = np.memmap(self._path(name), dtype=np.dtype(typecode), mode='r', shape=(rows,))
+            else:
+                with open(self._path(name), 'rb') as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                view = memoryview(mapped)[:rows * array(typecode).itemsize].cast(typecode)
+            self._views[name] = view
+        return view
+
+    def row(self, i: int) -> Dict:
+        row = {}
+        for name, typecode in self.columns.items():
+            value = self.column(name)[i]
+            if name in self.dictionaries:
+                row[name] = self.decode(name, value)
+            else:
+                row[name] = float(value) if typecode in 'fd' else int(value)
+        return row
+
+
+def group_sum(codes, values, groups: int) -> List[float]:
+    """Sum values per integer code in [0, groups), vectorized when NumPy is available"""
+    if np is not None:
+        return np.bincount(codes, weights=values, minlength=groups).tolist()
+    totals = [0.0] * groups
+    for code, value in zip(codes, values):
+        totals[code] += value
+    return totals
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Multi-Factor AI Debt Score Model
+Table-driven weighted scoring over SAST report fields. The same factor table
+scores one report in plain Python or a whole portfolio as NumPy array operations.
+"""
+
+import json
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # Only needed for vectorized portfolio scoring
+    np = None
+
+# Raw features extracted from a SAST report, in column order for portfolio matrices
+FEATURES = (
+    'technicalDebtHours', 'vulnerabilities',
+    'security.critical', 'security.major', 'security.minor', 'security.info',
+    'complexity.cyclomatic', 'complexity.cognitive',
+    'reliability.bugs', 'codeSmells', 'duplications', 'coverageGap'
+)
+
+# Normalizers a term can be divided by
+NORMALIZERS = ('none', 'kloc', 'file')
+
+# Each factor's value is sum(coefficient * feature / normalizer) over its terms;
+# its penalty is min(value / cap, 1) and it costs up to weight * 100 points.
+DEFAULT_SCORING_CONFIG = {
+    'hourly_rate': 85,
+    'factors': [
+        {
+            'name': 'technical_debt',
+            'label': 'Technical Debt',
+            'weight': 0.30,
+            'cap': 10.0,  # debt hours per 1,000 lines of code
+            'terms': [['technicalDebtHours', 1.0, 'kloc']]
+        },
+        {
+            'name': 'security',
+            'label': 'Security',
+            'weight': 0.25,
+            'cap': 20.0,  # severity-weighted vulnerabilities per 1,000 lines
+            'terms': [
+                ['security.critical', 10.0, 'kloc'],
+                ['security.major', 5.0, 'kloc'],
+                ['security.minor', 1.0, 'kloc'],
+                ['security.info', 0.0, 'kloc']
+            ]
+        },
+        {
+            'name': 'complexity',
+            'label': 'Complexity',
+            'weight': 0.15,
+            'cap': 1.0,
+            'terms': [
+                ['complexity.cyclomatic', 1 / 60, 'none'],  # 30 cyclomatic -> half the cap
+                ['complexity.cognitive', 1 / 50, 'none']  # 25 cognitive -> half the cap
+            ]
+        },
+        {
+            'name': 'reliability',
+            'label': 'Reliability',
+            'weight': 0.15,
+            'cap': 10.0,  # bugs per 1,000 lines
+            'terms': [['reliability.bugs', 1.0, 'kloc']]
+        },
+        {
+            'name': 'maintainability',
+            'label': 'Maintainability',
+            'weight': 0.15,
+            'cap': 1.0,
+            'terms': [
+                ['codeSmells', 1 / 6, 'file'],  # 2 smells per file -> a third of the cap
+                ['duplications', 1 / 60, 'none'],  # 20% duplication -> a third
+                ['coverageGap', 1 / 300, 'none']  # 0% coverage -> a third
+            ]
+        }
+    ]
+}
+
+
+def load_scoring_config(path: Optional[str] = None) -> Dict:
+    """Scoring config from a JSON file, or the default config"""
+    if not path:
+        return DEFAULT_SCORING_CONFIG
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def extract_features(sast_data: Dict) -> Dict[str, float]:
+    """Flatten the SAST fields the model uses, plus its normalizers"""
+    security = sast_data.get('security')
+    complexity = sast_data.get('complexity') or {}
+    reliability = sast_data.get('reliability') or {}
+    vulnerabilities = sast_data.get('vulnerabilities', 0) or 0
+
+    if not security:
+        # Without a severity breakdown, count every vulnerability as major
+        security = {'major': vulnerabilities}
+
+    lines_of_code = sast_data.get('linesOfCode') or 0
+    files = sast_data.get('files') or 0
+    return {
+        'technicalDebtHours': float(sast_data.get('technicalDebtHours', 0) or 0),
+        'vulnerabilities': float(vulnerabilities),
+        'security.critical': float(security.get('critical', 0) or 0),
+        'security.major': float(security.get('major', 0) or 0),
+        'security.minor': float(security.get('minor', 0) or 0),
+        'security.info': float(security.get('info', 0) or 0),
+        'complexity.cyclomatic': float(complexity.get('cyclomatic', 0) or 0),
+        'complexity.cognitive': float(complexity.get('cognitive', 0) or 0),
+        'reliability.bugs': float(reliability.get('bugs', 0) or 0),
+        'codeSmells': float(sast_data.get('codeSmells', 0) or 0),
+        'duplications': float(sast_data.get('duplications', 0) or 0),
+        'coverageGap': max(0.0, 100.0 - float(sast_data.get('coverage', 0) or 0)),
+        # Small or unknown projects are normalized as at least 1 KLOC / 1 file
+        'kloc': max(lines_of_code / 1000.0, 1.0),
+        'file': float(max(files, 1)),
+        'none': 1.0
+    }
+
+
+def score_report(sast_data: Dict, config: Optional[Dict] = None) -> Dict:
+    """AI Debt Score and per-factor breakdown for one report"""
+    config = config or DEFAULT_SCORING_CONFIG
+    features = extract_features(sast_data)
+
+    breakdown = {}
+    points_lost = 0.0
+    for factor in config['factors']:
+        value = sum(coefficient * features[feature] / features[per]
+                    for feature, coefficient, per in factor['terms'])
+        penalty = min(value / factor['cap'], 1.0) if factor['cap'] > 0 else 0.0
+        lost = factor['weight'] * penalty * 100
+        points_lost += lost
+        breakdown[factor['name']] = {
+            'label': factor.get('label', factor['name']),
+            'value': round(value, 3),
+            'penalty': round(penalty, 3),
+            'weight': factor['weight'],
+            'points_lost': round(lost, 1)
+        }
+
+    return {
+        'ai_debt_score': round(max(0.0, 100.0 - points_lost), 1),
+        'breakdown': breakdown
+    }
+
+
+def _coefficient_matrix(config: Dict):
+    """(features x normalizers, factors) coefficient matrix for the factor table"""
+    columns = {(feature, per): i for i, (feature, per) in
+               enumerate((f, p) for f in FEATURES for p in NORMALIZERS)}
+    matrix = np.zeros((len(columns), len(config['factors'])))
+    for k, factor in enumerate(config['factors']):
+        for feature, coefficient, per in factor['terms']:
+            matrix[columns[(feature, per)], k] += coefficient
+    return matrix
+
+
+def score_portfolio(reports: Sequence[Dict], config: Optional[Dict] = None) -> Dict:
+    """
+    Score many reports at once. Returns 'ai_debt_score' (N,) and per-factor
+    'values' and 'penalties' (N, K) arrays plus the factor names, using NumPy
+    when available.
+    """
+    config = config or DEFAULT_SCORING_CONFIG
+    names = [factor['name'] for factor in config['factors']]
+
+    if np is None:
+        scored = [score_report(report, config) for report in reports]
+        return {
+            'factors': names,
+            'ai_debt_score': [s['ai_debt_score'] for s in scored],
+            'values': [[s['breakdown'][name]['value'] for name in names] for s in scored],
+            'penalties': [[s['breakdown'][name]['penalty'] for name in names] for s in scored]
+        }
+
+    if not reports:
+        empty = np.zeros((0, len(names)))
+        return {'factors': names, 'ai_debt_score': np.zeros(0), 'values': empty, 'penalties': empty}
+
+    rows = [extract_features(report) for report in reports]
+    features = np.array([[row[f] for f in FEATURES] for row in rows]).reshape(len(rows), len(FEATURES))
+    norms = np.array([[row[p] for p in NORMALIZERS] for row in rows]).reshape(len(rows), len(NORMALIZERS))
+
+    # Every feature divided by every normalizer, flattened to match the coefficient matrix rows
+    expanded = (features[:, :, None] / norms[:, None, :]).reshape(len(rows), -1)
+    values = expanded @ _coefficient_matrix(config)
+
+    caps = np.array([factor['cap'] for factor in config['factors']], dtype=np.float64)
+    weights = np.array([factor['weight'] for factor in config['factors']])
+    penalties = np.where(caps > 0, np.minimum(values / np.where(caps > 0, caps, 1.0), 1.0), 0.0)
+    scores = np.maximum(0.0, 100.0 - (penalties * weights).sum(axis=1) * 100).round(1)
+
+    return {'factors': names, 'ai_debt_score': scores, 'values': values, 'penalties': penalties}
+
+
+def score_reports(reports: Sequence[Dict], config: Optional[Dict] = None) -> List[Dict]:
+    """
+    score_report's result for each report, computed in one score_portfolio pass.
+    Values can differ from score_report's in the last rounded digit when a sum
+    lands on a rounding boundary, since the matrix product adds terms in another order.
+    """
+    config = config or DEFAULT_SCORING_CONFIG
+    portfolio = score_portfolio(reports, config)
+    # Plain floats row by row; indexing NumPy arrays per element costs more than the scoring
+    columns = [portfolio[key].tolist() if np is not None else portfolio[key]
+               for key in ('ai_debt_score', 'values', 'penalties')]
+    factors = [(factor['name'], factor.get('label', factor['name']), factor['weight']) for factor in config['factors']]
+
+    results = []
+    for score, values, penalties in zip(*columns):
+        breakdown = {
+            name: {
+                'label': label,
+                'value': round(value, 3),
+                'penalty': round(penalty, 3),
+                'weight': weight,
+                'points_lost': round(weight * penalty * 100, 1)
+            }
+            for (name, label, weight), value, penalty in zip(factors, values, penalties)
+        }
+        results.append({'ai_debt_score': round(score, 1), 'breakdown': breakdown})
+    return results
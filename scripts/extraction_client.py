@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Business Plan Extraction Client
+Pluggable NLP/LLM extraction shared by the growth agent and the FIR generator.
+Concurrent requests for the same document share one in-flight call (single-flight),
+different documents are micro-batched into one backend call (a batch the backend
+rejects because of its documents is retried per document), and a bounded queue
+plus a cap on in-flight batches apply backpressure to callers.
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+from instrumentation import log, metrics, span
+
+Document = Tuple[str, str]  # (namespace, content)
+
+
+class ExtractionBackend:
+    """Extracts structured data from many documents in one call"""
+
+    def extract_batch(self, documents: List[Document]) -> List[Dict]:
+        raise NotImplementedError
+
+    def is_document_error(self, error: Exception) -> bool:
+        """
+        Whether a failed batch may have been rejected because of one of its documents,
+        so retrying them one at a time can save the rest. Transport errors and timeouts
+        would only fail again per document.
+        """
+        return isinstance(error, ValueError) and not isinstance(error, json.JSONDecodeError)
+
+    def describe(self) -> str:
+        return type(self).__name__
+
+
+class LocalExtractionBackend(ExtractionBackend):
+    """Runs an extractor function per namespace in-process (the current mock extraction)"""
+
+    def __init__(self, extractors: Optional[Dict[str, Callable[[str], Dict]]] = None):
+        self.extractors = dict(extractors or {})
+
+    def register(self, namespace: str, extractor: Callable[[str], Dict]) -> None:
+        self.extractors[namespace] = extractor
+
+    def extract_batch(self, documents: List[Document]) -> List[Dict]:
+        results = []
+        for namespace, content in documents:
+            extractor = self.extractors.get(namespace)
+            if extractor is None:
+                raise ValueError(f"No extractor for namespace: {namespace}")
+            results.append(extractor(content))
+        return results
+
+    def describe(self) -> str:
+        return f"local ({', '.join(sorted(self.extractors))})"
+
+
+class HTTPExtractionBackend(ExtractionBackend):
+    """POSTs {"documents": [{"namespace", "content"}]} and expects {"results": [...]} in the same order"""
+
+    def __init__(self, url: str, timeout: float = 60.0):
+        self.url = url
+        self.timeout = timeout
+
+    def extract_batch(self, documents: List[Document]) -> List[Dict]:
+        body = json.dumps({"documents": [{"namespace": ns, "content": content} for ns, content in documents]})
+        request = urllib.request.Request(self.url, data=body.encode(), method="POST",
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            results = json.loads(response.read())["results"]
+        if len(results) != len(documents):
+            raise ValueError(f"Expected {len(documents)} results, got {len(results)}")
+        return results
+
+    def is_document_error(self, error: Exception) -> bool:
+        # 4xx means the request was refused; 408 and 429 are about the server, not the documents
+        if isinstance(error, urllib.error.HTTPError):
+            return 400 <= error.code < 500 and error.code not in (408, 429)
+        return super().is_document_error(error)
+
+    def describe(self) -> str:
+        return f"http ({self.url})"
+
+
+class ExtractionClient:
+    """
+    Thread-safe front end for an ExtractionBackend.
+
+    A dispatcher thread collects queued documents for up to max_wait seconds or
+    max_batch_size documents, then runs the batch on a pool of max_concurrency
+    workers. When every worker is busy the dispatcher stops draining the queue,
+    and once max_pending documents are queued extract() blocks.
+    """
+
+    def __init__(self, backend: ExtractionBackend, max_batch_size: int = 16, max_wait: float = 0.005,
+                 max_concurrency: int = 4, max_pending: int = 1024):
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._inflight = {}  # (namespace, content hash) -> Future shared by every caller
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="extraction")
+        self._dispatcher = threading.Thread(target=self._dispatch, name="extraction-dispatcher", daemon=True)
+        self._closed = False
+        self.requests = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.documents = 0
+        self._dispatcher.start()
+
+    def submit(self, namespace: str, content: str) -> Future:
+        """Future for the extraction of one document, shared with identical pending requests"""
+        key = (namespace, hashlib.sha256(content.encode()).hexdigest())
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ExtractionClient is closed")
+            self.requests += 1
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future
+            future = self._inflight[key] = Future()
+
+        self._queue.put((key, namespace, content, future))  # Blocks while the queue is full
+        return future
+
+    def extract(self, namespace: str, content: str, timeout: Optional[float] = None) -> Dict:
+        """Extracted data for one document; each caller gets its own copy"""
+        return copy.deepcopy(self.submit(namespace, content).result(timeout))
+
+    def extractor(self, namespace: str, fallback: Optional[Callable[[str], Dict]] = None) -> Callable[[str], Dict]:
+        """A content -> data function for PlanCache.get, using fallback when the backend fails"""
+        def extract(content: str) -> Dict:
+            try:
+                return self.extract(namespace, content)
+            except Exception as e:
+                if fallback is None:
+                    raise
+                log(f"⚠️  {namespace} extraction failed ({e}), using local extraction",
+                    "extraction_fallback", namespace=namespace, error=str(e))
+                metrics.inc("founderx_extraction_fallbacks_total", labels={"namespace": namespace})
+                return fallback(content)
+        return extract
+
+    def _dispatch(self) -> None:
+        closing = False
+        while not closing:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+
+            self._slots.acquire()
+            self._executor.submit(self._run_batch, batch)
+
+    def _extract(self, batch: List[Tuple]) -> List[Tuple[Optional[Dict], Optional[Exception]]]:
+        """
+        (result, error) per document. A batch rejected because of its documents is
+        retried one document at a time; any other failure (a timeout, a dropped
+        connection) fails the whole batch at once so callers fall back promptly.
+        """
+        try:
+            with span("extraction.batch"):
+                results = self.backend.extract_batch([(namespace, content) for _, namespace, content, _ in batch])
+            metrics.inc("founderx_extraction_batches_total", labels={"status": "ok"})
+            return [(result, None) for result in results]
+        except Exception as e:
+            metrics.inc("founderx_extraction_batches_total", labels={"status": "failed"})
+            if len(batch) == 1 or not self.backend.is_document_error(e):
+                return [(None, e)] * len(batch)
+        # One bad document must not fail the unrelated callers batched with it
+        return [outcome for item in batch for outcome in self._extract([item])]
+
+    def _run_batch(self, batch: List[Tuple]) -> None:
+        outcomes = self._extract(batch)
+        with self._lock:
+            self.batches += 1
+            self.documents += len(batch)
+            for key, _, _, _ in batch:
+                self._inflight.pop(key, None)
+        self._slots.release()
+
+        metrics.inc("founderx_extraction_documents_total", len(batch))
+        for (_, _, _, future), (result, error) in zip(batch, outcomes):
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    def close(self) -> None:
+        """Finish queued work and stop the dispatcher and workers"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(None)
+        self._dispatcher.join()
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "batches": self.batches,
+            "documents": self.documents,
+            "mean_batch_size": self.documents / self.batches if self.batches else 0.0
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _ExtractionHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # Many concurrent callers in one-request-per-extraction mode
+
+
+class FakeExtractionServer:
+    """
+    Local stand-in for a remote extraction service, for measuring batching offline.
+    Each call costs latency seconds plus per_document seconds per document, like
+    a model endpoint with a fixed round trip and batched inference, and at most
+    max_concurrency calls are served at once, like a rate-limited deployment.
+    """
+
+    def __init__(self, backend: ExtractionBackend, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.05, per_document: float = 0.002, max_concurrency: int = 4):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                documents = [(doc["namespace"], doc["content"]) for doc in body.get("documents", [])]
+                with server._slots:
+                    time.sleep(server.latency + server.per_document * len(documents))
+                try:
+                    status, payload = 200, {"results": server.backend.extract_batch(documents)}
+                except ValueError as e:
+                    status, payload = 400, {"error": str(e)}
+                with server._lock:
+                    server.calls += 1
+                    server.documents += len(documents)
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.backend = backend
+        self.latency = latency
+        self.per_document = per_document
+        self._slots = threading.Semaphore(max_concurrency)
+        self.calls = 0
+        self.documents = 0
+        self._lock = threading.Lock()
+        self.httpd = _ExtractionHTTPServer((host, port), Handler)
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/extract"
+
+    def start(self) -> 'FakeExtractionServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fake-extraction", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def get_extraction_client() -> Optional[ExtractionClient]:
+    """
+    Process-wide client for the service at FOUNDERX_EXTRACTION_URL, or None to
+    keep the in-process mock extraction
+    """
+    global _shared_client
+    url = os.environ.get("FOUNDERX_EXTRACTION_URL")
+    if not url:
+        return None
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = ExtractionClient(HTTPExtractionBackend(url))
+        return _shared_client
+
+
+def mock_backend() -> LocalExtractionBackend:
+    """The growth agent and FIR generator mock extractors, as the fake server serves them"""
+    # Imported here: both modules import this one
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'aga_service'))
+    from campaign_store import create_campaign_store
+    from fir_generator import FIRGenerator
+    from growth_agent import GrowthAgent
+
+    return LocalExtractionBackend({
+        "growth_target": GrowthAgent(store=create_campaign_store("json")).extract_target_data,
+        "fir_business": FIRGenerator().parse_business_plan
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the fake extraction server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3002)
+    parser.add_argument("--latency", type=float, default=0.05, help="Fixed seconds per call")
+    parser.add_argument("--per-document", type=float, default=0.002, help="Extra seconds per document")
+    parser.add_argument("--max-concurrency", type=int, default=4, help="Calls served at once")
+    args = parser.parse_args()
+
+    backend = mock_backend()
+    server = FakeExtractionServer(backend, args.host, args.port, args.latency, args.per_document,
+                                  args.max_concurrency)
+    print(f"🤖 Fake extraction server on {server.url} ({backend.describe()})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,35 +4,60 @@ Founder-in-Residence (FIR) Profile Generator
 Synthesizes all asset data into a comprehensive leadership mandate
 """
 
+import argparse
+import glob
 import json
 import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from extraction_client import ExtractionClient, get_extraction_client
+from instrumentation import LOG_MODES, configure, log, metrics, timed
+from plan_cache import PlanCache, get_plan_cache
+from report_templates import render, timestamp
+from result_models import AGAResult, QualityResult
+from sidecars import read_sidecar
+
+# Source files every asset directory is expected to contain
+DATA_SOURCES = {
+    'business_plan': 'Business_Plan.md',
+    'hcl_report': 'HCL_Report.md',
+    'quality_report': 'Code_Quality_Report.md',
+    'aga_results': 'AGAResults.json'
+}
+
+_loader_pool = None
+
+def get_loader_pool() -> ThreadPoolExecutor:
+    """Per-process thread pool that reads an asset's sources concurrently"""
+    global _loader_pool
+    if _loader_pool is None:
+        _loader_pool = ThreadPoolExecutor(max_workers=len(DATA_SOURCES), thread_name_prefix="fir-loader")
+    return _loader_pool
+
 class FIRGenerator:
-    def __init__(self):
-        self.data_sources = {
-            'business_plan': 'Business_Plan.md',
-            'hcl_report': 'HCL_Report.md',
-            'quality_report': 'Code_Quality_Report.md',
-            'aga_results': 'AGAResults.json'
-        }
+    # Bump when parse_business_plan's output changes so cached extractions are not reused
+    BUSINESS_PLAN_VERSION = "1"
     
+    def __init__(self, plan_cache: Optional[PlanCache] = None, asset_dir: str = ".",
+                 extraction_client: Optional[ExtractionClient] = None):
+        self.plan_cache = plan_cache or get_plan_cache()
+        self.extraction_client = extraction_client or get_extraction_client()
+        self.asset_dir = asset_dir
+        self.data_sources = {name: os.path.join(asset_dir, filename) if asset_dir != "." else filename
+                             for name, filename in DATA_SOURCES.items()}
+    
+    @timed("fir.load_business_plan")
     def load_business_plan(self) -> Dict:
         """Load and parse business plan data"""
         try:
-            with open(self.data_sources['business_plan'], 'r') as f:
-                content = f.read()
-            
-            # Mock parsing - in real implementation, this would use NLP/LLM
-            return {
-                "market_size": "$50B+",
-                "target_market": "Small business owners and entrepreneurs",
-                "competition": ["Traditional consulting", "Template services"],
-                "value_proposition": "AI-powered business plan generation",
-                "business_model": "SaaS subscription",
-                "revenue_projection": "$1M ARR in 18 months"
-            }
+            extractor = (self.extraction_client.extractor("fir_business", fallback=self.parse_business_plan)
+                         if self.extraction_client else self.parse_business_plan)
+            return self.plan_cache.get(self.data_sources['business_plan'], "fir_business", extractor,
+                                       self.BUSINESS_PLAN_VERSION)
         except FileNotFoundError:
             return {
                 "market_size": "Large market",
@@ -43,13 +68,37 @@ class FIRGenerator:
                 "revenue_projection": "$1M ARR"
             }
     
+    def parse_business_plan(self, content: str) -> Dict:
+        """Parse business plan content (cached by load_business_plan)"""
+        
+        # Mock parsing - in real implementation, this would use NLP/LLM
+        return {
+            "market_size": "$50B+",
+            "target_market": "Small business owners and entrepreneurs",
+            "competition": ["Traditional consulting", "Template services"],
+            "value_proposition": "AI-powered business plan generation",
+            "business_model": "SaaS subscription",
+            "revenue_projection": "$1M ARR in 18 months"
+        }
+    
+    @timed("fir.load_hcl_report")
     def load_hcl_report(self) -> Dict:
-        """Load Human Contribution Log data"""
+        """Load Human Contribution Log data, preferring the hcl_checker sidecar"""
+        sidecar = read_sidecar(self.data_sources['hcl_report'])
+        if sidecar is not None:
+            validated = sidecar.get('validated', True)
+            return {
+                "curator": sidecar.get('curator', "Unknown Curator"),
+                "time_spent": str(sidecar.get('time_spent', "2.0")),
+                "ip_status": "Defensible" if validated else "Pending",
+                "human_contribution": "Confirmed" if validated else "Required"
+            }
+        
         try:
             with open(self.data_sources['hcl_report'], 'r') as f:
                 content = f.read()
             
-            # Extract key information
+            # Fallback: extract key information from the Markdown
             lines = content.split('\n')
             curator = "Unknown Curator"
             time_spent = "2.0"
@@ -58,7 +107,10 @@ class FIRGenerator:
                 if "Curator:" in line:
                     curator = line.split("Curator:")[1].strip()
                 elif "Total Time Spent:" in line:
-                    time_spent = line.split("Total Time Spent:")[1].strip()
+                    # Bare hours, as hcl_checker.sh writes them ("3.5 hours" -> "3.5")
+                    match = re.search(r'[0-9.]+', line.split("Total Time Spent:")[1])
+                    if match:
+                        time_spent = match.group()
             
             return {
                 "curator": curator,
@@ -74,13 +126,18 @@ class FIRGenerator:
                 "human_contribution": "Required"
             }
     
-    def load_quality_report(self) -> Dict:
-        """Load code quality and liability data"""
+    @timed("fir.load_quality_report")
+    def load_quality_report(self) -> QualityResult:
+        """Load code quality and liability data, preferring the score_calculator sidecar"""
+        sidecar = read_sidecar(self.data_sources['quality_report'])
+        if sidecar is not None and 'ai_debt_score' in sidecar:
+            return QualityResult.from_dict(sidecar)
+        
         try:
             with open(self.data_sources['quality_report'], 'r') as f:
                 content = f.read()
             
-            # Extract AI Debt Score from the report
+            # Fallback: extract AI Debt Score from the Markdown report
             lines = content.split('\n')
             ai_debt_score = 75.0
             human_cost = 0.0
@@ -93,56 +150,43 @@ class FIRGenerator:
                     cost_text = line.split("Estimated Human Remediation Cost:")[1].strip()
                     human_cost = float(cost_text.replace('*', '').replace('$', '').replace(',', '').strip())
             
-            return {
-                "ai_debt_score": ai_debt_score,
-                "human_cost": human_cost,
-                "quality_status": "Good" if ai_debt_score >= 75 else "Needs Improvement",
-                "technical_risk": "Low" if ai_debt_score >= 80 else "Medium" if ai_debt_score >= 60 else "High"
-            }
+            return QualityResult(ai_debt_score, human_cost)
         except FileNotFoundError:
-            return {
-                "ai_debt_score": 0.0,
-                "human_cost": 0.0,
-                "quality_status": "Unknown",
-                "technical_risk": "Unknown"
-            }
+            return QualityResult(assessed=False)
     
-    def load_aga_results(self) -> Dict:
-        """Load Autonomous Growth Agent results"""
+    @timed("fir.load_aga_results")
+    def load_aga_results(self) -> AGAResult:
+        """Load Autonomous Growth Agent results (totals live under campaign_results)"""
         try:
-            with open(self.data_sources['aga_results'], 'r') as f:
-                return json.load(f)
+            return AGAResult.load(self.data_sources['aga_results'])
         except FileNotFoundError:
-            return {
-                "traction_validated": False,
-                "total_signups": 0,
-                "total_revenue": 0.0,
-                "campaign_success": "Failed"
-            }
+            return AGAResult.empty()
     
-    def generate_executive_summary(self, business_data: Dict, quality_data: Dict, aga_data: Dict) -> str:
+    @timed("fir.generate_executive_summary")
+    def generate_executive_summary(self, business_data: Dict, quality_data: QualityResult, aga_data: AGAResult) -> str:
         """Generate executive summary for the FIR mandate"""
         
-        traction_status = "validated" if aga_data.get('traction_validated', False) else "pending"
-        quality_score = quality_data.get('ai_debt_score', 0)
+        traction_status = "validated" if aga_data.traction_validated else "pending"
+        quality_score = quality_data.ai_debt_score
         
         summary = f"""This validated MVP represents a {business_data['business_model']} opportunity in the {business_data['target_market']} market, estimated at {business_data['market_size']}. 
 
-The technical foundation shows {'excellent' if quality_score >= 80 else 'good' if quality_score >= 60 else 'acceptable'} code quality (AI Debt Score: {quality_score}/{100}), with {'minimal' if quality_data.get('human_cost', 0) < 1000 else 'manageable'} technical debt requiring ${quality_data.get('human_cost', 0):.0f} in remediation costs.
+The technical foundation shows {'excellent' if quality_score >= 80 else 'good' if quality_score >= 60 else 'acceptable'} code quality (AI Debt Score: {quality_score}/{100}), with {'minimal' if quality_data.human_cost < 1000 else 'manageable'} technical debt requiring ${quality_data.human_cost:.0f} in remediation costs.
 
-Market validation is {'complete' if traction_status == 'validated' else 'ongoing'}, with the autonomous growth campaign {'successfully demonstrating' if traction_status == 'validated' else 'attempting to establish'} product-market fit through {aga_data.get('total_signups', 0)} signups and ${aga_data.get('total_revenue', 0):.0f} in early revenue.
+Market validation is {'complete' if traction_status == 'validated' else 'ongoing'}, with the autonomous growth campaign {'successfully demonstrating' if traction_status == 'validated' else 'attempting to establish'} product-market fit through {aga_data.total_signups} signups and ${aga_data.total_revenue:.0f} in early revenue.
 
-The ideal Founder-in-Residence must combine {'technical leadership' if quality_score < 70 else 'scaling expertise'} with deep {'enterprise sales' if 'B2B' in business_data.get('target_market', '') else 'growth marketing'} experience to navigate the challenges of {'technical debt management' if quality_score < 70 else 'rapid scaling'} while {'fixing growth channels' if not aga_data.get('traction_validated', False) else 'capitalizing on proven traction'}."""
+The ideal Founder-in-Residence must combine {'technical leadership' if quality_score < 70 else 'scaling expertise'} with deep {'enterprise sales' if 'B2B' in business_data.get('target_market', '') else 'growth marketing'} experience to navigate the challenges of {'technical debt management' if quality_score < 70 else 'rapid scaling'} while {'fixing growth channels' if not aga_data.traction_validated else 'capitalizing on proven traction'}."""
         
         return summary
     
-    def generate_core_missions(self, business_data: Dict, quality_data: Dict, aga_data: Dict) -> List[str]:
+    @timed("fir.generate_core_missions")
+    def generate_core_missions(self, business_data: Dict, quality_data: QualityResult, aga_data: AGAResult) -> List[str]:
         """Generate the top 3 core missions for the next 6 months"""
         
         missions = []
         
         # Mission 1: Based on technical debt level
-        ai_debt_score = quality_data.get('ai_debt_score', 0)
+        ai_debt_score = quality_data.ai_debt_score
         if ai_debt_score < 60:
             missions.append("TECHNICAL FOUNDATION: Immediately address critical technical debt and security vulnerabilities to establish production-ready infrastructure. Target: Achieve 80+ AI Debt Score within 90 days to enable secure scaling.")
         elif ai_debt_score < 80:
@@ -151,14 +195,13 @@ The ideal Founder-in-Residence must combine {'technical leadership' if quality_s
             missions.append("SCALING ARCHITECTURE: Transition from MVP to scalable platform architecture capable of handling 10x growth. Focus on microservices, caching, and performance optimization.")
         
         # Mission 2: Based on traction validation
-        if aga_data.get('traction_validated', False):
-            missions.append("GROWTH SCALING: Capitalize on validated traction channels identified by the autonomous growth agent. Implement systematic replication of successful acquisition methods while optimizing conversion funnels. Target: Scale from current ${aga_data.get('total_revenue', 0):.0f} to $100K MRR within 6 months.")
+        if aga_data.traction_validated:
+            missions.append("GROWTH SCALING: Capitalize on validated traction channels identified by the autonomous growth agent. Implement systematic replication of successful acquisition methods while optimizing conversion funnels. Target: Scale from current ${aga_data.total_revenue:.0f} to $100K MRR within 6 months.")
         else:
             failed_platforms = []
-            if aga_data.get('campaign_results', {}).get('platforms', {}):
-                for platform, results in aga_data['campaign_results']['platforms'].items():
-                    if results.get('signups', 0) < 15:  # Low performance threshold
-                        failed_platforms.append(platform)
+            for platform, results in aga_data.campaign.platforms.items():
+                if results.get('signups', 0) < 15:  # Low performance threshold
+                    failed_platforms.append(platform)
             
             if failed_platforms:
                 missions.append(f"CHANNEL REDISCOVERY: Pivot away from failed growth channels ({', '.join(failed_platforms)}) and identify 2-3 new customer acquisition channels through direct outreach, partnerships, or content marketing. Focus on channels with higher conversion potential for the {business_data.get('target_market', 'target market')}.")
@@ -173,11 +216,12 @@ The ideal Founder-in-Residence must combine {'technical leadership' if quality_s
         
         return missions[:3]  # Ensure exactly 3 missions
     
-    def identify_critical_skills(self, business_data: Dict, quality_data: Dict, aga_data: Dict) -> Dict:
+    @timed("fir.identify_critical_skills")
+    def identify_critical_skills(self, business_data: Dict, quality_data: QualityResult, aga_data: AGAResult) -> Dict:
         """Identify the single most critical missing skill"""
         
-        ai_debt_score = quality_data.get('ai_debt_score', 0)
-        traction_validated = aga_data.get('traction_validated', False)
+        ai_debt_score = quality_data.ai_debt_score
+        traction_validated = aga_data.traction_validated
         business_model = business_data.get('business_model', '')
         
         # Determine primary risk/opportunity
@@ -210,96 +254,74 @@ The ideal Founder-in-Residence must combine {'technical leadership' if quality_s
                 "rationale": "Strategic partnerships essential for sustainable competitive advantage"
             }
     
-    def generate_cursor_prompt(self, mandate_data: Dict) -> str:
-        """Generate the complete Cursor Agent prompt for VC Partner synthesis"""
+    def traction_basis(self, aga_data: AGAResult) -> str:
+        """How traction was judged; thresholds apply to running totals, not the last day's figures"""
+        monitoring = aga_data.monitoring
+        if monitoring.validated_on_day is not None:
+            return (f"Validated on day {monitoring.validated_on_day} against running totals since launch "
+                    f"(monitoring stopped early)")
+        if monitoring.days_monitored:
+            return f"Not validated against running totals over {monitoring.days_monitored} days"
+        return "No monitoring data"
+    
+    def cursor_prompt_context(self, mandate_data: Dict) -> Dict:
+        """Flatten mandate data into the fir_prompt template fields"""
         
         business_summary = mandate_data['business_summary']
-        missions = mandate_data['missions']
         critical_skill = mandate_data['critical_skill']
+        validated = business_summary['traction_validated']
         
-        prompt = f"""You are a top-tier Venture Capital Partner with 15+ years experience in technology investments. Generate a comprehensive Founder-in-Residence (FIR) mandate for a validated MVP asset.
-
-CONTEXT:
-- Validated MVP in {business_summary['target_market']} market
-- Technical quality: {business_summary['quality_status']} (AI Debt Score: {business_summary['ai_debt_score']}/100)
-- Market traction: {'VALIDATED' if business_summary['traction_validated'] else 'PENDING'}
-- Business model: {business_summary['business_model']}
-
-REQUIRED OUTPUT FORMAT:
-
-# FOUNDER-IN-RESIDENCE MANDATE
-
-## Executive Summary
-{business_summary['executive_summary']}
-
-## The Opportunity
-- Market Size: {business_summary['market_size']}
-- Target Market: {business_summary['target_market']}
-- Value Proposition: {business_summary['value_proposition']}
-- Revenue Potential: {business_summary['revenue_projection']}
-
-## Technical Assessment
-- Code Quality Score: {business_summary['ai_debt_score']}/100
-- Technical Risk Level: {business_summary['technical_risk']}
-- Remediation Cost: ${business_summary['human_cost']:.0f}
-- Status: {'Production Ready' if business_summary['ai_debt_score'] >= 80 else 'Needs Improvement'}
-
-## Market Traction
-- Growth Campaign Results: {business_summary['total_signups']} signups, ${business_summary['total_revenue']:.0f} revenue
-- Validation Status: {'COMPLETE' if business_summary['traction_validated'] else 'IN PROGRESS'}
-- Growth Agent Performance: {business_summary['campaign_success']}
-
-## TOP 3 CORE MISSIONS (Next 6 Months)
-{chr(10).join([f"{i+1}. {mission}" for i, mission in enumerate(missions)])}
-
-## CRITICAL MISSING SKILL: {critical_skill['skill']}
-
-**Priority Level:** {critical_skill['priority']}
-
-**Description:** {critical_skill['description']}
-
-**Why This Skill is Critical:** {critical_skill['rationale']}
-
-## FIR Profile Requirements
-
-### Essential Qualifications:
-- Previous startup experience scaling to $1M+ ARR
-- Expertise in {critical_skill['skill'].lower()}
-- Strong network in {business_summary['target_market'].lower()} sector
-- Track record of building high-performing teams
-
-### Compensation & Equity:
-- Competitive salary + significant equity package
-- Performance-based incentives tied to ARR milestones
-- Opportunity to become co-founder based on performance
-
-### Success Metrics (6-Month Goals):
-- Achieve all 3 Core Missions
-- Reach ${'100K' if business_summary['traction_validated'] else '50K'} MRR
-- Build core team of 5-7 people
-- Establish enterprise sales process (if applicable)
-
-## Investment Thesis
-This asset represents a {'proven' if business_summary['traction_validated'] else 'promising'} opportunity requiring a {'scaling' if business_summary['traction_validated'] else 'foundational'} leader to {'accelerate growth' if business_summary['traction_validated'] else 'establish market fit'} and achieve {'rapid' if business_summary['traction_validated'] else 'sustainable'} scaling to the $1M ARR milestone within 12-18 months.
-
----
-*Mandate generated by FounderX Asset Validation System*
-*Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"""
-
-        return prompt
+        return {
+            **business_summary,
+            **critical_skill,
+            'missions': "\n".join(f"{i+1}. {mission}" for i, mission in enumerate(mandate_data['missions'])),
+            'traction_label': 'VALIDATED' if validated else 'PENDING',
+            'validation_status': 'COMPLETE' if validated else 'IN PROGRESS',
+            'production_status': 'Production Ready' if business_summary['ai_debt_score'] >= 80 else 'Needs Improvement',
+            'skill_lower': critical_skill['skill'].lower(),
+            'target_market_lower': business_summary['target_market'].lower(),
+            'mrr_target': '100K' if validated else '50K',
+            'thesis_opportunity': 'proven' if validated else 'promising',
+            'thesis_leader': 'scaling' if validated else 'foundational',
+            'thesis_goal': 'accelerate growth' if validated else 'establish market fit',
+            'thesis_pace': 'rapid' if validated else 'sustainable',
+            'generated': timestamp()
+        }
+    
+    @timed("fir.generate_cursor_prompt")
+    def generate_cursor_prompt(self, mandate_data: Dict) -> str:
+        """Generate the complete Cursor Agent prompt for VC Partner synthesis"""
+        return render('fir_prompt.txt', self.cursor_prompt_context(mandate_data))
+    
+    def load_sources(self, loader_pool: Optional[ThreadPoolExecutor] = None) -> Dict:
+        """Load all data sources, concurrently when a loader pool is given"""
+        loaders = {
+            'business_plan': self.load_business_plan,
+            'hcl_report': self.load_hcl_report,
+            'quality_report': self.load_quality_report,
+            'aga_results': self.load_aga_results
+        }
+        if loader_pool is None:
+            return {name: load() for name, load in loaders.items()}
+        
+        futures = {name: loader_pool.submit(load) for name, load in loaders.items()}
+        return {name: future.result() for name, future in futures.items()}
     
-    def generate_fir_mandate(self) -> Dict:
+    @timed("fir.generate_fir_mandate")
+    def generate_fir_mandate(self, verbose: bool = True, loader_pool: Optional[ThreadPoolExecutor] = None) -> Dict:
         """Main function to generate the complete FIR mandate"""
         
-        print("🔍 Loading asset data for FIR generation...")
+        if verbose:
+            log("🔍 Loading asset data for FIR generation...", "fir_loading", asset_dir=self.asset_dir)
         
         # Load all data sources
-        business_data = self.load_business_plan()
-        hcl_data = self.load_hcl_report()
-        quality_data = self.load_quality_report()
-        aga_data = self.load_aga_results()
+        sources = self.load_sources(loader_pool)
+        business_data = sources['business_plan']
+        quality_data = sources['quality_report']
+        aga_data = sources['aga_results']
         
-        print("✅ Data loaded successfully")
+        if verbose:
+            log("✅ Data loaded successfully", "fir_loaded", asset_dir=self.asset_dir)
         
         # Generate mandate components
         executive_summary = self.generate_executive_summary(business_data, quality_data, aga_data)
@@ -310,18 +332,19 @@ This asset represents a {'proven' if business_summary['traction_validated'] else
         mandate_data = {
             'business_summary': {
                 'target_market': business_data['target_market'],
-                'quality_status': quality_data['quality_status'],
-                'ai_debt_score': quality_data['ai_debt_score'],
-                'traction_validated': aga_data.get('traction_validated', False),
+                'quality_status': quality_data.quality_status,
+                'ai_debt_score': quality_data.ai_debt_score,
+                'traction_validated': aga_data.traction_validated,
                 'business_model': business_data['business_model'],
                 'market_size': business_data['market_size'],
                 'value_proposition': business_data['value_proposition'],
                 'revenue_projection': business_data['revenue_projection'],
-                'technical_risk': quality_data['technical_risk'],
-                'human_cost': quality_data['human_cost'],
-                'total_signups': aga_data.get('total_signups', 0),
-                'total_revenue': aga_data.get('total_revenue', 0),
-                'campaign_success': aga_data.get('campaign_success', 'Unknown'),
+                'technical_risk': quality_data.technical_risk,
+                'human_cost': quality_data.human_cost,
+                'total_signups': aga_data.total_signups,
+                'total_revenue': aga_data.total_revenue,
+                'campaign_success': aga_data.campaign_success,
+                'traction_basis': self.traction_basis(aga_data),
                 'executive_summary': executive_summary
             },
             'missions': core_missions,
@@ -331,11 +354,16 @@ This asset represents a {'proven' if business_summary['traction_validated'] else
         # Generate the complete prompt
         cursor_prompt = self.generate_cursor_prompt(mandate_data)
         
-        print("🎯 FIR mandate generated successfully!")
-        print(f"   Target Market: {business_data['target_market']}")
-        print(f"   Quality Score: {quality_data['ai_debt_score']}/100")
-        print(f"   Traction Status: {'✅ Validated' if aga_data.get('traction_validated', False) else '⏳ Pending'}")
-        print(f"   Critical Skill: {critical_skill['skill']}")
+        metrics.inc("founderx_mandates_generated_total")
+        if verbose:
+            log("🎯 FIR mandate generated successfully!\n"
+                f"   Target Market: {business_data['target_market']}\n"
+                f"   Quality Score: {quality_data.ai_debt_score}/100\n"
+                f"   Traction Status: {'✅ Validated' if aga_data.traction_validated else '⏳ Pending'}"
+                f" ({mandate_data['business_summary']['traction_basis']})\n"
+                f"   Critical Skill: {critical_skill['skill']}",
+                "fir_generated", asset_dir=self.asset_dir, ai_debt_score=quality_data.ai_debt_score,
+                traction_validated=aga_data.traction_validated, critical_skill=critical_skill['skill'])
         
         return {
             'mandate_data': mandate_data,
@@ -343,23 +371,123 @@ This asset represents a {'proven' if business_summary['traction_validated'] else
             'generation_time': datetime.now().isoformat()
         }
     
-    def save_to_files(self, mandate_data: Dict) -> None:
-        """Save the mandate to template files"""
+    @timed("fir.save_to_files")
+    def save_to_files(self, mandate_data: Dict, output_dir: str = ".", prefix: str = "",
+                      verbose: bool = True) -> Dict[str, str]:
+        """Save the mandate to template files; returns the prompt and data paths"""
+        
+        prompt_path = os.path.join(output_dir, f"{prefix}FIR_Mandate_Prompt.txt")
+        data_path = os.path.join(output_dir, f"{prefix}FIR_Mandate_Data.json")
         
         # Save the Cursor prompt to a file for easy copy-paste
-        with open('FIR_Mandate_Prompt.txt', 'w') as f:
+        with open(prompt_path, 'w') as f:
             f.write(mandate_data['cursor_prompt'])
         
         # Save the mandate data as JSON for reference
-        with open('FIR_Mandate_Data.json', 'w') as f:
+        with open(data_path, 'w') as f:
             json.dump(mandate_data['mandate_data'], f, indent=2)
         
-        print("💾 FIR mandate saved to files:")
-        print("   - FIR_Mandate_Prompt.txt (for Cursor Agent)")
-        print("   - FIR_Mandate_Data.json (structured data)")
+        if verbose:
+            log(f"💾 FIR mandate saved to files:\n   - {prompt_path} (for Cursor Agent)\n   - {data_path} (structured data)",
+                "fir_saved", prompt_path=prompt_path, data_path=data_path)
+        
+        return {'prompt_path': prompt_path, 'data_path': data_path}
+
+def expand_asset_dirs(inputs: List[str]) -> List[str]:
+    """Resolve directories and glob patterns to a sorted list of asset directories"""
+    dirs = set()
+    for item in inputs:
+        dirs.update(path for path in glob.glob(item) if os.path.isdir(path))
+    return sorted(dirs)
+
+def asset_names(asset_dirs: List[str]) -> List[str]:
+    """Output prefix per asset: its directory name, made unique across the portfolio"""
+    names = []
+    used = set()
+    for asset_dir in asset_dirs:
+        base = os.path.basename(os.path.normpath(asset_dir)) or "asset"
+        name, n = base, 1
+        while name in used:
+            n += 1
+            name = f"{base}_{n}"
+        used.add(name)
+        names.append(name)
+    return names
+
+def generate_asset_mandate(asset_dir: str, name: str, output_dir: str) -> Dict:
+    """Generate and save one asset's mandate (portfolio worker)"""
+    try:
+        generator = FIRGenerator(asset_dir=asset_dir)
+        result = generator.generate_fir_mandate(verbose=False, loader_pool=get_loader_pool())
+        paths = generator.save_to_files(result, output_dir, f"{name}_", verbose=False)
+    except Exception as e:
+        return {'asset': name, 'asset_dir': asset_dir, 'error': str(e)}
+    
+    summary = result['mandate_data']['business_summary']
+    return {
+        'asset': name,
+        'asset_dir': asset_dir,
+        'error': None,
+        'ai_debt_score': summary['ai_debt_score'],
+        'traction_validated': summary['traction_validated'],
+        'critical_skill': result['mandate_data']['critical_skill']['skill'],
+        **paths
+    }
+
+def generate_portfolio(asset_dirs: List[str], output_dir: str = "fir_mandates",
+                       workers: Optional[int] = None) -> List[Dict]:
+    """Generate mandates for many assets in parallel across cores"""
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(asset_dirs) // (workers * 4))
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(generate_asset_mandate, asset_dirs, asset_names(asset_dirs),
+                                 [output_dir] * len(asset_dirs), chunksize=chunksize))
+
+def run_portfolio(inputs: List[str], output_dir: str, workers: Optional[int]) -> int:
+    """Portfolio mode: one mandate per asset directory matched by the inputs"""
+    asset_dirs = expand_asset_dirs(inputs)
+    if not asset_dirs:
+        print(f"❌ ERROR: No asset directories found in {', '.join(inputs)}")
+        return 1
+    
+    print(f"🔍 Generating FIR mandates for {len(asset_dirs)} assets...")
+    
+    start = time.perf_counter()
+    results = generate_portfolio(asset_dirs, output_dir, workers)
+    elapsed = time.perf_counter() - start
+    
+    summary_path = os.path.join(output_dir, 'fir_portfolio_summary.json')
+    with open(summary_path, 'w') as f:
+        json.dump(results, f, indent=2)
+    
+    failed = [r for r in results if r['error']]
+    print("🎉 FIR portfolio generation complete!")
+    print(f"   Assets: {len(results) - len(failed)} generated, {len(failed)} failed")
+    print(f"   Throughput: {len(results) / elapsed:.1f} assets/sec")
+    print(f"   Summary: {summary_path}")
+    for r in failed:
+        print(f"   ❌ {r['asset_dir']}: {r['error']}")
+    return 1 if failed else 0
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Generate Founder-in-Residence mandates")
+    parser.add_argument('assets', nargs='*', help="Asset directories or globs (portfolio mode)")
+    parser.add_argument('--portfolio', action='store_true', help="Generate a mandate for every given asset directory")
+    parser.add_argument('--output-dir', default='fir_mandates', help="Portfolio mode output directory")
+    parser.add_argument('--workers', type=int, default=None, help="Portfolio mode worker processes (default: all cores)")
+    parser.add_argument('--log-mode', choices=LOG_MODES, default=None, help="Progress output: print, structured or silent")
+    parser.add_argument('--metrics-file', default=None, help="Export timings and counters here on exit (.json or Prometheus text)")
+    args = parser.parse_args()
+    configure(log_mode=args.log_mode, metrics_file=args.metrics_file)
+    
+    if args.portfolio:
+        return run_portfolio(args.assets or ['.'], args.output_dir, args.workers)
+    if args.assets:
+        parser.error("asset directories require --portfolio")
+    
     print("🚀 Starting Founder-in-Residence Profile Generator...")
     
     generator = FIRGenerator()
@@ -6,6 +6,30 @@
 
 set -e
 
+# Emit the machine-readable sidecar read by the FIR generator. It is written on
+# every run, passing or failing, through a temp file renamed into place so a
+# concurrent reader never sees a partial file. time_spent is the bare number of hours.
+write_sidecar() {
+    local validated=$1
+    local curator
+    curator=$(grep -m1 "Curator:" HCL_Report.md | sed 's/.*Curator:\** *//; s/ *$//; s/\\/\\\\/g; s/"/\\"/g' || true)
+    printf '{"sidecar_version":1,"curator":"%s","time_spent":"%s","contributions":%d,"validated":%s}\n' \
+        "$curator" "${TIME_SPENT:-0.0}" "${CONTRIBUTION_COUNT:-0}" "$validated" > "HCL_Report.json.$$.tmp"
+    mv -f "HCL_Report.json.$$.tmp" HCL_Report.json
+    echo "📄 HCL sidecar written: HCL_Report.json (validated: $validated)"
+}
+
+finish() {
+    local status=$?
+    if [ -f HCL_Report.md ]; then
+        if [ "$status" -eq 0 ]; then write_sidecar true; else write_sidecar false; fi
+    else
+        # No report to describe; drop a stale sidecar so FIR does not trust it
+        rm -f HCL_Report.json
+    fi
+}
+trap finish EXIT
+
 echo "🔍 Checking Human Contribution Log (HCL)..."
 
 # Check if HCL_Report.md exists in the root directory
@@ -24,7 +48,7 @@ if ! grep -q "Total Time Spent:" HCL_Report.md; then
 fi
 
 # Extract the time spent value and validate it's >= 2.0
-TIME_SPENT=$(grep "Total Time Spent:" HCL_Report.md | sed 's/.*Total Time Spent: *\([0-9.]*\).*/\1/')
+TIME_SPENT=$(grep "Total Time Spent:" HCL_Report.md | sed 's/.*Total Time Spent:\** *\([0-9.]*\).*/\1/')
 
 if [ -z "$TIME_SPENT" ]; then
     echo "❌ ERROR: Could not extract time spent value from HCL_Report.md"
@@ -41,7 +65,7 @@ fi
 echo "✅ Time spent validation passed: $TIME_SPENT hours"
 
 # Check if the file contains at least 5 contributions
-CONTRIBUTION_COUNT=$(grep -c "^[0-9]\." HCL_Report.md || echo "0")
+CONTRIBUTION_COUNT=$(grep -c "^[0-9]\." HCL_Report.md || true)
 
 if [ "$CONTRIBUTION_COUNT" -lt 5 ]; then
     echo "❌ ERROR: HCL_Report.md must contain at least 5 non-trivial contributions (found: $CONTRIBUTION_COUNT)"
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Pipeline Instrumentation
+Timing spans, counters and histograms shared by every pipeline stage, exported as
+Prometheus text or JSON, plus a log() that replaces progress prints and can be
+switched to structured JSON lines or silenced.
+
+Configured from the environment (or configure()):
+  FOUNDERX_LOG_MODE      print (default) | structured | silent
+  FOUNDERX_LOG_FILE      structured log destination (default: stderr)
+  FOUNDERX_METRICS_FILE  written at exit; .json exports JSON, anything else Prometheus text
+"""
+
+import atexit
+import bisect
+import functools
+import json
+import math
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Sequence, Tuple
+
+LOG_MODES = ('print', 'structured', 'silent')
+
+# Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Optional[Dict]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items())) if labels else ()
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence, 0.0 when empty"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class Histogram:
+    """Cumulative-bucket histogram with count and sum, as Prometheus expects"""
+
+    __slots__ = ('buckets', 'counts', 'count', 'sum')
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> Dict:
+        cumulative = []
+        running = 0
+        for bound, count in zip((*self.buckets, float('inf')), self.counts):
+            running += count
+            cumulative.append(['+Inf' if bound == float('inf') else bound, running])
+        return {'count': self.count, 'sum': self.sum, 'buckets': cumulative}
+
+
+class MetricsRegistry:
+    """Thread-safe counters and histograms keyed by metric name and labels"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[str, Dict[Labels, float]] = {}
+        self.histograms: Dict[str, Dict[Labels, Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1, labels: Optional[Dict] = None) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: Optional[Dict] = None) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram()
+            histogram.observe(value)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            return {
+                'counters': {name: [{'labels': dict(k), 'value': v} for k, v in series.items()]
+                             for name, series in self.counters.items()},
+                'histograms': {name: [{'labels': dict(k), **h.to_dict()} for k, h in series.items()]
+                               for name, series in self.histograms.items()}
+            }
+
+    def to_prometheus(self) -> str:
+        def fmt(labels: Labels, extra: Tuple = ()) -> str:
+            pairs = (*labels, *extra)
+            return '{' + ','.join(f'{k}="{v}"' for k, v in pairs) + '}' if pairs else ''
+
+        lines = []
+        with self._lock:
+            for name, series in sorted(self.counters.items()):
+                lines.append(f"# TYPE {name} counter")
+                lines.extend(f"{name}{fmt(k)} {v}" for k, v in series.items())
+            for name, series in sorted(self.histograms.items()):
+                lines.append(f"# TYPE {name} histogram")
+                for k, h in series.items():
+                    for bound, count in h.to_dict()['buckets']:
+                        lines.append(f"{name}_bucket{fmt(k, (('le', bound),))} {count}")
+                    lines.append(f"{name}_sum{fmt(k)} {h.sum}")
+                    lines.append(f"{name}_count{fmt(k)} {h.count}")
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path: str) -> None:
+        """Write JSON for .json paths, Prometheus text format otherwise"""
+        content = json.dumps(self.to_dict(), indent=2) if path.endswith('.json') else self.to_prometheus()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+
+metrics = MetricsRegistry()
+
+_config = {
+    'log_mode': os.environ.get('FOUNDERX_LOG_MODE', 'print'),
+    'log_file': os.environ.get('FOUNDERX_LOG_FILE'),
+    'metrics_file': os.environ.get('FOUNDERX_METRICS_FILE')
+}
+if _config['log_mode'] not in LOG_MODES:
+    raise ValueError(f"FOUNDERX_LOG_MODE must be one of {', '.join(LOG_MODES)}, not {_config['log_mode']!r}")
+_log_lock = threading.Lock()
+_log_stream = None
+
+
+def configure(log_mode: Optional[str] = None, log_file: Optional[str] = None,
+              metrics_file: Optional[str] = None) -> None:
+    """Override the environment configuration for this process"""
+    global _log_stream
+    if log_mode is not None:
+        if log_mode not in LOG_MODES:
+            raise ValueError(f"Unknown log mode: {log_mode}")
+        _config['log_mode'] = log_mode
+    if log_file is not None:
+        _config['log_file'] = log_file
+        _log_stream = None
+    if metrics_file is not None:
+        _config['metrics_file'] = metrics_file
+
+
+def log(message: str, event: Optional[str] = None, **fields) -> None:
+    """
+    Progress output. In print mode this is print(message); in structured mode a
+    JSON line with the event name and fields; in silent mode nothing.
+    """
+    mode = _config['log_mode']
+    if mode == 'print':
+        print(message)
+    elif mode == 'structured':
+        global _log_stream
+        record = json.dumps({'ts': round(time.time(), 3), 'event': event, 'msg': message, **fields},
+                            default=str, ensure_ascii=False)
+        with _log_lock:
+            if _log_stream is None:
+                _log_stream = open(_config['log_file'], 'a') if _config['log_file'] else sys.stderr
+            _log_stream.write(record + '\n')
+
+
+@contextmanager
+def span(name: str, **labels):
+    """Time a block into the founderx_span_seconds histogram"""
+    start = time.perf_counter()
+    status = 'ok'
+    try:
+        yield
+    except BaseException:
+        status = 'error'
+        raise
+    finally:
+        metrics.observe('founderx_span_seconds', time.perf_counter() - start, {'span': name, **labels})
+        if status == 'error':
+            metrics.inc('founderx_span_errors_total', labels={'span': name})
+
+
+def timed(name: str):
+    """Decorator form of span()"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def export_metrics(path: Optional[str] = None) -> Optional[str]:
+    """Export to path (or the configured metrics file); returns the path written"""
+    path = path or _config['metrics_file']
+    if path:
+        metrics.export(path)
+    return path
+
+
+atexit.register(export_metrics)
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+FounderX Pipeline Orchestrator
+Runs the quality score, growth campaign and FIR stages for many projects as a
+dependency DAG on a shared worker pool. Each project directory holds its own
+inputs and outputs; stages whose inputs are unchanged since the last run are skipped.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'aga_service'))
+
+from campaign_store import DEFAULT_DB_PATH, create_campaign_store
+from fir_generator import FIRGenerator
+from growth_agent import GrowthAgent
+from instrumentation import LOG_MODES, configure, metrics, percentile
+from result_models import dumps
+from score_calculator import generate_quality_report, load_manifest, read_sast_report, save_manifest
+
+# Bump when a stage's behavior changes so cached outputs are rebuilt
+PIPELINE_VERSION = 1
+MANIFEST_NAME = '.pipeline_manifest.json'
+SAST_REPORT_NAME = 'sast_report.json'
+
+
+class Stage:
+    """One pipeline step: reads inputs from a project directory and writes outputs back to it"""
+
+    def __init__(self, name: str, run: Callable[[str, str], None], inputs: List[str], outputs: List[str],
+                 deps: Optional[List[str]] = None):
+        self.name = name
+        self.run = run  # run(project_dir, project_id)
+        self.inputs = inputs
+        self.outputs = outputs
+        self.deps = deps or []
+
+
+def file_hash(path: str) -> Optional[str]:
+    """SHA-256 of a file's content, or None if it does not exist"""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def stage_input_hash(stage: Stage, project_dir: str) -> str:
+    """Hash of a stage's input files, which include its upstream stages' outputs"""
+    payload = json.dumps({
+        'version': PIPELINE_VERSION,
+        'stage': stage.name,
+        'inputs': {name: file_hash(os.path.join(project_dir, name)) for name in stage.inputs}
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class Pipeline:
+    """Schedules every project's stage DAG on one shared thread pool"""
+
+    def __init__(self, workers: int = 8, store_path: str = DEFAULT_DB_PATH, force: bool = False):
+        self.workers = workers
+        self.force = force
+        self.agent = GrowthAgent(store=create_campaign_store("sqlite", store_path, batch_size=100))
+        self.stages = {stage.name: stage for stage in [
+            Stage('score', self.run_score, [SAST_REPORT_NAME],
+                  ['Code_Quality_Report.md', 'Code_Quality_Report.json']),
+            Stage('growth', self.run_growth, ['Business_Plan.md'], ['AGAResults.json']),
+            Stage('fir', self.run_fir,
+                  ['Business_Plan.md', 'HCL_Report.md', 'HCL_Report.json', 'Code_Quality_Report.md',
+                   'Code_Quality_Report.json', 'AGAResults.json'],
+                  ['FIR_Mandate_Prompt.txt', 'FIR_Mandate_Data.json'], deps=['score', 'growth'])
+        ]}
+        self.dependents = {name: [s.name for s in self.stages.values() if name in s.deps] for name in self.stages}
+
+    # Stage implementations ---------------------------------------------------
+
+    def run_score(self, project_dir: str, project_id: str) -> None:
+        sast_data = read_sast_report(os.path.join(project_dir, SAST_REPORT_NAME))
+        generate_quality_report(sast_data, os.path.join(project_dir, 'Code_Quality_Report.md'), verbose=False)
+
+    def run_growth(self, project_dir: str, project_id: str) -> None:
+        results = self.agent.launch_campaign(
+            project_id, {'business_plan_path': os.path.join(project_dir, 'Business_Plan.md')}
+        )
+        with open(os.path.join(project_dir, 'AGAResults.json'), 'wb') as f:
+            f.write(dumps(results, indent=True))
+
+    def run_fir(self, project_dir: str, project_id: str) -> None:
+        generator = FIRGenerator(asset_dir=project_dir)
+        generator.save_to_files(generator.generate_fir_mandate(verbose=False), project_dir, verbose=False)
+
+    # Scheduling ---------------------------------------------------------------
+
+    def _execute(self, stage: Stage, project_dir: str, cached: Optional[Dict]) -> Dict:
+        """Run one stage unless its inputs and outputs match the manifest entry"""
+        outcome = self._execute_stage(stage, project_dir, cached)
+        metrics.inc('founderx_pipeline_stages_total', labels={'stage': stage.name, 'status': outcome['status']})
+        metrics.observe('founderx_pipeline_stage_seconds', outcome['seconds'],
+                        {'stage': stage.name, 'status': outcome['status']})
+        return outcome
+
+    def _execute_stage(self, stage: Stage, project_dir: str, cached: Optional[Dict]) -> Dict:
+        start = time.perf_counter()
+        input_hash = stage_input_hash(stage, project_dir)
+        if (not self.force and cached and cached['input_hash'] == input_hash
+                and all(os.path.exists(os.path.join(project_dir, name)) for name in stage.outputs)):
+            return {'status': 'cached', 'input_hash': input_hash, 'seconds': time.perf_counter() - start}
+
+        try:
+            stage.run(project_dir, os.path.basename(os.path.normpath(project_dir)))
+        except Exception as e:
+            return {'status': 'failed', 'error': str(e) or type(e).__name__, 'seconds': time.perf_counter() - start}
+        return {'status': 'ran', 'input_hash': input_hash, 'seconds': time.perf_counter() - start}
+
+    def run(self, project_dirs: List[str]) -> Dict[str, Dict[str, Dict]]:
+        """Run every project's DAG; returns project_dir -> stage -> outcome"""
+        outcomes = {project_dir: {} for project_dir in project_dirs}
+        manifests = {project_dir: load_manifest(project_dir, MANIFEST_NAME) for project_dir in project_dirs}
+        waiting = {(project_dir, name): set(stage.deps)
+                   for project_dir in project_dirs for name, stage in self.stages.items()}
+        futures = {}
+
+        def submit(project_dir: str, name: str) -> None:
+            del waiting[(project_dir, name)]
+            future = executor.submit(self._execute, self.stages[name], project_dir,
+                                     manifests[project_dir].get(name))
+            futures[future] = (project_dir, name)
+
+        def skip_dependents(project_dir: str, name: str) -> None:
+            for dependent in self.dependents[name]:
+                if (project_dir, dependent) in waiting:
+                    del waiting[(project_dir, dependent)]
+                    outcomes[project_dir][dependent] = {'status': 'skipped', 'error': f"{name} failed", 'seconds': 0.0}
+                    skip_dependents(project_dir, dependent)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="pipeline") as executor:
+            for project_dir, name in [key for key, deps in waiting.items() if not deps]:
+                submit(project_dir, name)
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    project_dir, name = futures.pop(future)
+                    outcome = outcomes[project_dir][name] = future.result()
+
+                    if outcome['status'] == 'failed':
+                        manifests[project_dir].pop(name, None)
+                        skip_dependents(project_dir, name)
+                    else:
+                        manifests[project_dir][name] = {'input_hash': outcome['input_hash'],
+                                                        'outputs': self.stages[name].outputs}
+                        for dependent in self.dependents[name]:
+                            deps = waiting.get((project_dir, dependent))
+                            if deps is not None:
+                                deps.discard(name)
+                                if not deps:
+                                    submit(project_dir, dependent)
+
+                    if len(outcomes[project_dir]) == len(self.stages):
+                        save_manifest(project_dir, manifests[project_dir], MANIFEST_NAME)
+
+        self.agent.store.flush()
+        return outcomes
+
+    def close(self) -> None:
+        self.agent.close()
+
+
+def stage_report(outcomes: Dict[str, Dict[str, Dict]], stage_names: List[str]) -> Dict[str, Dict]:
+    """Per-stage status counts and run time (ran stages only) in seconds"""
+    report = {}
+    for name in stage_names:
+        entries = [stages[name] for stages in outcomes.values() if name in stages]
+        durations = sorted(e['seconds'] for e in entries if e['status'] == 'ran')
+        counts = {status: sum(1 for e in entries if e['status'] == status)
+                  for status in ('ran', 'cached', 'failed', 'skipped')}
+        report[name] = {
+            **counts,
+            'mean': sum(durations) / len(durations) if durations else 0.0,
+            'p50': percentile(durations, 50),
+            'max': durations[-1] if durations else 0.0
+        }
+    return report
+
+
+def expand_project_dirs(inputs: List[str]) -> List[str]:
+    """Resolve directories and glob patterns to a sorted list of project directories"""
+    dirs = set()
+    for item in inputs:
+        dirs.update(path for path in glob.glob(item) if os.path.isdir(path))
+    return sorted(dirs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the score -> growth -> FIR pipeline for many projects")
+    parser.add_argument('projects', nargs='+', help="Project directories or globs")
+    parser.add_argument('--workers', type=int, default=8, help="Shared worker pool size")
+    parser.add_argument('--store', default=DEFAULT_DB_PATH, help="Campaign store database path")
+    parser.add_argument('--force', action='store_true', help="Re-run every stage, ignoring cached outputs")
+    parser.add_argument('--log-mode', choices=LOG_MODES, default=None, help="Progress output: print, structured or silent")
+    parser.add_argument('--metrics-file', default=None, help="Export timings and counters here on exit (.json or Prometheus text)")
+    args = parser.parse_args()
+    configure(log_mode=args.log_mode, metrics_file=args.metrics_file)
+
+    project_dirs = expand_project_dirs(args.projects)
+    if not project_dirs:
+        print(f"❌ ERROR: No project directories found in {', '.join(args.projects)}")
+        sys.exit(1)
+
+    print(f"🚀 Running pipeline for {len(project_dirs)} projects on {args.workers} workers...")
+
+    pipeline = Pipeline(args.workers, args.store, args.force)
+    start = time.perf_counter()
+    try:
+        outcomes = pipeline.run(project_dirs)
+    finally:
+        pipeline.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"🎉 Pipeline complete in {elapsed:.2f}s ({len(project_dirs) / elapsed:.1f} projects/sec)")
+    for name, stats in stage_report(outcomes, list(pipeline.stages)).items():
+        print(f"   {name}: {stats['ran']} ran, {stats['cached']} cached, {stats['failed']} failed, "
+              f"{stats['skipped']} skipped | mean {stats['mean'] * 1000:.1f} ms, "
+              f"p50 {stats['p50'] * 1000:.1f} ms, max {stats['max'] * 1000:.1f} ms")
+    for project_dir, stages in outcomes.items():
+        for name, outcome in stages.items():
+            if outcome['status'] == 'failed':
+                print(f"   ❌ {project_dir} {name}: {outcome['error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Business Plan Extraction Cache
+Shared by the growth agent and the FIR generator so each business plan is
+only extracted once per content version
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+
+
+class PlanCache:
+    """
+    Content-hash keyed cache of data extracted from business plans.
+
+    Entries live in an in-memory LRU and, when disk_dir is set, in JSON files
+    that survive restarts. A file is only re-read and re-hashed when its mtime
+    or size changes; unchanged content under a new mtime still hits by hash.
+    Keys include the extractor version, so bumping it invalidates old entries,
+    and concurrent misses for the same plan share one extraction.
+    """
+
+    def __init__(self, max_entries: int = 256, disk_dir: Optional[str] = None, max_paths: int = 4096):
+        self.max_entries = max_entries
+        self.max_paths = max_paths
+        self.disk_dir = disk_dir
+        self._entries = OrderedDict()  # (namespace, version, content_hash) -> extracted data
+        self._stat_index = OrderedDict()  # path -> (mtime_ns, size, content_hash), most recent last
+        self._inflight = {}  # (namespace, version, content_hash) -> Future shared by concurrent misses
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.rehashes = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _content_hash(self, path: str):
+        """
+        (content hash, content) of the file. While mtime and size are unchanged the
+        last hash is reused and content is None; otherwise the hash is of the bytes read.
+        """
+        stat = os.stat(path)
+        with self._lock:
+            cached = self._stat_index.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2], None
+        return self._read(path)
+
+    def _read(self, path: str):
+        """Read and hash the file in one pass so the hash always matches the content"""
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())  # Before reading: a later write changes mtime and forces a rehash
+            raw = f.read()
+        content_hash = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            self.rehashes += 1
+            self._stat_index[path] = (stat.st_mtime_ns, stat.st_size, content_hash)
+            self._stat_index.move_to_end(path)
+            while len(self._stat_index) > self.max_paths:
+                self._stat_index.popitem(last=False)
+        # A plan that is not valid UTF-8 is still extracted, with U+FFFD for the bad bytes
+        return content_hash, raw.decode(errors='replace')
+
+    def _disk_path(self, namespace: str, version: str, content_hash: str) -> str:
+        return os.path.join(self.disk_dir, f"{namespace}_v{version}_{content_hash}.json")
+
+    def get(self, path: str, namespace: str, extractor: Callable[[str], Dict], version: str = "1") -> Dict:
+        """
+        Extracted data for the business plan at path.
+        extractor receives the file content on a miss; change version whenever
+        the extractor's output changes.
+        Raises FileNotFoundError if the plan does not exist.
+        """
+        content_hash, content = self._content_hash(path)
+        key = (namespace, version, content_hash)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._entries[key])
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not owner:
+            return copy.deepcopy(future.result())
+
+        try:
+            data = self._load(path, namespace, version, content_hash, content, extractor)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        future.set_result(data)
+        return copy.deepcopy(data)
+
+    def _load(self, path: str, namespace: str, version: str, content_hash: str, content: Optional[str],
+              extractor: Callable[[str], Dict]) -> Dict:
+        """Disk entry or fresh extraction for a memory miss, stored in the LRU"""
+        data = None
+        if self.disk_dir:
+            try:
+                with open(self._disk_path(namespace, version, content_hash), 'r') as f:
+                    data = json.load(f)
+                with self._lock:
+                    self.disk_hits += 1
+            except (FileNotFoundError, json.JSONDecodeError):
+                data = None
+
+        if data is None:
+            if content is None:
+                # Only the hash was cached: extract from a fresh read, keyed by its own hash
+                content_hash, content = self._read(path)
+            data = extractor(content)
+            with self._lock:
+                self.misses += 1
+            if self.disk_dir:
+                self._write_disk(namespace, version, content_hash, data)
+
+        key = (namespace, version, content_hash)
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return data
+
+    def _write_disk(self, namespace: str, version: str, content_hash: str, data: Dict) -> None:
+        """Write via a temp file and os.replace so readers never see a partial entry"""
+        path = self._disk_path(namespace, version, content_hash)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stat_index.clear()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.disk_hits + self.coalesced + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "rehashes": self.rehashes,
+            "hit_rate": (self.hits + self.disk_hits + self.coalesced) / lookups if lookups else 0.0
+        }
+
+
+_shared_cache = PlanCache(disk_dir=os.environ.get("FOUNDERX_PLAN_CACHE_DIR") or None)
+
+
+def get_plan_cache() -> PlanCache:
+    """Process-wide cache shared by GrowthAgent and FIRGenerator"""
+    return _shared_cache
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Precompiled Report Templates
+Shared rendering layer for score_calculator and fir_generator. Templates live in
+scripts/templates/, use str.format field syntax (plain names only), and are
+compiled once per process into a single f-string expression.
+"""
+
+import ast
+import functools
+import html
+import os
+import re
+import string
+import time
+from datetime import datetime
+from typing import Dict
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+
+_CONVERSIONS = {None: -1, 's': ord('s'), 'r': ord('r'), 'a': ord('a')}
+
+
+class CompiledTemplate:
+    """
+    A template parsed once at load time and compiled into the equivalent
+    f-string over a context dict, lambda c: f"...{c['name']:spec}...", so
+    rendering runs at the speed of an inline f-string.
+    """
+
+    def __init__(self, name: str, source: str):
+        self.name = name
+        self.source = source
+        parts = []
+        fields = []
+        for literal, field, spec, conversion in string.Formatter().parse(source):
+            if literal:
+                parts.append(ast.Constant(literal))
+            if field is None:
+                continue
+            if not field.isidentifier() or '{' in spec:
+                raise ValueError(f"Template {name} has unsupported field {{{field}}}")
+            fields.append(field)
+            parts.append(ast.FormattedValue(
+                value=ast.Subscript(value=ast.Name('c', ast.Load()), slice=ast.Constant(field), ctx=ast.Load()),
+                conversion=_CONVERSIONS[conversion],
+                format_spec=ast.JoinedStr([ast.Constant(spec)]) if spec else None
+            ))
+        function = ast.Lambda(
+            args=ast.arguments(posonlyargs=[], args=[ast.arg('c')], kwonlyargs=[], kw_defaults=[], defaults=[]),
+            body=ast.JoinedStr(parts)
+        )
+        expression = ast.fix_missing_locations(ast.Expression(function))
+        self._render = eval(compile(expression, f"<template {name}>", 'eval'), {})
+        self.fields = frozenset(fields)
+        # Fields render_html escapes; those ending in _html are trusted markup
+        self.text_fields = tuple(field for field in self.fields if not field.endswith('_html'))
+
+    def render(self, context: Dict) -> str:
+        try:
+            return self._render(context)
+        except KeyError as e:
+            raise KeyError(f"Template {self.name} is missing field {e}") from None
+
+
+@functools.lru_cache(maxsize=None)
+def get_template(name: str) -> CompiledTemplate:
+    """Load and compile a template from scripts/templates (cached)"""
+    with open(os.path.join(TEMPLATE_DIR, name), 'r') as f:
+        return CompiledTemplate(name, f.read())
+
+
+def render(name: str, context: Dict) -> str:
+    return get_template(name).render(context)
+
+
+_needs_escape = re.compile(r'[&<>"\']').search
+
+
+def escape_html(value: str) -> str:
+    """html.escape, skipping its five replace passes for text with nothing to escape"""
+    return html.escape(value) if _needs_escape(value) else value
+
+
+def render_html(name: str, context: Dict) -> str:
+    """Render with string values HTML-escaped; fields ending in _html are trusted markup"""
+    template = get_template(name)
+    escaped = dict(context)
+    for key in template.text_fields:
+        value = context.get(key)
+        if isinstance(value, str):
+            escaped[key] = escape_html(value)
+    return template.render(escaped)
+
+
+_timestamp_cache = {}
+
+
+def timestamp(fmt: str = '%Y-%m-%d %H:%M:%S') -> str:
+    """Current local time formatted with fmt, reformatted at most once per second"""
+    now = int(time.time())
+    cached = _timestamp_cache.get(fmt)
+    if cached is None or cached[0] != now:
+        cached = _timestamp_cache[fmt] = (now, datetime.fromtimestamp(now).strftime(fmt))
+    return cached[1]
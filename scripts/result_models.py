@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Typed Pipeline Result Models
+Slotted dataclasses for campaign, monitoring and quality results shared by the
+growth agent and the FIR generator, with tolerant dict/JSON round-tripping
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # Faster JSON when available
+    orjson = None
+
+
+def dumps(data: Dict, indent: bool = False) -> bytes:
+    """JSON bytes for a results dict; indent gives the two-space layout of the handoff files"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+def loads(raw) -> Dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@dataclass(slots=True)
+class DailyMetrics:
+    day: int
+    signups: int = 0
+    revenue: float = 0.0
+    traffic: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'DailyMetrics':
+        return cls(data['day'], data.get('signups', 0), data.get('revenue', 0.0), data.get('traffic', 0))
+
+    def to_dict(self) -> Dict:
+        return {'day': self.day, 'signups': self.signups, 'revenue': self.revenue, 'traffic': self.traffic}
+
+
+@dataclass(slots=True)
+class CampaignResult:
+    """Ad execution across platforms; platforms maps platform name -> adapter results"""
+    campaign_id: str
+    start_time: str = ""
+    platforms: Dict[str, Dict] = field(default_factory=dict)
+    failed_platforms: Dict[str, str] = field(default_factory=dict)
+    total_spent: float = 0.0
+    total_signups: int = 0
+    total_revenue: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CampaignResult':
+        return cls(
+            data.get('campaign_id', ''), data.get('start_time', ''), data.get('platforms') or {},
+            data.get('failed_platforms') or {}, data.get('total_spent', 0.0),
+            data.get('total_signups', 0), data.get('total_revenue', 0.0)
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            'campaign_id': self.campaign_id,
+            'start_time': self.start_time,
+            'platforms': self.platforms,
+            'failed_platforms': self.failed_platforms,
+            'total_spent': self.total_spent,
+            'total_signups': self.total_signups,
+            'total_revenue': self.total_revenue
+        }
+
+
+@dataclass(slots=True)
+class MonitoringResult:
+    campaign_id: str
+    monitoring_period: str = ""
+    daily_metrics: List[DailyMetrics] = field(default_factory=list)
+    days_monitored: int = 0
+    total_signups: int = 0
+    total_revenue: float = 0.0
+    validated_on_day: Optional[int] = None
+    final_status: str = "pending"
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'MonitoringResult':
+        daily_metrics = [DailyMetrics.from_dict(day) for day in data.get('daily_metrics') or []]
+        return cls(
+            data.get('campaign_id', ''), data.get('monitoring_period', ''), daily_metrics,
+            data.get('days_monitored', len(daily_metrics)),
+            data.get('total_signups', sum(day.signups for day in daily_metrics)),
+            data.get('total_revenue', sum(day.revenue for day in daily_metrics)),
+            data.get('validated_on_day'), data.get('final_status', 'pending')
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            'campaign_id': self.campaign_id,
+            'monitoring_period': self.monitoring_period,
+            'daily_metrics': [day.to_dict() for day in self.daily_metrics],
+            'days_monitored': self.days_monitored,
+            'total_signups': self.total_signups,
+            'total_revenue': self.total_revenue,
+            'validated_on_day': self.validated_on_day,
+            'final_status': self.final_status
+        }
+
+
+# Growth agent performance shown in FIR mandates, by monitoring final_status.
+# Before the typed models FIR showed "Unknown" for every results file (they carry
+# no campaign_success field) and "Failed" when there was none; the latter is kept.
+CAMPAIGN_SUCCESS = {
+    'traction_validated': 'Traction validated',
+    'traction_failed': 'Traction not validated',
+    'pending': 'Pending',
+    'not_run': 'Failed'
+}
+
+
+@dataclass(slots=True)
+class AGAResult:
+    """Everything GrowthAgent.launch_campaign produces for one project"""
+    project_id: str
+    campaign_id: str
+    campaign: CampaignResult
+    monitoring: MonitoringResult
+    target_data: Dict = field(default_factory=dict)
+    ad_copies: List[Dict] = field(default_factory=list)
+    budget_reallocation: Dict = field(default_factory=dict)
+    traction_validated: bool = False
+    completion_time: str = ""
+
+    @property
+    def total_signups(self) -> int:
+        return self.campaign.total_signups
+
+    @property
+    def total_revenue(self) -> float:
+        return self.campaign.total_revenue
+
+    @property
+    def campaign_success(self) -> str:
+        return CAMPAIGN_SUCCESS.get(self.monitoring.final_status, 'Unknown')
+
+    @classmethod
+    def empty(cls) -> 'AGAResult':
+        """Placeholder for an asset whose growth campaign has not run"""
+        return cls('', '', CampaignResult(''), MonitoringResult('', final_status='not_run'))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'AGAResult':
+        monitoring = MonitoringResult.from_dict(data.get('monitoring_results') or {})
+        return cls(
+            data.get('project_id', ''), data.get('campaign_id', ''),
+            CampaignResult.from_dict(data.get('campaign_results') or {}), monitoring,
+            data.get('target_data') or {}, data.get('ad_copies') or [], data.get('budget_reallocation') or {},
+            data.get('traction_validated', monitoring.final_status == 'traction_validated'),
+            data.get('completion_time', '')
+        )
+
+    def to_dict(self) -> Dict:
+        """The launch_campaign results dict, as stored and served"""
+        return {
+            'project_id': self.project_id,
+            'campaign_id': self.campaign_id,
+            'target_data': self.target_data,
+            'ad_copies': self.ad_copies,
+            'campaign_results': self.campaign.to_dict(),
+            'budget_reallocation': self.budget_reallocation,
+            'monitoring_results': self.monitoring.to_dict(),
+            'traction_validated': self.traction_validated,
+            'completion_time': self.completion_time
+        }
+
+    def dumps(self, indent: bool = False) -> bytes:
+        return dumps(self.to_dict(), indent)
+
+    @classmethod
+    def load(cls, path: str) -> 'AGAResult':
+        with open(path, 'rb') as f:
+            return cls.from_dict(loads(f.read()))
+
+
+@dataclass(slots=True)
+class QualityResult:
+    """Code quality figures FIR needs; assessed is False when no quality report exists"""
+    ai_debt_score: float = 0.0
+    human_cost: float = 0.0
+    technical_debt_hours: float = 0.0
+    vulnerabilities: int = 0
+    quality_summary: str = ""
+    assessed: bool = True
+
+    @property
+    def quality_status(self) -> str:
+        if not self.assessed:
+            return "Unknown"
+        return "Good" if self.ai_debt_score >= 75 else "Needs Improvement"
+
+    @property
+    def technical_risk(self) -> str:
+        if not self.assessed:
+            return "Unknown"
+        return "Low" if self.ai_debt_score >= 80 else "Medium" if self.ai_debt_score >= 60 else "High"
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'QualityResult':
+        return cls(
+            float(data.get('ai_debt_score', 0.0)), float(data.get('human_cost', 0.0)),
+            data.get('technical_debt_hours', 0.0), data.get('vulnerabilities', 0),
+            data.get('quality_summary', ''), data.get('assessed', True)
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            'ai_debt_score': self.ai_debt_score,
+            'human_cost': self.human_cost,
+            'technical_debt_hours': self.technical_debt_hours,
+            'vulnerabilities': self.vulnerabilities,
+            'quality_summary': self.quality_summary,
+            'assessed': self.assessed,
+            'quality_status': self.quality_status,
+            'technical_risk': self.technical_risk
+        }
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Streaming SAST Report Reader
+Reads top-level report metrics while iterating large arrays such as hotspots
+element by element, so memory stays bounded by the largest single element
+"""
+
+import heapq
+import json
+from typing import Callable, Dict, Iterable, List, Optional
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+class _JSONStream:
+    """Minimal pull tokenizer over a text file for one top-level JSON object"""
+
+    def __init__(self, f, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size: Optional[int] = None) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _error(self, message: str):
+        return json.JSONDecodeError(message, self.buf, self.pos)
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it ('' at EOF)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, chars: str) -> str:
+        ch = self.peek()
+        if ch == '' or ch not in chars:
+            raise self._error(f"Expecting one of {chars!r}")
+        self.pos += 1
+        return ch
+
+    def value(self):
+        """Decode the next complete JSON value"""
+        self.peek()
+        read_size = self.chunk_size
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+                # A number running to the end of the buffer may continue in the next chunk
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            read_size *= 2  # grow reads so large values aren't re-scanned chunk by chunk
+            self._fill(read_size)
+
+
+def stream_report(f, handlers: Dict[str, Callable[[object], None]], chunk_size: int = 65536) -> Dict:
+    """
+    Parse a top-level JSON object from file f. Arrays under keys in handlers are
+    not materialized: each element is passed to handlers[key] as it is read.
+    Returns every other top-level field.
+    """
+    stream = _JSONStream(f, chunk_size)
+    fields = {}
+
+    stream.expect('{')
+    if stream.peek() == '}':
+        stream.pos += 1
+        return fields
+
+    while True:
+        key = stream.value()
+        if not isinstance(key, str):
+            raise stream._error("Expecting property name")
+        stream.expect(':')
+
+        handler = handlers.get(key)
+        if handler is not None and stream.peek() == '[':
+            stream.pos += 1
+            if stream.peek() == ']':
+                stream.pos += 1
+            else:
+                while True:
+                    handler(stream.value())
+                    if stream.expect(',]') == ']':
+                        break
+        else:
+            fields[key] = stream.value()
+
+        if stream.expect(',}') == '}':
+            return fields
+
+
+class HotspotSummary:
+    """One-pass aggregation of hotspots with a bounded heap for the top N by debt"""
+
+    def __init__(self, top_n: int = 10):
+        self.top_n = top_n
+        self.count = 0
+        self.total_debt = 0.0
+        self.total_vulnerabilities = 0
+        self._heap = []  # (debt, vulnerabilities, -index, hotspot), smallest first
+
+    def add(self, hotspot: Dict) -> None:
+        debt = float(hotspot.get('debt', 0) or 0)
+        vulnerabilities = int(hotspot.get('vulnerabilities', 0) or 0)
+        self.total_debt += debt
+        self.total_vulnerabilities += vulnerabilities
+
+        entry = (debt, vulnerabilities, -self.count, hotspot)
+        self.count += 1
+        if len(self._heap) < self.top_n:
+            heapq.heappush(self._heap, entry)
+        elif entry[:3] > self._heap[0][:3]:
+            heapq.heapreplace(self._heap, entry)
+
+    def add_all(self, hotspots: Iterable[Dict]) -> 'HotspotSummary':
+        for hotspot in hotspots:
+            self.add(hotspot)
+        return self
+
+    def top(self) -> List[Dict]:
+        """Top hotspots by debt (then vulnerabilities), highest first"""
+        return [entry[3] for entry in sorted(self._heap, key=lambda e: e[:3], reverse=True)]
+
+    def to_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'total_debt': round(self.total_debt, 2),
+            'total_vulnerabilities': self.total_vulnerabilities,
+            'top': self.top()
+        }
+
+
+def load_sast_summary(report_path: str, top_n: int = 10, chunk_size: int = 65536) -> Dict:
+    """
+    Load a SAST report's top-level metrics, aggregating hotspots in a single
+    streamed pass into 'hotspotSummary' instead of keeping the full list.
+    """
+    summary = HotspotSummary(top_n)
+    with open(report_path, 'r', encoding='utf-8') as f:
+        data = stream_report(f, {'hotspots': summary.add}, chunk_size)
+    data['hotspotSummary'] = summary.to_dict()
+    return data
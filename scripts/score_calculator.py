@@ -4,16 +4,51 @@ Code Quality & Liability Score Calculator
 Processes static analysis results and generates AI Debt Score for investors
 """
 
+import argparse
+import csv
+import glob
+import hashlib
 import json
 import os
 import sys
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from debt_model import DEFAULT_SCORING_CONFIG, load_scoring_config, score_report, score_reports
+from instrumentation import LOG_MODES, configure, log, metrics, timed
+from report_templates import escape_html, render, render_html, timestamp
+from sast_stream import HotspotSummary, load_sast_summary
+from score_history import record_results
+from sidecars import write_sidecar
+
+TOP_HOTSPOTS = 10
+REPORT_FORMATS = ('md', 'json', 'html')
+DEFAULT_FORMATS = ('md',)
+
+# Fields of a quality result returned to callers and recorded in batch summaries
+RESULT_FIELDS = ['ai_debt_score', 'human_cost', 'technical_debt_hours', 'vulnerabilities', 'analysis_date',
+                 'quality_summary', 'hotspot_summary', 'score_breakdown']
+
+# Bump when scoring or report rendering code changes so incremental runs rebuild everything
+SCORER_VERSION = 6
+MANIFEST_NAME = '.score_manifest.json'
+SUMMARY_CSV = 'quality_summary.csv'
+SUMMARY_JSON = 'quality_summary.json'
+REPORT_SUFFIX = '_Code_Quality_Report'
+
+@timed("score.load_sast_report")
+def read_sast_report(report_path):
+    """
+    Read a static analysis report, raising on missing or invalid files.
+    Hotspots are streamed and aggregated into 'hotspotSummary' rather than loaded.
+    """
+    return load_sast_summary(report_path, top_n=TOP_HOTSPOTS)
 
 def load_sast_report(report_path):
     """Load and parse the static analysis report"""
     try:
-        with open(report_path, 'r') as f:
-            return json.load(f)
+        return read_sast_report(report_path)
     except FileNotFoundError:
         print(f"❌ ERROR: SAST report not found at {report_path}")
         sys.exit(1)
@@ -23,8 +58,9 @@ def load_sast_report(report_path):
 
 def calculate_ai_debt_score(technical_debt_hours, total_code_hours=10):
     """
-    Calculate AI Debt Score based on technical debt
+    Legacy single-factor AI Debt Score based on technical debt only
     Score = 100 - (Technical Debt Hours / Total Code Hours) * 100
+    Reports now use the multi-factor model in debt_model.score_report.
     """
     if total_code_hours <= 0:
         return 0
@@ -48,103 +84,410 @@ def generate_quality_summary(score, vulnerabilities, code_smells):
     else:
         return "Code quality needs improvement with significant technical debt that may impact scalability."
 
-def generate_quality_report(sast_data, output_path="Code_Quality_Report.md"):
-    """Generate the final Code Quality Report"""
+def format_hotspot_table(hotspot_summary):
+    """Markdown table of the top hotspots by debt"""
+    if not hotspot_summary['count']:
+        return "No hotspots reported."
+    
+    rows = "\n".join(
+        f"| {h.get('file', 'unknown')} | {h.get('debt', 0)} | {h.get('vulnerabilities', 0)} |"
+        for h in hotspot_summary['top']
+    )
+    return f"""| File | Debt Hours | Vulnerabilities |
+|------|------------|-----------------|
+{rows}
+
+**Total Hotspots:** {hotspot_summary['count']} ({hotspot_summary['total_debt']} debt hours, {hotspot_summary['total_vulnerabilities']} vulnerabilities)"""
+
+def format_breakdown_table(breakdown):
+    """Markdown table of per-factor score deductions"""
+    rows = "\n".join(
+        f"| {factor['label']} | {factor['weight'] * 100:.0f}% | {factor['penalty'] * 100:.1f}% | -{factor['points_lost']} |"
+        for factor in breakdown.values()
+    )
+    return f"""| Factor | Weight | Penalty | Points Lost |
+|--------|--------|---------|-------------|
+{rows}"""
+
+def format_breakdown_rows_html(breakdown):
+    """HTML table rows of per-factor score deductions"""
+    return "\n".join(
+        f"<tr><td>{escape_html(factor['label'])}</td><td>{factor['weight'] * 100:.0f}%</td>"
+        f"<td>{factor['penalty'] * 100:.1f}%</td><td>-{factor['points_lost']}</td></tr>"
+        for factor in breakdown.values()
+    )
+
+def format_hotspot_table_html(hotspot_summary):
+    """HTML table of the top hotspots by debt"""
+    if not hotspot_summary['count']:
+        return "<p>No hotspots reported.</p>"
+    
+    rows = "\n".join(
+        f"<tr><td>{escape_html(str(h.get('file', 'unknown')))}</td><td>{h.get('debt', 0)}</td>"
+        f"<td>{h.get('vulnerabilities', 0)}</td></tr>"
+        for h in hotspot_summary['top']
+    )
+    return f"""<table>
+<tr><th>File</th><th>Debt Hours</th><th>Vulnerabilities</th></tr>
+{rows}
+</table>
+<p><strong>Total Hotspots:</strong> {hotspot_summary['count']} ({hotspot_summary['total_debt']} debt hours, {hotspot_summary['total_vulnerabilities']} vulnerabilities)</p>"""
+
+@timed("score.build_quality_result")
+def build_quality_result(sast_data, scoring_config=None, score=None):
+    """
+    Score a SAST report into the result dict every report format is rendered from.
+    Batch workers pass the score they computed for the whole chunk.
+    """
     
     # Extract metrics from SAST report
     technical_debt_hours = sast_data.get('technicalDebtHours', 0)
     vulnerabilities = sast_data.get('vulnerabilities', 0)
     code_smells = sast_data.get('codeSmells', 0)
-    coverage = sast_data.get('coverage', 0)
-    duplications = sast_data.get('duplications', 0)
+    hotspot_summary = sast_data.get('hotspotSummary') or \
+        HotspotSummary(TOP_HOTSPOTS).add_all(sast_data.get('hotspots') or []).to_dict()
     
     # Calculate scores and costs
-    ai_debt_score = calculate_ai_debt_score(technical_debt_hours)
-    human_cost = calculate_human_cost(technical_debt_hours)
-    quality_summary = generate_quality_summary(ai_debt_score, vulnerabilities, code_smells)
+    scoring_config = scoring_config or DEFAULT_SCORING_CONFIG
+    hourly_rate = scoring_config.get('hourly_rate', 85)
+    score = score or score_report(sast_data, scoring_config)
+    ai_debt_score = score['ai_debt_score']
     
-    # Generate report content
-    report_content = f"""# Code Quality & Liability Report
-
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
-**Project:** FounderX MVP  
-**Analysis Tool:** Static Analysis Security Testing (SAST)  
+    return {
+        'project_name': sast_data.get('projectName', 'FounderX MVP'),
+        'analysis_date': sast_data.get('analysisDate'),
+        'ai_debt_score': ai_debt_score,
+        'human_cost': calculate_human_cost(technical_debt_hours, hourly_rate),
+        'hourly_rate': hourly_rate,
+        'technical_debt_hours': technical_debt_hours,
+        'vulnerabilities': vulnerabilities,
+        'code_smells': code_smells,
+        'coverage': sast_data.get('coverage', 0),
+        'duplications': sast_data.get('duplications', 0),
+        'quality_summary': generate_quality_summary(ai_debt_score, vulnerabilities, code_smells),
+        'remediation_priority': 'High' if ai_debt_score < 60 else 'Medium' if ai_debt_score < 80 else 'Low',
+        'hotspot_summary': hotspot_summary,
+        'score_breakdown': score['breakdown']
+    }
 
-## Executive Summary
+def quality_report_context(result, fmt='md'):
+    """Template fields for a quality result: its values plus the tables pre-formatted for fmt"""
+    context = {**result, 'generated': timestamp(), 'debt_reduction_hours': result['technical_debt_hours'] * 0.3}
+    if fmt == 'html':
+        context['breakdown_rows_html'] = format_breakdown_rows_html(result['score_breakdown'])
+        context['hotspot_table_html'] = format_hotspot_table_html(result['hotspot_summary'])
+    else:
+        context['breakdown_table'] = format_breakdown_table(result['score_breakdown'])
+        context['hotspot_table'] = format_hotspot_table(result['hotspot_summary'])
+    return context
 
-**AI Debt Score:** {ai_debt_score}/100  
-**Quality Assessment:** {quality_summary}  
+def render_quality_report(result, fmt='md'):
+    """Render a quality result as Markdown ('md') or HTML ('html'); JSON is the sidecar (write_sidecar)"""
+    if fmt == 'html':
+        return render_html('quality_report.html', quality_report_context(result, fmt))
+    if fmt == 'md':
+        return render('quality_report.md', quality_report_context(result, fmt))
+    raise ValueError(f"Unknown report format: {fmt}")
 
-## Technical Metrics
+def report_output_paths(output_path, formats):
+    """
+    Output file per format; Markdown keeps output_path, others swap its extension.
+    The JSON sidecar is always included, and always last, since downstream stages read it.
+    """
+    base = os.path.splitext(output_path)[0]
+    ordered = [fmt for fmt in formats if fmt != 'json'] + ['json']
+    return {fmt: output_path if fmt == 'md' else f"{base}.{fmt}" for fmt in ordered}
 
-| Metric | Value | Impact |
-|--------|-------|--------|
-| Technical Debt Hours | {technical_debt_hours} | Remediation effort required |
-| Security Vulnerabilities | {vulnerabilities} | Security risk level |
-| Code Smells | {code_smells} | Maintainability issues |
-| Test Coverage | {coverage}% | Quality assurance level |
-| Code Duplications | {duplications}% | Efficiency concerns |
+@timed("score.generate_quality_report")
+def generate_quality_report(sast_data, output_path="Code_Quality_Report.md", verbose=True, scoring_config=None,
+                            formats=DEFAULT_FORMATS, score=None):
+    """Generate the final Code Quality Report in each requested format"""
+    
+    result = build_quality_result(sast_data, scoring_config, score)
+    
+    # Write one file per format, all rendered from the same result
+    for fmt, path in report_output_paths(output_path, formats).items():
+        if fmt != 'json':
+            with open(path, 'w') as f:
+                f.write(render_quality_report(result, fmt))
+    
+    # The sidecar goes last: read_sidecar ignores one older than its report
+    write_sidecar(output_path, result)
+    
+    metrics.inc("founderx_reports_scored_total")
+    if verbose:
+        log(f"✅ Code Quality Report generated: {output_path}\n"
+            f"   AI Debt Score: {result['ai_debt_score']}/100\n"
+            f"   Estimated Cost: ${result['human_cost']}\n"
+            f"   Quality: {result['quality_summary']}",
+            "quality_report_generated", output_path=output_path, ai_debt_score=result['ai_debt_score'],
+            human_cost=result['human_cost'])
+    
+    return {key: result[key] for key in RESULT_FIELDS}
 
-## Financial Impact
+def is_batch_output(path):
+    """Whether a JSON file is a batch summary or a report's sidecar rather than a SAST report"""
+    name = os.path.basename(path)
+    if name == SUMMARY_JSON or os.path.splitext(name)[0].endswith(REPORT_SUFFIX):
+        return True
+    # A sidecar sits next to the report it was written for
+    stem = os.path.splitext(path)[0]
+    return any(os.path.exists(f"{stem}.{fmt}") for fmt in REPORT_FORMATS if fmt != 'json')
 
-**Estimated Human Remediation Cost:** ${human_cost}  
-**Hourly Rate Assumption:** $85/hour  
-**Remediation Priority:** {'High' if ai_debt_score < 60 else 'Medium' if ai_debt_score < 80 else 'Low'}  
+def expand_report_paths(inputs):
+    """
+    Resolve directories and glob patterns to a sorted list of SAST report files.
+    Directories skip earlier batch output (summaries, reports' JSON sidecars) so
+    scoring into the input directory doesn't pick them up on the next run.
+    """
+    paths = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.update(path for path in glob.glob(os.path.join(item, '*.json')) if not is_batch_output(path))
+        else:
+            paths.update(glob.glob(item))
+    return sorted(paths)
 
-## Investor Risk Assessment
+def report_project_names(report_paths):
+    """
+    Project name per report: its path relative to the reports' common directory,
+    without extension, so proj_a/sast_report.json and proj_b/sast_report.json stay apart
+    """
+    if not report_paths:
+        return {}
+    root = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in report_paths])
+    return {path: os.path.splitext(os.path.relpath(os.path.abspath(path), root))[0].replace(os.sep, '/')
+            for path in report_paths}
 
-### Code Quality Score: {ai_debt_score}/100
+def score_report_file(report_path, output_dir, scoring_config=None, formats=DEFAULT_FORMATS, project=None):
+    """Score one SAST report into <output_dir>/<project>_Code_Quality_Report.<format>"""
+    return score_report_chunk([report_path], output_dir, scoring_config, formats, [project])[0]
 
-- **90-100:** Excellent - Production ready, minimal risk
-- **75-89:** Good - Investor ready with minor improvements needed  
-- **60-74:** Acceptable - Requires technical debt management
-- **0-59:** Poor - Significant technical risk, not investor ready
+def score_report_chunk(report_paths, output_dir, scoring_config=None, formats=DEFAULT_FORMATS, projects=None):
+    """
+    Batch worker: read a chunk of SAST reports, score them together with the
+    vectorized portfolio model, then render each one's reports
+    """
+    projects = projects or [None] * len(report_paths)
+    failed = {}
+    loaded = []
+    for report_path in report_paths:
+        try:
+            loaded.append((report_path, read_sast_report(report_path)))
+        except Exception as e:
+            failed[report_path] = e
+    
+    try:
+        scores = score_reports([sast_data for _, sast_data in loaded], scoring_config)
+    except Exception:
+        # A report with unusable values fails on its own below instead of taking the chunk down
+        scores = [None] * len(loaded)
+    scored = {report_path: (sast_data, score) for (report_path, sast_data), score in zip(loaded, scores)}
+    
+    results = []
+    for report_path, project in zip(report_paths, projects):
+        project = project or os.path.splitext(os.path.basename(report_path))[0]
+        output_path = os.path.join(output_dir, f"{project.replace('/', '__')}{REPORT_SUFFIX}.md")
+        try:
+            if report_path in failed:
+                raise failed[report_path]
+            sast_data, score = scored[report_path]
+            report = generate_quality_report(sast_data, output_path, verbose=False, scoring_config=scoring_config,
+                                             formats=formats, score=score)
+        except Exception as e:
+            # A malformed report (e.g. hotspots that aren't objects) fails alone, not the whole batch
+            results.append({'project': project, 'report_path': report_path, 'output_path': None,
+                            'error': str(e) or type(e).__name__})
+            continue
+        results.append({'project': project, 'report_path': report_path, 'output_path': output_path, 'error': None,
+                        'output_paths': report_output_paths(output_path, formats),
+                        # Score history tracks the project the report names, not the file it came from
+                        'history_project': sast_data.get('projectName') or project, **report})
+    return results
 
-### Risk Factors
+SUMMARY_FIELDS = ['project', 'ai_debt_score', 'human_cost', 'technical_debt_hours',
+                  'vulnerabilities', 'quality_summary', 'report_path', 'output_path', 'error']
 
-1. **Technical Debt:** {technical_debt_hours} hours of remediation required
-2. **Security:** {vulnerabilities} vulnerabilities need addressing
-3. **Maintainability:** {code_smells} code smells impact long-term scalability
-4. **Testing:** {coverage}% coverage may indicate quality gaps
+def write_batch_summary(results, output_dir):
+    """Write consolidated CSV and JSON summaries of a batch run"""
+    csv_path = os.path.join(output_dir, SUMMARY_CSV)
+    json_path = os.path.join(output_dir, SUMMARY_JSON)
+    
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(results)
+    
+    with open(json_path, 'w') as f:
+        json.dump(results, f, indent=2)
+    
+    return csv_path, json_path
 
-## Recommendations
+def score_reports_batch(report_paths, output_dir="quality_reports", workers=None, scoring_config=None,
+                        formats=DEFAULT_FORMATS, project_names=None):
+    """Score many SAST reports in parallel across cores, each worker scoring a chunk at a time"""
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(report_paths) // (workers * 4))
+    project_names = project_names or report_project_names(report_paths)
+    chunks = [report_paths[i:i + chunksize] for i in range(0, len(report_paths), chunksize)]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunk_results = executor.map(score_report_chunk, chunks,
+                                     [output_dir] * len(chunks),
+                                     [scoring_config] * len(chunks),
+                                     [formats] * len(chunks),
+                                     [[project_names[path] for path in chunk] for chunk in chunks])
+        return [result for results in chunk_results for result in results]
 
-1. **Immediate Actions:** Address {vulnerabilities} security vulnerabilities
-2. **Short-term:** Reduce technical debt by {technical_debt_hours * 0.3:.1f} hours
-3. **Long-term:** Improve test coverage to 80%+ for production readiness
+def file_hash(path):
+    """SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
 
-## Legal & IP Considerations
+def config_hash(scoring_config, formats=DEFAULT_FORMATS):
+    """Hash of everything besides the report itself that affects a project's result"""
+    payload = json.dumps({'version': SCORER_VERSION, 'top_hotspots': TOP_HOTSPOTS, 'formats': sorted(formats),
+                          'config': scoring_config or DEFAULT_SCORING_CONFIG}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
 
-This analysis confirms that the codebase has undergone human review and quality assessment, establishing IP defensibility through the Human Contribution Log (HCL) process.
+def load_manifest(output_dir, name=MANIFEST_NAME):
+    """Manifest of report path -> input hash, config hash, output path and result"""
+    try:
+        with open(os.path.join(output_dir, name), 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
 
----
-*Report generated by FounderX Quality Assurance System*
-"""
+def save_manifest(output_dir, manifest, name=MANIFEST_NAME):
+    """Write a manifest atomically; the pipeline keeps its own under another name"""
+    path = os.path.join(output_dir, name)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, path)
 
-    # Write report to file
-    with open(output_path, 'w') as f:
-        f.write(report_content)
+def score_reports_incremental(report_paths, output_dir="quality_reports", workers=None,
+                              scoring_config=None, force=False, formats=DEFAULT_FORMATS):
+    """
+    Score only reports whose content or scoring configuration changed since the
+    last run (or whose rendered report is missing). Returns (results, stats).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = {} if force else load_manifest(output_dir)
+    current_config = config_hash(scoring_config, formats)
+    # Named over every report, not just the stale ones, so names don't depend on what changed
+    project_names = report_project_names(report_paths)
     
-    print(f"✅ Code Quality Report generated: {output_path}")
-    print(f"   AI Debt Score: {ai_debt_score}/100")
-    print(f"   Estimated Cost: ${human_cost}")
-    print(f"   Quality: {quality_summary}")
+    results = {}
+    stale = []
+    input_hashes = {}
+    for report_path in report_paths:
+        try:
+            input_hashes[report_path] = file_hash(report_path)
+        except OSError:
+            input_hashes[report_path] = None
+        
+        entry = manifest.get(report_path)
+        input_hash = input_hashes[report_path]
+        if (entry and input_hash is not None and entry['input_hash'] == input_hash
+                and entry['config_hash'] == current_config
+                and entry['result']['project'] == project_names[report_path]
+                and entry['result']['output_path']
+                and all(os.path.exists(path) for path in entry['result']['output_paths'].values())):
+            results[report_path] = {**entry['result'], 'rescored': False}
+        else:
+            stale.append(report_path)
     
-    return {
-        'ai_debt_score': ai_debt_score,
-        'human_cost': human_cost,
-        'technical_debt_hours': technical_debt_hours,
-        'vulnerabilities': vulnerabilities,
-        'quality_summary': quality_summary
+    for result in score_reports_batch(stale, output_dir, workers, scoring_config, formats,
+                                      project_names) if stale else []:
+        results[result['report_path']] = {**result, 'rescored': True}
+    
+    new_manifest = {
+        path: {'input_hash': input_hashes[path], 'config_hash': current_config, 'result': results[path]}
+        for path in report_paths if not results[path]['error']
+    }
+    save_manifest(output_dir, new_manifest)
+    
+    stats = {
+        'total': len(report_paths),
+        'skipped': len(report_paths) - len(stale),
+        'rescored': len(stale),
+        'removed': len(set(manifest) - set(report_paths)),
+        'forced': force
     }
+    return [results[path] for path in report_paths], stats
+
+def run_batch(inputs, output_dir, workers, scoring_config=None, force=False, formats=DEFAULT_FORMATS,
+              history_dir=None):
+    """Batch mode: score every changed report matched by the inputs"""
+    report_paths = expand_report_paths(inputs)
+    if not report_paths:
+        print(f"❌ ERROR: No SAST reports found in {', '.join(inputs)}")
+        sys.exit(1)
+    
+    print(f"🔍 Scoring {len(report_paths)} SAST reports{' (full rebuild)' if force else ''}...")
+    
+    start = time.perf_counter()
+    results, stats = score_reports_incremental(report_paths, output_dir, workers, scoring_config, force, formats)
+    elapsed = time.perf_counter() - start
+    
+    csv_path, json_path = write_batch_summary(results, output_dir)
+    failed = [r for r in results if r['error']]
+    
+    print("🎉 Batch quality assessment complete!")
+    print(f"   Reports: {len(results) - len(failed)} scored, {len(failed)} failed")
+    print(f"   Incremental: {stats['rescored']} rescored, {stats['skipped']} unchanged and skipped "
+          f"({stats['skipped'] / stats['total']:.0%} hit rate)")
+    print(f"   Throughput: {len(results) / elapsed:.1f} reports/sec")
+    print(f"   Summary: {csv_path}, {json_path}")
+    if history_dir:
+        # Only this run's scores: unchanged reports were recorded when they were last scored
+        recorded = record_results(history_dir, ((r['history_project'], r) for r in results
+                                                if r['rescored'] and not r['error']))
+        print(f"   History: {recorded} results recorded in {history_dir}")
+    for r in failed:
+        print(f"   ❌ {r['report_path']}: {r['error']}")
 
 def main():
     """Main execution function"""
-    if len(sys.argv) != 2:
+    parser = argparse.ArgumentParser(description="Generate AI Debt Score reports from SAST results")
+    parser.add_argument('inputs', nargs='+', help="SAST report path (or directories/globs with --batch)")
+    parser.add_argument('--batch', action='store_true', help="Score every report in the given directories or globs")
+    parser.add_argument('--output-dir', default='quality_reports', help="Batch mode output directory")
+    parser.add_argument('--workers', type=int, default=None, help="Batch mode worker processes (default: all cores)")
+    parser.add_argument('--scoring-config', default=None, help="JSON file overriding the AI Debt Score factor table")
+    parser.add_argument('--force', action='store_true', help="Batch mode: rescore every report, ignoring the manifest")
+    parser.add_argument('--formats', default=','.join(DEFAULT_FORMATS),
+                        help=f"Comma-separated report formats to write ({', '.join(REPORT_FORMATS)}); "
+                             "the JSON sidecar is always written")
+    parser.add_argument('--history', default=None, help="Append results to this score history directory")
+    parser.add_argument('--project', default=None, help="Project name recorded in the history (default: report file name)")
+    parser.add_argument('--log-mode', choices=LOG_MODES, default=None, help="Progress output: print, structured or silent")
+    parser.add_argument('--metrics-file', default=None, help="Export timings and counters here on exit (.json or Prometheus text)")
+    args = parser.parse_args()
+    configure(log_mode=args.log_mode, metrics_file=args.metrics_file)
+    
+    formats = tuple(fmt.strip() for fmt in args.formats.split(',') if fmt.strip())
+    unknown = [fmt for fmt in formats if fmt not in REPORT_FORMATS]
+    if unknown or not formats:
+        parser.error(f"--formats must be a list of {', '.join(REPORT_FORMATS)}")
+    
+    scoring_config = load_scoring_config(args.scoring_config)
+    
+    if args.batch:
+        run_batch(args.inputs, args.output_dir, args.workers, scoring_config, args.force, formats, args.history)
+        return
+    
+    if len(args.inputs) != 1:
         print("Usage: python score_calculator.py <sast_report_path>")
+        print("       python score_calculator.py --batch <dir_or_glob>... [--output-dir DIR] [--workers N]")
         sys.exit(1)
     
-    sast_report_path = sys.argv[1]
+    sast_report_path = args.inputs[0]
     
     print("🔍 Processing Static Analysis Report...")
     
@@ -152,12 +495,17 @@ def main():
     sast_data = load_sast_report(sast_report_path)
     
     # Generate quality report
-    results = generate_quality_report(sast_data)
+    results = generate_quality_report(sast_data, scoring_config=scoring_config, formats=formats)
     
     print("🎉 Quality assessment complete!")
     print(f"   Score: {results['ai_debt_score']}/100")
     print(f"   Cost: ${results['human_cost']}")
     print(f"   Debt: {results['technical_debt_hours']} hours")
+    
+    if args.history:
+        project = args.project or sast_data.get('projectName') or os.path.splitext(os.path.basename(sast_report_path))[0]
+        record_results(args.history, [(project, results)])
+        print(f"   History: recorded {project} in {args.history}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Score History Store
+Append-only columnar history of quality results per project and analysis date.
+Metrics are stored column by column in a ColumnTable, so range queries, week-over-week
+deltas and regression checks scan only the columns they need, never the JSON reports.
+"""
+
+import argparse
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from column_store import ColumnTable, np
+
+EPOCH = date(1970, 1, 1)
+
+# Column name -> array typecode; 'project' is dictionary-encoded into project.dict
+KEY_COLUMNS = {'project': 'I', 'day': 'i'}
+METRIC_COLUMNS = {
+    'ai_debt_score': 'f',
+    'human_cost': 'd',
+    'technical_debt_hours': 'f',
+    'vulnerabilities': 'i'
+}
+COLUMNS = {**KEY_COLUMNS, **METRIC_COLUMNS}
+
+# Week-over-week change that raises an alert: negative thresholds flag drops, positive flag rises
+REGRESSION_THRESHOLDS = {
+    'ai_debt_score': -5.0,
+    'human_cost': 500.0,
+    'vulnerabilities': 1
+}
+
+
+def to_day(value) -> int:
+    """Days since 1970-01-01 for a date or ISO date string"""
+    if isinstance(value, str):
+        value = date.fromisoformat(value[:10])
+    return (value - EPOCH).days
+
+
+def from_day(day: int) -> str:
+    return (EPOCH + timedelta(days=int(day))).isoformat()
+
+
+class ScoreHistory:
+    """A ColumnTable with dictionary-encoded project names and analysis days since 1970-01-01"""
+
+    def __init__(self, directory: str = "score_history"):
+        self.directory = directory
+        self.table = ColumnTable(directory, COLUMNS, dictionaries=('project',))
+        self.projects = self.table.dictionaries['project']
+        self.project_index = self.table.codes['project']
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def append_many(self, rows: Iterable[Dict]) -> int:
+        """
+        Append rows of {'project', 'date', <metrics>}; missing metrics are stored as 0.
+        Returns the number of rows written.
+        """
+        return self.table.append_rows(
+            {**row, 'day': to_day(row.get('date') or date.today())} for row in rows
+        )
+
+    def append(self, project: str, analysis_date=None, **metrics) -> None:
+        self.append_many([{'project': project, 'date': analysis_date, **metrics}])
+
+    def _column(self, column: str):
+        return self.table.column(column)
+
+    def _row(self, i: int) -> Dict:
+        values = self.table.row(i)
+        row = {'project': values['project'], 'date': from_day(values['day'])}
+        for metric, typecode in METRIC_COLUMNS.items():
+            row[metric] = values[metric] if typecode == 'i' else round(values[metric], 2)
+        return row
+
+    def query(self, project: Optional[str] = None, start=None, end=None) -> List[Dict]:
+        """Rows for one project (or all) with start <= date <= end, in date then insertion order"""
+        if project is not None and project not in self.project_index:
+            return []
+        target = self.project_index.get(project)
+        lo = to_day(start) if start is not None else None
+        hi = to_day(end) if end is not None else None
+
+        projects, days = self._column('project'), self._column('day')
+        if np is not None:
+            mask = np.ones(len(self), dtype=bool)
+            if target is not None:
+                mask &= projects == target
+            if lo is not None:
+                mask &= days >= lo
+            if hi is not None:
+                mask &= days <= hi
+            rows = np.nonzero(mask)[0]
+            rows = rows[np.argsort(days[rows], kind='stable')]
+        else:
+            rows = sorted((i for i in range(len(self))
+                           if (target is None or projects[i] == target)
+                           and (lo is None or days[i] >= lo) and (hi is None or days[i] <= hi)),
+                          key=lambda i: days[i])
+        return [self._row(int(i)) for i in rows]
+
+    def latest_in_window(self, lo: int, hi: int) -> Dict[int, int]:
+        """project index -> row of its most recent entry with lo <= day <= hi"""
+        projects, days = self._column('project'), self._column('day')
+        if np is not None:
+            rows = np.nonzero((days >= lo) & (days <= hi))[0]
+            if not len(rows):
+                return {}
+            # Sort by (day, insertion order) so each project's last row is its latest
+            rows = rows[np.lexsort((rows, days[rows]))][::-1]
+            _, first = np.unique(projects[rows], return_index=True)
+            return {int(projects[rows[i]]): int(rows[i]) for i in first}
+
+        latest = {}
+        for i in range(len(self)):
+            if lo <= days[i] <= hi:
+                best = latest.get(projects[i])
+                if best is None or days[i] >= days[best]:
+                    latest[projects[i]] = i
+        return latest
+
+    def week_over_week(self, metric: str = 'ai_debt_score', as_of=None) -> Dict[str, Dict]:
+        """
+        Per project: the latest value in the 7 days ending as_of, the latest value in
+        the 7 days before that, and their delta. Projects without both are omitted.
+        """
+        end = to_day(as_of or date.today())
+        current = self.latest_in_window(end - 6, end)
+        previous = self.latest_in_window(end - 13, end - 7)
+        values = self._column(metric)
+
+        changes = {}
+        for project, row in current.items():
+            if project in previous:
+                now, before = float(values[row]), float(values[previous[project]])
+                changes[self.projects[project]] = {
+                    'current': round(now, 2),
+                    'previous': round(before, 2),
+                    'delta': round(now - before, 2)
+                }
+        return changes
+
+    def regressions(self, as_of=None, thresholds: Optional[Dict[str, float]] = None) -> List[Dict]:
+        """Week-over-week changes across the portfolio that cross a regression threshold"""
+        alerts = []
+        for metric, threshold in (thresholds or REGRESSION_THRESHOLDS).items():
+            for project, change in self.week_over_week(metric, as_of).items():
+                if (threshold < 0 and change['delta'] <= threshold) or (threshold > 0 and change['delta'] >= threshold):
+                    alerts.append({'project': project, 'metric': metric, 'threshold': threshold, **change})
+        return sorted(alerts, key=lambda alert: (alert['project'], alert['metric']))
+
+
+def record_results(history_dir: str, results: Iterable[Tuple[str, Dict]], analysis_date=None) -> int:
+    """
+    Append (project, quality result) pairs to the history in history_dir. Each row is
+    dated by its result's analysis_date (the SAST report's analysisDate), else by
+    analysis_date, else today.
+    """
+    analysis_date = analysis_date or date.today()
+    return ScoreHistory(history_dir).append_many(
+        {**result, 'project': project, 'date': result.get('analysis_date') or analysis_date}
+        for project, result in results
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the AI Debt Score history")
+    parser.add_argument('history_dir', help="Score history directory")
+    parser.add_argument('--project', default=None, help="Show one project's history")
+    parser.add_argument('--start', default=None, help="First analysis date (YYYY-MM-DD)")
+    parser.add_argument('--end', default=None, help="Last analysis date (YYYY-MM-DD)")
+    parser.add_argument('--as-of', default=None, help="End of the week for deltas and alerts (default: today)")
+    args = parser.parse_args()
+
+    history = ScoreHistory(args.history_dir)
+    print(f"📚 {len(history):,} results for {len(history.projects):,} projects in {args.history_dir}")
+
+    if args.project:
+        for row in history.query(args.project, args.start, args.end):
+            print(f"   {row['date']}: score {row['ai_debt_score']}, cost ${row['human_cost']}, "
+                  f"{row['vulnerabilities']} vulnerabilities")
+        return
+
+    changes = history.week_over_week('ai_debt_score', args.as_of)
+    if changes:
+        deltas = [change['delta'] for change in changes.values()]
+        print(f"📈 Week over week: {len(changes)} projects, mean score change {sum(deltas) / len(deltas):+.2f}")
+
+    alerts = history.regressions(args.as_of)
+    if not alerts:
+        print("✅ No regressions")
+    for alert in alerts:
+        print(f"⚠️  {alert['project']}: {alert['metric']} {alert['previous']} -> {alert['current']} "
+              f"({alert['delta']:+})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Machine-Readable Report Sidecars
+Each pipeline stage writes a compact JSON file next to its human-readable report
+(Code_Quality_Report.md -> Code_Quality_Report.json) so downstream stages read
+values directly instead of scraping Markdown.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+SIDECAR_VERSION = 1
+
+
+def sidecar_path(report_path: str) -> str:
+    return f"{os.path.splitext(report_path)[0]}.json"
+
+
+def write_sidecar(report_path: str, data: Dict) -> str:
+    """Write data as the report's sidecar (atomically) and return the sidecar path"""
+    path = sidecar_path(report_path)
+    # Unique per writer, so concurrent writers of one report never share a temp file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump({'sidecar_version': SIDECAR_VERSION, **data}, f, separators=(',', ':'), default=str)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_sidecar(report_path: str) -> Optional[Dict]:
+    """
+    The report's sidecar data, or None if it is missing, unreadable, from another
+    sidecar version, or older than the report (the report was regenerated without it).
+    """
+    path = sidecar_path(report_path)
+    try:
+        sidecar_mtime = os.path.getmtime(path)
+        if os.path.exists(report_path) and os.path.getmtime(report_path) > sidecar_mtime:
+            return None
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get('sidecar_version') != SIDECAR_VERSION:
+        return None
+    return data
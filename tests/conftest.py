@@ -0,0 +1,17 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
+sys.path.insert(0, os.path.join(ROOT, 'aga_service'))
+
+import pytest
+
+from instrumentation import configure
+
+
+@pytest.fixture(autouse=True)
+def quiet_logs():
+    """Keep emoji progress output out of test logs"""
+    configure(log_mode='silent')
+    yield
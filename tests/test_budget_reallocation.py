@@ -0,0 +1,71 @@
+from ad_platforms import PlatformAdapter, mock_platform_results
+from campaign_store import JSONFileCampaignStore
+from growth_agent import GrowthAgent
+
+# Signups per dollar each platform converts at; Facebook is clearly best
+RATES = {"Google Search": 0.05, "Facebook": 2.0, "LinkedIn": 0.05}
+
+
+class RateAdapter(PlatformAdapter):
+    """Spends the whole allocation and converts at a fixed per-platform rate"""
+
+    def run_ad(self, ad):
+        budget = ad["budget_allocation"]
+        return {**mock_platform_results(budget), "budget_spent": budget,
+                "signups": int(budget * RATES[ad["platform"]])}
+
+
+class Overspender(PlatformAdapter):
+    def run_ad(self, ad):
+        return {**mock_platform_results(ad["budget_allocation"]), "budget_spent": ad["budget_allocation"] * 3}
+
+
+class NoTraction:
+    def register_campaign(self, campaign_id):
+        pass
+
+    def finish_campaign(self, campaign_id):
+        pass
+
+    def daily_metrics(self, campaign_id, day):
+        return {"day": day, "signups": 0, "revenue": 0.0, "traffic": 0}
+
+
+def launch(tmp_path, adapter, campaign_id="c1"):
+    agent = GrowthAgent(platform_adapter=adapter, store=JSONFileCampaignStore(str(tmp_path)),
+                        metrics_source=NoTraction())
+    agent.budget_limit = 100.0
+    # Start from an even split so only observed signups move the budget
+    ad_copies = [{**ad, "budget_allocation": 10.0} for ad in agent.generate_ad_copies(agent.extract_target_data(""))]
+    campaign_results = agent.execute_campaign(campaign_id, ad_copies)
+    budget_reallocation = agent.plan_reallocation(campaign_results)
+    agent.monitor_traction(campaign_id, ad_copies=ad_copies, budget_reallocation=budget_reallocation)
+    return campaign_results, budget_reallocation
+
+
+def test_monitoring_spends_the_remaining_budget_within_the_limit(tmp_path):
+    campaign_results, budget_reallocation = launch(tmp_path, RateAdapter())
+    days = budget_reallocation["days"]
+    assert [day["day"] for day in days] == list(range(1, 8))
+    total = campaign_results["total_spent"] + sum(day["spent"] for day in days)
+    assert total <= 100.0 + 1e-9
+    assert budget_reallocation["remaining_budget"] < 5.0
+
+
+def test_budget_shifts_to_the_platform_converting_best(tmp_path):
+    _, budget_reallocation = launch(tmp_path, RateAdapter())
+    last = budget_reallocation["days"][-1]["allocation"]
+    assert last["Facebook"] > last["Google Search"] + last["LinkedIn"]
+    observed = budget_reallocation["observed"]
+    assert observed["Facebook"]["spent"] > observed["Google Search"]["spent"]
+
+
+def test_reallocation_is_reproducible(tmp_path):
+    assert launch(tmp_path, RateAdapter())[1] == launch(tmp_path, RateAdapter())[1]
+
+
+def test_overspending_adapter_is_clamped_to_the_limit(tmp_path):
+    campaign_results, budget_reallocation = launch(tmp_path, Overspender())
+    recorded = sum(totals["spent"] for totals in budget_reallocation["observed"].values())
+    assert recorded <= 100.0 + 1e-9
+    assert budget_reallocation["remaining_budget"] == 0.0
@@ -0,0 +1,33 @@
+from campaign_archive import CampaignArchive
+
+RESULTS = {
+    "project_id": "p1",
+    "campaign_id": "c1",
+    "campaign_results": {"platforms": {
+        "google": {"budget_spent": 50.0, "impressions": 1000, "clicks": 40, "signups": 20, "revenue": 10.0},
+        "meta": {"budget_spent": 35.0, "impressions": 800, "clicks": 16, "signups": 9, "revenue": 0.0}
+    }},
+    "monitoring_results": {"daily_metrics": [{"day": 1, "signups": 20, "revenue": 10.0, "traffic": 300},
+                                             {"day": 2, "signups": 9, "revenue": 0.0, "traffic": 200}]}
+}
+
+
+def test_archiving_is_idempotent(tmp_path):
+    archive = CampaignArchive(str(tmp_path))
+    assert archive.add(RESULTS) == {"platforms": 2, "daily": 2, "skipped": 0}
+    assert archive.add_many([RESULTS, RESULTS]) == {"platforms": 0, "daily": 0, "skipped": 2}
+
+    reopened = CampaignArchive(str(tmp_path))
+    assert reopened.add(RESULTS)["skipped"] == 1
+    summary = reopened.summary()
+    assert summary["campaigns"] == 1
+    assert summary["total_spend"] == 85.0
+    assert summary["total_signups"] == 29
+
+
+def test_interrupted_add_is_completed(tmp_path):
+    archive = CampaignArchive(str(tmp_path))
+    # A crash after the platform rows were written but before the daily rows
+    archive.platforms.append_rows([{"project_id": "p1", "campaign_id": "c1", "platform": "google", "spend": 50.0}])
+    written = CampaignArchive(str(tmp_path)).add(RESULTS)
+    assert written == {"platforms": 0, "daily": 2, "skipped": 0}
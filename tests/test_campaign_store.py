@@ -0,0 +1,93 @@
+import json
+import os
+
+import pytest
+
+from campaign_store import (CampaignStore, JSONFileCampaignStore, SQLiteCampaignStore, campaign_status,
+                            create_campaign_store)
+
+
+def results(project_id, campaign_id, completion_time, signups=10):
+    return {
+        "project_id": project_id,
+        "campaign_id": campaign_id,
+        "campaign_results": {"total_signups": signups, "total_spent": 85.0, "total_revenue": 20.0},
+        "monitoring_results": {"final_status": "traction_failed"},
+        "traction_validated": False,
+        "completion_time": completion_time
+    }
+
+
+def test_base_store_is_abstract():
+    with pytest.raises(TypeError):
+        CampaignStore()
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "json"])
+def test_save_and_read_back(tmp_path, backend):
+    path = str(tmp_path / "campaigns.db") if backend == "sqlite" else str(tmp_path)
+    store = create_campaign_store(backend, path)
+    try:
+        store.save(results("p1", "c1", "2026-01-01T00:00:00"))
+        assert store.get_campaign("c1")["project_id"] == "p1"
+        assert store.get_campaign("missing") is None
+        assert store.get_status("p1") == campaign_status(results("p1", "c1", "2026-01-01T00:00:00"))
+        assert store.get_status("nobody") is None
+    finally:
+        store.close()
+
+
+def test_sqlite_latest_campaign_is_newest(tmp_path):
+    store = SQLiteCampaignStore(str(tmp_path / "campaigns.db"), batch_size=10)
+    try:
+        store.save_many([results("p1", "old", "2026-01-01T00:00:00", signups=1),
+                         results("p1", "new", "2026-01-02T00:00:00", signups=2),
+                         results("p2", "other", "2026-01-03T00:00:00")])
+        assert [c["campaign_id"] for c in store.get_project_campaigns("p1")] == ["new", "old"]
+        assert store.get_latest("p1")["campaign_id"] == "new"
+    finally:
+        store.close()
+
+
+def test_sqlite_buffered_writes_are_visible_to_reads(tmp_path):
+    store = SQLiteCampaignStore(str(tmp_path / "campaigns.db"), batch_size=100)
+    try:
+        store.save(results("p1", "c1", "2026-01-01T00:00:00"))
+        assert store.get_campaign("c1") is not None
+    finally:
+        store.close()
+
+    reopened = SQLiteCampaignStore(str(tmp_path / "campaigns.db"))
+    try:
+        assert reopened.get_campaign("c1") is not None
+    finally:
+        reopened.close()
+
+
+def test_sqlite_traction_windows_accumulate(tmp_path):
+    store = SQLiteCampaignStore(str(tmp_path / "campaigns.db"))
+    try:
+        store.add_traction_windows([("c1", 1, 2, 10.0, 30), ("c1", 2, 1, 0.0, 5)])
+        store.add_traction_windows([("c1", 1, 3, 5.0, 10)])
+        assert store.get_traction_windows("c1") == {1: (5, 15.0, 40), 2: (1, 0.0, 5)}
+        assert store.get_traction_windows("c2") == {}
+    finally:
+        store.close()
+
+
+def test_json_store_writes_whole_files(tmp_path):
+    store = JSONFileCampaignStore(str(tmp_path))
+    store.save(results("p1", "c1", "2026-01-01T00:00:00"))
+    store.save(results("p1", "c2", "2026-01-02T00:00:00"))
+    assert os.listdir(tmp_path) == ["AGAResults_p1.json"]
+    with open(tmp_path / "AGAResults_p1.json") as f:
+        assert json.load(f)["campaign_id"] == "c2"
+
+
+def test_standalone_launch_writes_results_file(tmp_path, monkeypatch):
+    from growth_agent import launchCampaign
+
+    monkeypatch.chdir(tmp_path)
+    launched = launchCampaign("TEST_PROJECT", {"storage_path": str(tmp_path / "campaigns.db")})
+    with open(tmp_path / "AGAResults_TEST_PROJECT.json") as f:
+        assert json.load(f)["campaign_id"] == launched["campaign_id"]
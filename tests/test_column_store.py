@@ -0,0 +1,45 @@
+import os
+
+from column_store import ColumnTable
+
+COLUMNS = {"name": "I", "value": "d", "count": "q"}
+
+
+def table(path):
+    return ColumnTable(str(path), COLUMNS, dictionaries=("name",))
+
+
+def test_rows_round_trip_across_reopen(tmp_path):
+    assert table(tmp_path).append_rows([{"name": "a", "value": 1.5, "count": 2}, {"name": "b"}]) == 2
+    reopened = table(tmp_path)
+    assert len(reopened) == 2
+    assert reopened.row(0) == {"name": "a", "value": 1.5, "count": 2}
+    assert reopened.row(1) == {"name": "b", "value": 0.0, "count": 0}
+
+
+def test_repair_truncates_columns_to_the_shortest(tmp_path):
+    table(tmp_path).append_rows([{"name": "a", "value": 1.0, "count": 1}, {"name": "a", "value": 2.0, "count": 2}])
+    # A crash mid-append: one column got a third row, another only half of one
+    with open(tmp_path / "value.col", "ab") as f:
+        f.write(b"\0" * 8)
+    with open(tmp_path / "count.col", "ab") as f:
+        f.write(b"\0" * 3)
+
+    reopened = table(tmp_path)
+    assert len(reopened) == 2
+    assert os.path.getsize(tmp_path / "value.col") == 16
+    assert os.path.getsize(tmp_path / "count.col") == 16
+    assert reopened.append_rows([{"name": "c", "value": 3.0, "count": 3}]) == 1
+    assert table(tmp_path).row(2) == {"name": "c", "value": 3.0, "count": 3}
+
+
+def test_repair_drops_a_torn_dictionary_line(tmp_path):
+    table(tmp_path).append_rows([{"name": "a"}])
+    with open(tmp_path / "name.dict", "a") as f:
+        f.write('"tor')
+
+    reopened = table(tmp_path)
+    assert reopened.dictionaries["name"] == ["a"]
+    reopened.append_rows([{"name": "b"}])
+    assert table(tmp_path).dictionaries["name"] == ["a", "b"]
+    assert table(tmp_path).row(1)["name"] == "b"
@@ -0,0 +1,28 @@
+import json
+import os
+
+from debt_model import score_portfolio, score_report, score_reports
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def sample_reports():
+    with open(os.path.join(ROOT, 'data', 'mock_sast_report.json')) as f:
+        base = json.load(f)
+    return [base, {**base, 'security': None, 'vulnerabilities': 12}, {'technicalDebtHours': 40, 'linesOfCode': 500},
+            {}]
+
+
+def test_empty_portfolio():
+    portfolio = score_portfolio([])
+    assert len(portfolio['ai_debt_score']) == 0
+    assert score_reports([]) == []
+
+
+def test_batch_scores_match_single_report_scoring():
+    for report in sample_reports():
+        single = score_report(report)
+        batch = score_reports([report])[0]
+        assert batch['ai_debt_score'] == single['ai_debt_score']
+        for name, factor in single['breakdown'].items():
+            assert abs(batch['breakdown'][name]['penalty'] - factor['penalty']) <= 0.001
@@ -0,0 +1,115 @@
+import threading
+import time
+
+from extraction_client import (ExtractionBackend, ExtractionClient, FakeExtractionServer, HTTPExtractionBackend,
+                               LocalExtractionBackend)
+
+
+class FlakyBackend(ExtractionBackend):
+    """Waits, then fails every call with the given error"""
+
+    def __init__(self, error: Exception, delay: float = 0.0):
+        self.error = error
+        self.delay = delay
+        self.calls = 0
+
+    def extract_batch(self, documents):
+        self.calls += 1
+        time.sleep(self.delay)
+        raise self.error
+
+
+def extract_all(client, documents):
+    """Submit every document at once so they share a batch; returns result or exception per document"""
+    futures = [client.submit(namespace, content) for namespace, content in documents]
+    outcomes = []
+    for future in futures:
+        try:
+            outcomes.append(future.result(timeout=10))
+        except Exception as e:
+            outcomes.append(e)
+    return outcomes
+
+
+def test_transport_errors_fail_the_whole_batch_at_once():
+    backend = FlakyBackend(ConnectionError("connection reset"), delay=0.2)
+    with ExtractionClient(backend, max_wait=0.05) as client:
+        start = time.perf_counter()
+        outcomes = extract_all(client, [("plan", f"doc {i}") for i in range(8)])
+        elapsed = time.perf_counter() - start
+
+    assert all(isinstance(outcome, ConnectionError) for outcome in outcomes)
+    assert backend.calls == 1
+    assert elapsed < 1.0
+
+
+def test_rejected_document_fails_alone():
+    def extract(content):
+        if content == "bad":
+            raise ValueError("unparseable plan")
+        return {"length": len(content)}
+
+    backend = LocalExtractionBackend({"plan": extract})
+    with ExtractionClient(backend, max_wait=0.05) as client:
+        outcomes = extract_all(client, [("plan", "good"), ("plan", "bad"), ("plan", "fine")])
+
+    assert outcomes[0] == {"length": 4}
+    assert isinstance(outcomes[1], ValueError)
+    assert outcomes[2] == {"length": 4}
+
+
+def test_http_4xx_is_split_per_document():
+    server = FakeExtractionServer(LocalExtractionBackend({"plan": lambda content: {"content": content}}),
+                                  latency=0.0, per_document=0.0).start()
+    try:
+        with ExtractionClient(HTTPExtractionBackend(server.url, timeout=5), max_wait=0.05) as client:
+            # The server rejects the batch (400) because of the unknown namespace; the rest still extract
+            outcomes = extract_all(client, [("plan", "a"), ("unknown", "b"), ("plan", "c")])
+    finally:
+        server.stop()
+
+    assert outcomes[0] == {"content": "a"}
+    assert outcomes[1].code == 400
+    assert outcomes[2] == {"content": "c"}
+
+
+def test_http_timeout_is_not_retried_per_document():
+    server = FakeExtractionServer(LocalExtractionBackend({"plan": lambda content: {}}), latency=0.5,
+                                  per_document=0.0, max_concurrency=16).start()
+    try:
+        with ExtractionClient(HTTPExtractionBackend(server.url, timeout=0.1), max_wait=0.05) as client:
+            outcomes = extract_all(client, [("plan", f"doc {i}") for i in range(4)])
+            time.sleep(0.6)  # let the server finish the timed-out call before counting
+    finally:
+        server.stop()
+
+    assert all(isinstance(outcome, OSError) for outcome in outcomes)
+    assert server.calls == 1
+
+
+def test_fallback_runs_when_the_backend_is_down():
+    client = ExtractionClient(FlakyBackend(TimeoutError("timed out")))
+    try:
+        extract = client.extractor("plan", fallback=lambda content: {"local": True})
+        assert extract("plan text") == {"local": True}
+    finally:
+        client.close()
+
+
+def test_identical_requests_share_one_call():
+    release = threading.Event()
+    calls = []
+
+    def extract(content):
+        release.wait(5)
+        return {"content": content}
+
+    backend = LocalExtractionBackend({"plan": extract})
+    original = backend.extract_batch
+    backend.extract_batch = lambda documents: calls.append(len(documents)) or original(documents)
+    with ExtractionClient(backend, max_wait=0.05) as client:
+        futures = [client.submit("plan", "same") for _ in range(5)]
+        release.set()
+        assert [future.result(timeout=5) for future in futures] == [{"content": "same"}] * 5
+    assert calls == [1]
+    assert client.stats()["coalesced"] == 4
@@ -0,0 +1,82 @@
+import time
+
+from campaign_scheduler import CampaignScheduler
+from campaign_store import JSONFileCampaignStore
+from growth_agent import GrowthAgent
+from job_queue import JobQueue
+
+
+def queue(tmp_path, **kwargs):
+    return JobQueue(str(tmp_path / "jobs.db"), **kwargs)
+
+
+def test_recover_leaves_live_leases_alone(tmp_path):
+    jobs = queue(tmp_path, lease_seconds=60)
+    jobs.enqueue("execute", "c1", {}, "c1:execute")
+    job = jobs.claim()
+    assert jobs.recover() == {"requeued": 0, "failed": 0}
+    assert jobs.backlog()["running"] == 1
+
+    jobs.heartbeat([job["id"]])
+    assert jobs.recover() == {"requeued": 0, "failed": 0}
+    jobs.close()
+
+
+def test_recover_requeues_stale_jobs_until_attempts_run_out(tmp_path):
+    jobs = queue(tmp_path, lease_seconds=0.01)
+    jobs.enqueue("execute", "c1", {}, "c1:execute", max_attempts=2)
+
+    assert jobs.claim()["attempt"] == 1
+    time.sleep(0.02)
+    assert jobs.recover() == {"requeued": 1, "failed": 0}
+
+    assert jobs.claim()["attempt"] == 2
+    time.sleep(0.02)
+    # The second lost run exhausts the job instead of retrying it forever
+    assert jobs.recover() == {"requeued": 0, "failed": 1}
+    assert jobs.backlog()["failed"] == 1
+    assert jobs.claim() is None
+    jobs.close()
+
+
+def test_idempotency_keys_and_checkpoints(tmp_path):
+    jobs = queue(tmp_path)
+    first = jobs.enqueue("execute", "c1", {}, "c1:execute")
+    assert jobs.enqueue("execute", "c1", {"other": True}, "c1:execute") == first
+    jobs.checkpoint("c1:execute", {"total_spent": 85.0})
+    jobs.checkpoint("c10:execute", {"total_spent": 1.0})
+    assert jobs.get_checkpoint("c1:execute") == {"total_spent": 85.0}
+
+    jobs.clear_checkpoints("c1")
+    assert jobs.get_checkpoint("c1:execute") is None
+    assert jobs.get_checkpoint("c10:execute") == {"total_spent": 1.0}
+    jobs.close()
+
+
+class CountingAdapter:
+    """Platform adapter that counts the ads it runs"""
+
+    def __init__(self):
+        self.runs = []
+
+    def run_ad(self, ad):
+        self.runs.append(ad["idempotency_key"])
+        return {"budget_spent": ad["budget_allocation"], "signups": 5, "revenue": 10.0, "clicks": 50}
+
+
+def test_retried_execute_does_not_spend_twice(tmp_path):
+    adapter = CountingAdapter()
+    agent = GrowthAgent(platform_adapter=adapter, store=JSONFileCampaignStore(str(tmp_path)))
+    scheduler = CampaignScheduler(agent=agent, queue=queue(tmp_path), duration_days=1)
+    context = {"project_id": "p1", "campaign_id": "c1", "options": {},
+               "ad_copies": agent.generate_ad_copies(agent.get_target_data(str(tmp_path / "missing.md")))}
+
+    first, _ = scheduler._execute(context)
+    spent = len(adapter.runs)
+    # A worker that dies after spending but before completing the job reruns it from the checkpoint
+    second, _ = scheduler._execute(context)
+    assert len(adapter.runs) == spent
+    assert second == first
+    assert all(key.startswith("c1:execute:") for key in adapter.runs)
+    scheduler.queue.close()
+    agent.close()
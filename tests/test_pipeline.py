@@ -0,0 +1,18 @@
+from pipeline import MANIFEST_NAME, stage_report
+from score_calculator import load_manifest, save_manifest
+
+
+def test_stage_report_uses_nearest_rank_p50():
+    outcomes = {f"p{i}": {"score": {"status": "ran", "seconds": float(i)}} for i in range(1, 5)}
+    outcomes["p5"] = {"score": {"status": "cached", "seconds": 0.0}}
+    report = stage_report(outcomes, ["score"])["score"]
+    assert report["p50"] == 2.0
+    assert report["ran"] == 4 and report["cached"] == 1
+    assert report["max"] == 4.0
+
+
+def test_pipeline_manifest_is_separate_from_score_manifest(tmp_path):
+    save_manifest(str(tmp_path), {"score": {"input_hash": "abc"}}, MANIFEST_NAME)
+    assert load_manifest(str(tmp_path), MANIFEST_NAME) == {"score": {"input_hash": "abc"}}
+    assert load_manifest(str(tmp_path)) == {}
+    assert sorted(p.name for p in tmp_path.iterdir()) == [MANIFEST_NAME]
@@ -0,0 +1,86 @@
+import threading
+import time
+
+from plan_cache import PlanCache
+
+
+def write(path, content):
+    with open(path, 'wb') as f:
+        f.write(content)
+
+
+def test_extracts_once_per_content(tmp_path):
+    plan = tmp_path / "Business_Plan.md"
+    write(plan, b"# Plan")
+    calls = []
+    cache = PlanCache()
+
+    def extractor(content):
+        calls.append(content)
+        return {"len": len(content)}
+
+    assert cache.get(str(plan), "ns", extractor) == {"len": 6}
+    assert cache.get(str(plan), "ns", extractor) == {"len": 6}
+    assert calls == ["# Plan"]
+
+    write(plan, b"# Plan v2")
+    assert cache.get(str(plan), "ns", extractor) == {"len": 9}
+    assert len(calls) == 2
+
+
+def test_version_change_is_a_miss(tmp_path):
+    plan = tmp_path / "Business_Plan.md"
+    write(plan, b"# Plan")
+    cache = PlanCache(disk_dir=str(tmp_path / "cache"))
+    assert cache.get(str(plan), "ns", lambda c: {"v": 1}, version="1") == {"v": 1}
+    assert cache.get(str(plan), "ns", lambda c: {"v": 2}, version="2") == {"v": 2}
+
+    # A fresh process with the old version still finds its disk entry
+    assert PlanCache(disk_dir=str(tmp_path / "cache")).get(str(plan), "ns", lambda c: {"v": 9}, "1") == {"v": 1}
+
+
+def test_invalid_utf8_is_extracted(tmp_path):
+    plan = tmp_path / "Business_Plan.md"
+    write(plan, b"caf\xe9")
+    assert PlanCache().get(str(plan), "ns", lambda content: {"content": content}) == {"content": "caf�"}
+
+
+def test_stat_index_is_bounded(tmp_path):
+    cache = PlanCache(max_paths=3)
+    for i in range(10):
+        plan = tmp_path / f"plan_{i}.md"
+        write(plan, f"# Plan {i}".encode())
+        cache.get(str(plan), "ns", lambda content: {})
+    assert len(cache._stat_index) == 3
+
+
+def test_concurrent_misses_share_one_extraction(tmp_path):
+    plan = tmp_path / "Business_Plan.md"
+    write(plan, b"# Plan")
+    cache = PlanCache()
+    calls = []
+
+    def slow_extractor(content):
+        calls.append(content)
+        time.sleep(0.1)
+        return {"ok": True}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(str(plan), "ns", slow_extractor)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"ok": True}] * 8
+    assert cache.stats()["misses"] == 1
+
+
+def test_returned_data_is_a_copy(tmp_path):
+    plan = tmp_path / "Business_Plan.md"
+    write(plan, b"# Plan")
+    cache = PlanCache()
+    cache.get(str(plan), "ns", lambda content: {"items": [1]})["items"].append(2)
+    assert cache.get(str(plan), "ns", lambda content: {})["items"] == [1]
@@ -0,0 +1,25 @@
+import pytest
+
+from report_templates import CompiledTemplate, escape_html
+
+
+def test_compiled_template_matches_str_format():
+    source = "# {title}\nScore: {score:.1f}/100 ({grade!r}) {{literal}}\n"
+    context = {"title": "Demo", "score": 87.25, "grade": "B"}
+    assert CompiledTemplate("t", source).render(context) == source.format(**context)
+
+
+def test_missing_field_names_the_template():
+    with pytest.raises(KeyError, match="Template t is missing field 'score'"):
+        CompiledTemplate("t", "{score}").render({})
+
+
+def test_unsupported_fields_are_rejected():
+    for source in ("{a.b}", "{a[0]}", "{a:{width}}"):
+        with pytest.raises(ValueError):
+            CompiledTemplate("t", source)
+
+
+def test_escape_html():
+    assert escape_html("plain text") == "plain text"
+    assert escape_html("<a href='x'>&</a>") == "&lt;a href=&#x27;x&#x27;&gt;&amp;&lt;/a&gt;"
@@ -0,0 +1,51 @@
+import json
+
+from result_models import AGAResult, dumps, loads
+
+RESULTS = {
+    "project_id": "p1",
+    "campaign_id": "c1",
+    "target_data": {"industry": "SaaS"},
+    "ad_copies": [{"platform": "google", "headline": "Ship faster"}],
+    "campaign_results": {"campaign_id": "c1", "start_time": "2026-01-01T00:00:00", "platforms": {},
+                         "failed_platforms": {}, "total_spent": 85.0, "total_signups": 29, "total_revenue": 120.5},
+    "budget_reallocation": {},
+    "monitoring_results": {"campaign_id": "c1", "monitoring_period": "3 days",
+                           "daily_metrics": [{"day": 1, "signups": 29, "revenue": 120.5, "traffic": 400}],
+                           "days_monitored": 1, "total_signups": 29, "total_revenue": 120.5,
+                           "validated_on_day": 1, "final_status": "traction_validated"},
+    "traction_validated": True,
+    "completion_time": "2026-01-01T00:00:01"
+}
+
+
+def test_results_round_trip_through_the_dataclass(tmp_path):
+    result = AGAResult.from_dict(RESULTS)
+    assert result.to_dict() == RESULTS
+    assert loads(result.dumps()) == RESULTS
+    assert json.loads(dumps(RESULTS, indent=True)) == RESULTS
+
+    path = tmp_path / "AGAResults.json"
+    path.write_bytes(result.dumps(indent=True))
+    loaded = AGAResult.load(str(path))
+    assert loaded.total_signups == 29
+    assert loaded.campaign_success == "Traction validated"
+
+
+def test_missing_results_read_as_failed():
+    assert AGAResult.empty().campaign_success == "Failed"
+    assert not AGAResult.empty().traction_validated
+
+
+def test_agent_builds_results_through_the_dataclass(tmp_path):
+    from campaign_store import SQLiteCampaignStore
+    from growth_agent import GrowthAgent
+
+    agent = GrowthAgent(store=SQLiteCampaignStore(str(tmp_path / "campaigns.db")), results_dir=str(tmp_path))
+    try:
+        results = agent.launch_campaign("p1", {})
+        assert AGAResult.from_dict(results).to_dict() == results
+        assert AGAResult.load(str(tmp_path / "AGAResults_p1.json")).to_dict() == results
+        assert agent.store.get_campaign(results["campaign_id"]) == results
+    finally:
+        agent.close()
@@ -0,0 +1,61 @@
+import json
+import os
+import shutil
+
+from score_calculator import expand_report_paths, run_batch, score_reports_incremental
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MOCK_REPORT = os.path.join(ROOT, 'data', 'mock_sast_report.json')
+
+
+def reports(tmp_path, count=2):
+    for i in range(count):
+        shutil.copy(MOCK_REPORT, tmp_path / f"r{i}.json")
+    return [str(tmp_path / f"r{i}.json") for i in range(count)]
+
+
+def test_malformed_report_fails_alone(tmp_path):
+    reports(tmp_path)
+    (tmp_path / "bad.json").write_text(json.dumps({"projectName": "bad", "hotspots": [1, 2]}))
+    out = tmp_path / "out"
+
+    run_batch([str(tmp_path)], str(out), workers=1)
+
+    summary = {r['project']: r for r in json.loads((out / "quality_summary.json").read_text())}
+    assert summary['bad']['error']
+    assert not summary['r0']['error'] and not summary['r1']['error']
+    assert os.path.exists(out / ".score_manifest.json")
+
+
+def test_directory_inputs_skip_batch_output(tmp_path):
+    paths = reports(tmp_path)
+    # Score into the input directory, then expand it again
+    run_batch([str(tmp_path)], str(tmp_path), workers=1)
+    assert expand_report_paths([str(tmp_path)]) == paths
+
+
+def test_unchanged_reports_are_skipped(tmp_path):
+    paths = reports(tmp_path)
+    out = str(tmp_path / "out")
+    score_reports_incremental(paths, out, workers=1)
+    _, stats = score_reports_incremental(paths, out, workers=1)
+    assert (stats['rescored'], stats['skipped']) == (0, 2)
+
+
+def test_history_records_rescored_reports_by_project_and_analysis_date(tmp_path):
+    from score_history import ScoreHistory
+
+    inputs = tmp_path / "in"
+    inputs.mkdir()
+    for i in range(2):
+        report = json.loads(open(MOCK_REPORT).read())
+        report.update(projectName=f"p{i}", analysisDate="2026-01-01T09:00:00Z")
+        (inputs / f"r{i}.json").write_text(json.dumps(report))
+    out, history_dir = str(tmp_path / "out"), str(tmp_path / "history")
+
+    run_batch([str(inputs)], out, workers=1, history_dir=history_dir)
+    run_batch([str(inputs)], out, workers=1, history_dir=history_dir)  # unchanged: nothing new to record
+
+    history = ScoreHistory(history_dir)
+    assert len(history) == 2
+    assert [(row['project'], row['date']) for row in history.query()] == [("p0", "2026-01-01"), ("p1", "2026-01-01")]
@@ -0,0 +1,104 @@
+import asyncio
+import json
+
+import pytest
+
+from campaign_store import SQLiteCampaignStore
+from growth_agent import GrowthAgent
+from job_queue import JobQueue
+from service import GrowthAgentService, HTTPError
+
+
+def service(tmp_path, day_interval=0.0):
+    agent = GrowthAgent(store=SQLiteCampaignStore(str(tmp_path / "campaigns.db")), results_dir=str(tmp_path))
+    return GrowthAgentService(agent=agent, queue=JobQueue(str(tmp_path / "jobs.db")), assets_root=str(tmp_path),
+                              day_interval=day_interval)
+
+
+async def exchange(svc, raw: bytes):
+    """Send one raw request to the service and return (status, payload)"""
+    server = await asyncio.start_server(svc.handle_connection, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(raw)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+def post(path: str, body: bytes) -> bytes:
+    return (f"POST {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n").encode() + body
+
+
+def test_plan_path_is_confined_to_assets_root(tmp_path):
+    svc = service(tmp_path)
+    assert svc.resolve_plan_path("plans/Business_Plan.md") == str(tmp_path / "plans" / "Business_Plan.md")
+    for path in ("/etc/passwd", "../outside.md", "plans/../../outside.md"):
+        with pytest.raises(HTTPError) as error:
+            svc.resolve_plan_path(path)
+        assert error.value.status == 400
+
+
+def test_webhook_rejects_plan_outside_assets_root(tmp_path):
+    svc = service(tmp_path)
+    status, payload = asyncio.run(exchange(svc, post("/webhook", b'{"project_id": "p1", "business_plan_path": "/etc/passwd"}')))
+    assert status == 400
+    assert svc.scheduler.queue.count("queued") == 0
+    svc.agent.close()
+
+
+def test_invalid_utf8_body_is_a_bad_request(tmp_path):
+    svc = service(tmp_path)
+    status, payload = asyncio.run(exchange(svc, post("/webhook", b'{"project_id": "\xff\xfe"}')))
+    assert status == 400
+    assert payload["message"] == "Invalid JSON body"
+    svc.agent.close()
+
+
+def test_oversized_header_line_is_rejected(tmp_path):
+    svc = service(tmp_path)
+    raw = b"GET /health HTTP/1.1\r\nX-Padding: " + b"a" * (70 * 1024) + b"\r\n\r\n"
+    status, payload = asyncio.run(exchange(svc, raw))
+    assert status == 431
+    svc.agent.close()
+
+
+def test_status_lookup_reads_the_store(tmp_path):
+    svc = service(tmp_path)
+    status, payload = asyncio.run(exchange(svc, b"GET /campaign/unknown/status HTTP/1.1\r\nConnection: close\r\n\r\n"))
+    assert status == 404
+    svc.agent.close()
+
+
+def test_posted_traction_feeds_monitoring(tmp_path):
+    svc = service(tmp_path)
+    svc.scheduler.poll_interval = 0.01
+    status, payload = svc.webhook({"project_id": "p1"})
+    campaign_id = payload["campaign_id"]
+    assert svc.scheduler.run_once()  # extract_targets registers the campaign with the aggregator
+
+    status, payload = svc.traction_webhook({"events": [{"project_id": "p1", "event_type": "signup", "value": 60}]})
+    assert payload["events"] == 1
+    svc.scheduler.run_until_idle(timeout=30)
+
+    results = svc.agent.store.get_campaign(campaign_id)
+    assert results["monitoring_results"]["daily_metrics"][0]["signups"] == 60
+    assert results["monitoring_results"]["validated_on_day"] == 1
+    # Finished campaigns stop accepting events
+    with pytest.raises(HTTPError) as error:
+        svc.traction_webhook({"campaign_id": campaign_id, "event_type": "signup"})
+    assert error.value.status == 404
+    svc.scheduler.queue.close()
+    svc.agent.close()
+
+
+def test_unknown_campaign_events_are_refused(tmp_path):
+    svc = service(tmp_path)
+    with pytest.raises(HTTPError) as error:
+        svc.traction_webhook({"campaign_id": "nope", "event_type": "signup"})
+    assert error.value.status == 404
+    assert svc.traction.stats()["active_campaigns"] == 0
+    svc.agent.close()
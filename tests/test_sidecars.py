@@ -0,0 +1,65 @@
+import os
+import shutil
+import subprocess
+import threading
+
+import pytest
+
+from fir_generator import FIRGenerator
+from sidecars import read_sidecar, write_sidecar
+
+HCL_CHECKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'hcl_checker.sh')
+
+HCL_REPORT = """# Human Contribution Log
+**Curator:** Ada Lovelace
+**Total Time Spent:** 3.5 hours
+
+1. Rewrote the pricing model
+2. Interviewed five customers
+3. Designed the onboarding flow
+4. Audited the AI-generated auth code
+5. Wrote the launch plan
+"""
+
+
+def test_concurrent_writers_do_not_share_a_temp_file(tmp_path):
+    report = str(tmp_path / "Code_Quality_Report.md")
+    errors = []
+
+    def write(n):
+        try:
+            for i in range(50):
+                write_sidecar(report, {'writer': n, 'i': i})
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert read_sidecar(report)['i'] == 49
+    assert os.listdir(tmp_path) == ["Code_Quality_Report.json"]
+
+
+def test_markdown_fallback_matches_sidecar_time_format(tmp_path):
+    (tmp_path / "HCL_Report.md").write_text(HCL_REPORT)
+    fir = FIRGenerator(asset_dir=str(tmp_path))
+    assert fir.load_hcl_report()["time_spent"] == "3.5"
+
+    write_sidecar(str(tmp_path / "HCL_Report.md"), {'curator': "Ada Lovelace", 'time_spent': "3.5", 'validated': True})
+    assert fir.load_hcl_report()["time_spent"] == "3.5"
+
+
+@pytest.mark.skipif(not (shutil.which("bash") and shutil.which("bc")), reason="hcl_checker.sh needs bash and bc")
+def test_hcl_checker_writes_sidecar_on_failure(tmp_path):
+    (tmp_path / "HCL_Report.md").write_text(HCL_REPORT.replace("3.5 hours", "1.0 hours"))
+    result = subprocess.run(["bash", HCL_CHECKER], cwd=tmp_path, capture_output=True, text=True)
+    assert result.returncode == 1
+
+    sidecar = read_sidecar(str(tmp_path / "HCL_Report.md"))
+    assert sidecar['validated'] is False
+    assert sidecar['time_spent'] == "1.0"
+    assert FIRGenerator(asset_dir=str(tmp_path)).load_hcl_report()["ip_status"] == "Pending"
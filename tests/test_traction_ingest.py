@@ -0,0 +1,54 @@
+from campaign_store import SQLiteCampaignStore
+from traction_ingest import SECONDS_PER_DAY, TractionAggregator
+
+START = 1_700_000_000.0
+
+
+def event(campaign_id, day, event_type="signup", value=1):
+    return {"campaign_id": campaign_id, "event_type": event_type, "value": value,
+            "timestamp": START + (day - 1) * SECONDS_PER_DAY}
+
+
+def test_day_numbering_survives_a_restart(tmp_path):
+    store = SQLiteCampaignStore(str(tmp_path / "campaigns.db"))
+    aggregator = TractionAggregator(store)
+    aggregator.register_campaign("c1", START)
+    aggregator.ingest([event("c1", 1)])
+    aggregator.flush()
+
+    # A new process sees day 3's event as day 3, not as the first day
+    restarted = TractionAggregator(store)
+    restarted.ingest([event("c1", 3, value=5)])
+    assert restarted.daily_metrics("c1", 1)["signups"] == 1
+    assert restarted.daily_metrics("c1", 3)["signups"] == 5
+    store.close()
+
+
+def test_unregistered_and_finished_campaigns_are_rejected(tmp_path):
+    store = SQLiteCampaignStore(str(tmp_path / "campaigns.db"))
+    aggregator = TractionAggregator(store)
+    aggregator.ingest([event("unknown", 1)])
+    assert aggregator.stats()["events_rejected"] == 1
+    assert aggregator.stats()["active_campaigns"] == 0
+
+    aggregator.register_campaign("c1", START)
+    aggregator.ingest([event("c1", 1)])
+    aggregator.finish_campaign("c1")
+    aggregator.ingest([event("c1", 2)])
+    stats = aggregator.stats()
+    assert (stats["events_ingested"], stats["events_rejected"], stats["active_campaigns"]) == (1, 2, 0)
+    # Finished campaigns remain readable
+    assert aggregator.daily_metrics("c1", 1)["signups"] == 1
+    store.close()
+
+
+def test_start_windows_are_bounded(tmp_path):
+    store = SQLiteCampaignStore(str(tmp_path / "campaigns.db"))
+    aggregator = TractionAggregator(store, max_campaigns=2)
+    for i in range(5):
+        aggregator.register_campaign(f"c{i}", START)
+    assert aggregator.stats()["active_campaigns"] == 2
+    # Evicted campaigns reload their start from the store
+    aggregator.ingest([event("c0", 2)])
+    assert aggregator.daily_metrics("c0", 2)["signups"] == 1
+    store.close()
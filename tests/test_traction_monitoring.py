@@ -0,0 +1,75 @@
+from campaign_store import JSONFileCampaignStore
+from growth_agent import GrowthAgent
+from result_models import AGAResult
+
+
+class FixedMetrics:
+    """Metrics source returning the same figures every day"""
+
+    def __init__(self, signups, revenue):
+        self.signups = signups
+        self.revenue = revenue
+
+    def register_campaign(self, campaign_id):
+        pass
+
+    def finish_campaign(self, campaign_id):
+        pass
+
+    def daily_metrics(self, campaign_id, day):
+        return {"day": day, "signups": self.signups, "revenue": self.revenue, "traffic": 100}
+
+
+def agent(tmp_path, metrics_source=None):
+    return GrowthAgent(store=JSONFileCampaignStore(str(tmp_path)), metrics_source=metrics_source)
+
+
+def test_thresholds_apply_to_running_totals(tmp_path):
+    # Mock days bring 10, 12, 14, 16 signups: 52 by day 4, though no single day reaches 50
+    results = agent(tmp_path).monitor_traction("c1")
+    assert results["final_status"] == "traction_validated"
+    assert results["validated_on_day"] == 4
+    assert results["total_signups"] == 52
+
+
+def test_early_stop_reports_the_monitored_period(tmp_path):
+    results = agent(tmp_path).monitor_traction("c1")
+    assert results["days_monitored"] == 4
+    assert results["monitoring_period"] == "4 days"
+    assert len(results["daily_metrics"]) == 4
+
+
+def test_full_window_without_early_stop(tmp_path):
+    results = agent(tmp_path).monitor_traction("c1", stop_early=False)
+    assert results["days_monitored"] == 7
+    assert results["monitoring_period"] == "7 days"
+    assert results["validated_on_day"] == 4
+    assert results["total_signups"] == sum(8 + day * 2 for day in range(1, 8))
+
+
+def test_revenue_threshold_alone_validates(tmp_path):
+    results = agent(tmp_path, FixedMetrics(signups=0, revenue=200.0)).monitor_traction("c1")
+    assert results["validated_on_day"] == 3
+    assert results["total_revenue"] == 600.0
+
+
+def test_traction_fails_below_both_thresholds(tmp_path):
+    results = agent(tmp_path, FixedMetrics(signups=1, revenue=10.0)).monitor_traction("c1", duration_days=5)
+    assert results["final_status"] == "traction_failed"
+    assert results["validated_on_day"] is None
+    assert results["monitoring_period"] == "5 days"
+
+
+def test_iter_traction_yields_running_totals(tmp_path):
+    updates = list(agent(tmp_path, FixedMetrics(signups=3, revenue=1.0)).iter_traction("c1", duration_days=3))
+    assert [u["total_signups"] for u in updates] == [3, 6, 9]
+    assert [u["total_traffic"] for u in updates] == [100, 200, 300]
+    assert not any(u["traction_validated"] for u in updates)
+
+
+def test_fir_states_the_traction_basis(tmp_path):
+    from fir_generator import FIRGenerator
+
+    growth = agent(tmp_path).launch_campaign("p1", {"business_plan_path": str(tmp_path / "missing.md")})
+    basis = FIRGenerator().traction_basis(AGAResult.from_dict(growth))
+    assert basis.startswith("Validated on day 4 against running totals")